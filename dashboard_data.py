@@ -0,0 +1,287 @@
+import io
+import os
+import threading
+import time
+from itertools import combinations
+
+import numpy as np
+import pandas as pd
+
+from saramin_storage import CATEGORY_COLUMNS, find_jobs_file, read_jobs_file
+
+try:
+    import pyarrow  # noqa: F401
+    ARROW_STRING_DTYPE = 'string[pyarrow]'
+except ImportError:
+    ARROW_STRING_DTYPE = None
+
+
+# 사이드바 필터 컬럼과 '전체' 선택값
+FILTER_COLUMNS = ['location', 'experience', 'employment_type']
+ALL = '전체'
+
+# 차트/통계에 쓰는 집계 대상 컬럼
+COUNT_COLUMNS = ['location', 'employment_type', 'experience', 'education', 'company', 'deadline_status']
+
+# 세션들이 공유하는 데이터셋에서 범주형으로 바꾸는 컬럼 (저장 형식의 범주형 컬럼 + 회사명)
+SHARED_CATEGORY_COLUMNS = CATEGORY_COLUMNS + ['company']
+
+
+def deadline_status(deadline):
+    """마감일 텍스트를 마감일 현황(마감일 없음/상시채용/채용시/마감일 있음)으로 분류"""
+    text = deadline.astype(object).fillna('').astype(str)
+    return pd.Series(np.select(
+        [text.eq(''), text.str.contains('상시채용', regex=False), text.str.contains('채용시', regex=False)],
+        ['마감일 없음', '상시채용', '채용시'],
+        default='마감일 있음'
+    ), index=deadline.index)
+
+def compact_frame(df):
+    """
+    프로세스 전체가 공유할 DataFrame 으로 변환
+
+    값 종류가 적은 컬럼은 category 로, 나머지 문자열 컬럼은 pyarrow 가 있으면 Arrow 문자열로 바꿔서
+    행마다 파이썬 문자열 객체를 두지 않는다. (Arrow 배열은 변경할 수 없음)
+    """
+    columns = {}
+    for column in df.columns:
+        dtype = df[column].dtype
+        if column in SHARED_CATEGORY_COLUMNS:
+            if not isinstance(dtype, pd.CategoricalDtype):
+                columns[column] = df[column].astype('category')
+        elif dtype == object and ARROW_STRING_DTYPE:
+            columns[column] = df[column].astype(ARROW_STRING_DTYPE)
+    return df.assign(**columns) if columns else df
+
+def process_memory_mb():
+    """현재 프로세스의 상주 메모리(RSS, MB) - 확인할 수 없으면 None"""
+    try:
+        with open('/proc/self/statm') as f:
+            resident_pages = int(f.read().split()[1])
+        return resident_pages * os.sysconf('SC_PAGE_SIZE') / (1024 * 1024)
+    except (OSError, ValueError, AttributeError):
+        pass
+    try:
+        import resource
+    except ImportError:
+        return None
+    # /proc 가 없는 환경(macOS 등)은 최대 사용량으로 대신함 (macOS 는 바이트, 그 밖은 KB 단위)
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if os.uname().sysname == 'Darwin' else peak / 1024
+
+
+class JobAggregates:
+    """
+    사이드바 필터의 모든 조합에 대한 집계를 데이터 로드 시 한 번 계산해 두는 집계 캐시
+
+    필터 컬럼 중 선택된 컬럼들(최대 2^3 가지 패턴)마다 group-by 개수를 미리 만들어 두고,
+    재실행 때는 선택값으로 인덱스를 조회만 한다. 조회 결과도 필터 조합별로 메모이즈한다.
+    """
+
+    def __init__(self, df):
+        df = df.assign(deadline_status=deadline_status(df['deadline']))
+        self._totals = {}
+        self._counts = {}
+        self._cache = {}
+
+        for size in range(len(FILTER_COLUMNS) + 1):
+            for pattern in combinations(FILTER_COLUMNS, size):
+                columns = list(pattern)
+                if columns:
+                    self._totals[pattern] = df.groupby(columns, observed=True, dropna=True).size()
+                else:
+                    self._totals[pattern] = len(df)
+                for column in COUNT_COLUMNS:
+                    # 필터로 이미 값이 고정되는 컬럼은 total 로 대신함
+                    if column not in pattern:
+                        self._counts[pattern, column] = df.groupby(columns + [column], observed=True,
+                                                                   dropna=True).size()
+
+    def lookup(self, location=ALL, experience=ALL, employment_type=ALL):
+        """
+        필터 선택값에 해당하는 집계 결과 반환
+
+        반환값: {'total': 공고 수, 컬럼명: 값별 개수 Series(내림차순), ...}
+        """
+        key = (location, experience, employment_type)
+        if key not in self._cache:
+            self._cache[key] = self._compute(key)
+        return self._cache[key]
+
+    def _compute(self, key):
+        pattern = tuple(column for column, value in zip(FILTER_COLUMNS, key) if value != ALL)
+        values = tuple(value for value in key if value != ALL)
+
+        total = self._select_total(pattern, values)
+        result = {'total': total}
+        for column in COUNT_COLUMNS:
+            if column in pattern:
+                selected = key[FILTER_COLUMNS.index(column)]
+                result[column] = pd.Series([total], index=[selected]) if total else pd.Series(dtype='int64')
+                continue
+            counts = self._counts[pattern, column]
+            if values:
+                try:
+                    counts = counts.xs(values, level=list(pattern))
+                except KeyError:
+                    counts = counts.iloc[:0].droplevel(list(pattern))
+            result[column] = counts.sort_values(ascending=False, kind='stable')
+        return result
+
+    def _select_total(self, pattern, values):
+        totals = self._totals[pattern]
+        if not values:
+            return totals
+        return int(totals.get(values if len(values) > 1 else values[0], 0))
+
+
+class FilterIndex:
+    """
+    필터 컬럼별 역색인 (값 -> 행 위치 배열)
+
+    데이터 로드 시 한 번 만들어 두고, 필터 선택값에 해당하는 위치 배열의 교집합으로
+    행을 고른다. 전체 DataFrame 을 복사하거나 컬럼 전체를 비교하지 않는다.
+    """
+
+    def __init__(self, df):
+        self.df = df
+        self._positions = {
+            column: {value: np.asarray(positions) for value, positions in
+                     df.groupby(column, observed=True, dropna=True).indices.items()}
+            for column in FILTER_COLUMNS
+        }
+
+    def options(self, column):
+        """필터 선택지 (정렬된 값 목록)"""
+        return sorted(self._positions[column])
+
+    def positions(self, location=ALL, experience=ALL, employment_type=ALL):
+        """필터에 해당하는 행 위치 배열 (필터가 없으면 None)"""
+        result = None
+        for column, value in zip(FILTER_COLUMNS, (location, experience, employment_type)):
+            if value == ALL:
+                continue
+            positions = self._positions[column].get(value, np.empty(0, dtype=np.intp))
+            result = positions if result is None else np.intersect1d(result, positions, assume_unique=True)
+        return result
+
+    def filter(self, location=ALL, experience=ALL, employment_type=ALL):
+        """필터에 해당하는 행만 반환 (필터가 없으면 원본 DataFrame 그대로)"""
+        positions = self.positions(location, experience, employment_type)
+        if positions is None:
+            return self.df
+        return self.df.iloc[positions]
+
+
+class DatasetLoader:
+    """
+    데이터 파일이 바뀔 때만 다시 읽는 로더 (프로세스당 하나를 세션들이 공유)
+
+    파일 경로/수정 시각/크기를 버전으로 삼아 바뀌지 않았으면 캐시된 DataFrame 을 그대로 쓰고,
+    CSV 끝에 행만 추가된 경우에는 추가된 부분만 읽어서 붙인다.
+    ttl(초)을 주면 파일이 그대로여도 그 시간이 지나면 전체를 다시 읽는다.
+    읽은 DataFrame 은 compact_frame 으로 줄여서 프로세스에 하나만 두고 모든 세션이 같은 객체를 읽는다.
+    (세션 쪽에서 수정하지 않아야 하며, 대시보드는 copy-on-write 모드로 실행해 실수로 수정해도 공유본은 그대로 둔다)
+    """
+
+    # 추가(append) 여부 확인에 쓰는 이전 파일 끝부분 크기
+    TAIL_BYTES = 4096
+
+    def __init__(self, base_path, ttl=None):
+        self.base_path = base_path
+        self.ttl = ttl
+        self.df = None
+        self.version = None
+        self.memory_bytes = 0
+        self._loaded_at = 0.0
+        self._tail = b''
+        self._lock = threading.Lock()
+
+    def load(self):
+        """(DataFrame, 버전) 반환 - 파일이 없으면 (None, None)"""
+        with self._lock:
+            path = find_jobs_file(self.base_path)
+            if path is None:
+                self.df, self.version = None, None
+                return None, None
+
+            stat = os.stat(path)
+            version = (path, stat.st_mtime_ns, stat.st_size)
+            expired = self.ttl is not None and time.monotonic() - self._loaded_at > self.ttl
+            if version == self.version and not expired:
+                return self.df, self.version
+
+            if not expired and self._is_append(path, stat.st_size):
+                df = self._read_appended(path, self.version[2])
+            else:
+                df = read_jobs_file(path)
+                self._loaded_at = time.monotonic()
+
+            self.df = compact_frame(df)
+            self.memory_bytes = int(self.df.memory_usage(index=True, deep=True).sum())
+            self.version = version
+            self._tail = self._read_tail(path, stat.st_size)
+            return self.df, self.version
+
+    def _is_append(self, path, size):
+        """같은 CSV 파일 끝에 행만 추가되었는지 확인"""
+        if self.df is None or self.version is None or not path.endswith('.csv'):
+            return False
+        previous_path, _, previous_size = self.version
+        if path != previous_path or size <= previous_size or not self._tail.endswith(b'\n'):
+            return False
+        return self._read_tail(path, previous_size) == self._tail
+
+    def _read_tail(self, path, size):
+        with open(path, 'rb') as f:
+            f.seek(max(0, size - self.TAIL_BYTES))
+            return f.read(min(size, self.TAIL_BYTES))
+
+    def _read_appended(self, path, offset):
+        with open(path, 'rb') as f:
+            f.seek(offset)
+            appended = f.read().decode('utf-8')
+        new_rows = pd.read_csv(io.StringIO(appended), header=None, names=list(self.df.columns))
+        # 범주/Arrow 컬럼은 새 행과 합치면서 object 로 바뀔 수 있으므로 load 에서 다시 compact_frame 적용
+        return pd.concat([self.df, new_rows], ignore_index=True)
+
+
+class TableView:
+    """
+    상세 테이블의 서버 측 정렬/페이지 처리
+
+    컬럼별 정렬 순위를 데이터 로드 시 한 번 계산해 두고, 필터/검색으로 고른 행 위치만
+    순위로 정렬한 뒤 현재 페이지에 해당하는 행만 꺼낸다.
+    """
+
+    def __init__(self, df):
+        self.df = df
+        self._ranks = {}
+
+    def _rank(self, column):
+        if column not in self._ranks:
+            # 같은 값은 같은 순위로 두고, 결측값은 항상 뒤로 보냄 (len + 1)
+            ranks = self.df[column].rank(method='min', na_option='keep')
+            self._ranks[column] = ranks.fillna(len(self.df) + 1).to_numpy()
+        return self._ranks[column]
+
+    def sorted_positions(self, positions=None, sort_column=None, ascending=True):
+        """
+        행 위치 배열을 sort_column 기준으로 정렬 (positions 가 None 이면 전체 행)
+
+        내림차순이어도 결측값은 맨 뒤에 두고, 같은 값끼리는 원래 순서를 유지한다.
+        """
+        if positions is None:
+            positions = np.arange(len(self.df))
+        if not sort_column:
+            return positions
+        ranks = self._rank(sort_column)[positions]
+        if not ascending:
+            ranks = np.where(ranks > len(self.df), ranks, -ranks)
+        return positions[np.argsort(ranks, kind='stable')]
+
+    def page(self, positions, page_number, page_size, columns=None):
+        """정렬된 행 위치에서 page_number(1부터) 페이지의 행만 DataFrame 으로 반환"""
+        start = (page_number - 1) * page_size
+        rows = self.df.iloc[positions[start:start + page_size]]
+        return rows[columns] if columns else rows
@@ -0,0 +1,124 @@
+import re
+from collections import defaultdict
+
+import numpy as np
+import pandas as pd
+
+
+# 대시보드 기본 분석 키워드
+DEFAULT_KEYWORDS = ['AI', '인공지능', 'RPA', '자동화', '개발자', '시스템', '솔루션', '기술', '데이터', '프로그래밍']
+
+# 자동 추출 상위 단어에서 제외할 단어
+DEFAULT_STOPWORDS = {'채용', '모집', '신입', '경력', '정규직', '계약직', '및', '담당', '담당자', '채용합니다', '모십니다'}
+
+# 단어 토큰 (영문/숫자 덩어리 또는 한글 덩어리)
+TOKEN_PATTERN = re.compile(r'[A-Z0-9+#]+|[가-힣]+')
+
+EMPTY_POSITIONS = np.empty(0, dtype=np.intp)
+
+
+class TextSearchIndex:
+    """
+    부분 문자열 검색용 글자 n-gram 색인 (대소문자 무시)
+
+    검색어의 n-gram 을 모두 가진 행만 후보로 좁힌 뒤 후보 텍스트만 직접 확인한다.
+    """
+
+    def __init__(self, texts, ngram=2):
+        self.ngram = ngram
+        self.texts = [str(text).upper() if pd.notna(text) else '' for text in texts]
+
+        postings = defaultdict(list)
+        for position, text in enumerate(self.texts):
+            for gram in {text[i:i + ngram] for i in range(len(text) - ngram + 1)}:
+                postings[gram].append(position)
+        self._ngram_postings = {gram: np.asarray(positions, dtype=np.intp) for gram, positions in postings.items()}
+
+    def _candidates(self, needle, positions):
+        """검색어를 포함할 수 있는 행 위치 (n-gram 색인 교집합)"""
+        candidates = positions
+        if len(needle) >= self.ngram:
+            for gram in {needle[i:i + self.ngram] for i in range(len(needle) - self.ngram + 1)}:
+                gram_positions = self._ngram_postings.get(gram, EMPTY_POSITIONS)
+                candidates = gram_positions if candidates is None else np.intersect1d(
+                    candidates, gram_positions, assume_unique=True)
+                if not len(candidates):
+                    break
+        if candidates is None:
+            candidates = np.arange(len(self.texts))
+        return candidates
+
+    def search(self, query, positions=None):
+        """검색어를 포함하는 행 위치 배열 (positions 가 주어지면 그 안에서만 검색)"""
+        needle = query.strip().upper()
+        if not needle:
+            return positions
+        candidates = self._candidates(needle, positions)
+        return np.asarray([position for position in candidates if needle in self.texts[position]], dtype=np.intp)
+
+
+class TitleKeywordIndex(TextSearchIndex):
+    """
+    채용공고 제목 키워드 색인 (데이터 로드 시 한 번 생성)
+
+    제목을 대문자로 바꿔 글자 n-gram -> 공고 위치 색인과 단어 토큰 목록을 만든다.
+    키워드는 n-gram 색인으로 후보 공고를 좁힌 뒤 후보 제목만 확인하고,
+    필터가 있으면 필터 행 위치와의 교집합 안에서만 센다.
+    """
+
+    def __init__(self, titles, ngram=2, stopwords=DEFAULT_STOPWORDS):
+        super().__init__(titles, ngram)
+
+        term_ids = {}
+        token_postings, token_terms = [], []
+        for position, title in enumerate(self.texts):
+            for token in TOKEN_PATTERN.findall(title):
+                if len(token) < 2 or token in stopwords:
+                    continue
+                token_postings.append(position)
+                token_terms.append(term_ids.setdefault(token, len(term_ids)))
+
+        self._terms = np.array(list(term_ids), dtype=object)
+        self._token_postings = np.asarray(token_postings, dtype=np.intp)
+        self._token_terms = np.asarray(token_terms, dtype=np.intp)
+
+    def keyword_stats(self, keywords, positions=None):
+        """
+        키워드별 포함 공고 수(postings)와 전체 등장 횟수(frequency)
+
+        positions 는 필터에 해당하는 행 위치 배열 (None 이면 전체)
+        """
+        rows = []
+        for keyword in keywords:
+            needle = keyword.strip().upper()
+            if not needle:
+                continue
+            counts = [self.texts[position].count(needle) for position in self._candidates(needle, positions)]
+            rows.append({
+                'keyword': keyword.strip(),
+                'postings': sum(1 for count in counts if count),
+                'frequency': sum(counts),
+            })
+        return pd.DataFrame(rows, columns=['keyword', 'postings', 'frequency'])
+
+    def top_terms(self, n=10, positions=None):
+        """제목에 자주 나오는 단어 상위 n개 (포함 공고 수 기준)"""
+        token_postings, token_terms = self._token_postings, self._token_terms
+        if positions is not None:
+            selected = np.zeros(len(self.texts), dtype=bool)
+            selected[positions] = True
+            mask = selected[token_postings]
+            token_postings, token_terms = token_postings[mask], token_terms[mask]
+
+        frequency = np.bincount(token_terms, minlength=len(self._terms))
+        # 같은 제목에 여러 번 나온 단어는 공고 수에서 한 번만 셈
+        pair_keys = np.unique(token_postings * len(self._terms) + token_terms)
+        postings = np.bincount(pair_keys % max(len(self._terms), 1), minlength=len(self._terms))
+
+        top = np.argsort(-postings, kind='stable')[:n]
+        top = top[postings[top] > 0]
+        return pd.DataFrame({
+            'term': self._terms[top],
+            'postings': postings[top],
+            'frequency': frequency[top],
+        })
@@ -0,0 +1,477 @@
+import os
+import sys
+import json
+import time
+import hashlib
+import argparse
+import cProfile
+import pstats
+import tempfile
+import threading
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime
+from functools import partial
+from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs
+
+import pandas as pd
+
+from saramin_scraper_final import (
+    HTML_PARSERS, SelectolaxHTMLParser, parse_html, find_job_containers, extract_jobs_from_containers,
+    fetch_page_html, normalize_jobs_df, build_search_url,
+)
+from saramin_storage import save_jobs_file
+
+
+# 녹화된 사람인 검색 결과 페이지 모음과 페이지별 기대값 파일
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'saramin')
+MANIFEST_FILE = 'manifest.json'
+
+# 로컬 대체 서버에서 검색 페이지(recruitPage)로 응답하는 경로
+SEARCH_PATH = urlparse(build_search_url('')).path
+
+# 함수별 시간에 포함할 모듈 (이 저장소의 파일만)
+PROFILE_MODULE_DIR = os.path.dirname(os.path.abspath(__file__))
+PROFILE_TOP_FUNCTIONS = 15
+
+# 저장 단계에서 측정할 파일 형식
+SAVE_FORMATS = ['csv', 'parquet', 'feather']
+
+# 이전 결과 대비 이 비율 이상 느려지거나 메모리가 늘면 회귀로 본다
+DEFAULT_REGRESSION_THRESHOLD = 0.1
+
+
+def load_manifest(fixture_dir=FIXTURE_DIR):
+    """fixture 목록과 기대값 (manifest.json) 읽기"""
+    with open(os.path.join(fixture_dir, MANIFEST_FILE), encoding='utf-8') as f:
+        return json.load(f)
+
+def save_manifest(manifest, fixture_dir=FIXTURE_DIR):
+    with open(os.path.join(fixture_dir, MANIFEST_FILE), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+        f.write('\n')
+
+def load_corpus(fixture_dir=FIXTURE_DIR):
+    """[(fixture 정보, HTML 문자열), ...] 반환"""
+    corpus = []
+    for page in load_manifest(fixture_dir)['pages']:
+        with open(os.path.join(fixture_dir, page['file']), encoding='utf-8') as f:
+            corpus.append((page, f.read()))
+    return corpus
+
+def available_parsers():
+    """현재 환경에서 사용할 수 있는 HTML 파서 목록"""
+    parsers = []
+    for html_parser in HTML_PARSERS:
+        if html_parser == 'selectolax' and SelectolaxHTMLParser is None:
+            continue
+        try:
+            parse_html('<html></html>', html_parser)
+        except Exception:
+            continue
+        parsers.append(html_parser)
+    return parsers
+
+def extract_page_jobs(html, html_parser='html.parser'):
+    """HTML 한 페이지에서 채용공고 추출 (HTTP 엔진과 같은 파싱 경로, 대체 셀렉터 포함)"""
+    root = parse_html(html, html_parser)
+    return extract_jobs_from_containers(find_job_containers(root))
+
+def jobs_digest(jobs):
+    """추출 결과 비교용 해시"""
+    return hashlib.sha1(json.dumps(jobs, ensure_ascii=False, sort_keys=True).encode('utf-8')).hexdigest()
+
+def page_expectation(html):
+    """현재 추출기 기준 페이지 기대값 (공고 수, 첫 제목, 추출 결과 해시)"""
+    jobs = extract_page_jobs(html)
+    return {
+        'cards': len(jobs),
+        'first_title': jobs[0]['title'] if jobs else '',
+        'digest': jobs_digest(jobs),
+    }
+
+def update_manifest(fixture_dir=FIXTURE_DIR):
+    """fixture 파일을 현재 추출기로 다시 파싱해서 기대값 갱신 (추출 로직을 의도적으로 바꾼 뒤 실행)"""
+    manifest = load_manifest(fixture_dir)
+    for page in manifest['pages']:
+        with open(os.path.join(fixture_dir, page['file']), encoding='utf-8') as f:
+            page['expected'] = page_expectation(f.read())
+    save_manifest(manifest, fixture_dir)
+    return manifest
+
+def record_fixture(url, filename, search_page=None, description='', fixture_dir=FIXTURE_DIR):
+    """
+    실제 페이지를 내려받아 fixture 로 저장하고 manifest 에 등록
+
+    search_page 를 주면 로컬 대체 서버에서 해당 recruitPage 요청에 이 페이지를 응답한다.
+    """
+    html = fetch_page_html(url)
+    with open(os.path.join(fixture_dir, filename), 'w', encoding='utf-8') as f:
+        f.write(html)
+
+    manifest = load_manifest(fixture_dir)
+    pages = [page for page in manifest['pages'] if page['file'] != filename]
+    pages.append({
+        'file': filename,
+        'search_page': search_page,
+        'description': description or url,
+        'recorded_at': datetime.now().isoformat(timespec='seconds'),
+        'expected': page_expectation(html),
+    })
+    manifest['pages'] = pages
+    save_manifest(manifest, fixture_dir)
+    print(f"{url} 페이지를 {filename}에 저장했습니다. (공고 {pages[-1]['expected']['cards']}개)")
+    return pages[-1]
+
+
+class FixtureRequestHandler(SimpleHTTPRequestHandler):
+    """
+    사람인 대신 fixture 를 응답하는 요청 핸들러
+
+    검색 경로는 recruitPage 값에 맞는 검색 페이지를, 없는 페이지는 검색 결과 없음 페이지를
+    응답하고, manifest 의 routes 에 있는 경로(상세 페이지 등)는 지정된 파일을,
+    그 밖의 경로는 fixture 디렉터리의 파일을 그대로 응답한다.
+    """
+
+    def __init__(self, *args, search_pages=None, empty_page=None, routes=None, **kwargs):
+        self.search_pages = search_pages or {}
+        self.empty_page = empty_page
+        self.routes = routes or {}
+        super().__init__(*args, **kwargs)
+
+    def translate_path(self, path):
+        parsed = urlparse(path)
+        if parsed.path == SEARCH_PATH:
+            page = parse_qs(parsed.query).get('recruitPage', ['1'])[0]
+            filename = self.search_pages.get(page, self.empty_page)
+            if filename:
+                return os.path.join(self.directory, filename)
+        if parsed.path in self.routes:
+            return os.path.join(self.directory, self.routes[parsed.path])
+        return super().translate_path(path)
+
+    def guess_type(self, path):
+        # fixture 는 모두 UTF-8 로 저장되어 있으므로 charset 을 명시 (없으면 requests 가 ISO-8859-1 로 디코딩)
+        content_type = super().guess_type(path)
+        if content_type.startswith('text/') or content_type == 'application/json':
+            content_type += '; charset=utf-8'
+        return content_type
+
+    def log_message(self, format, *args):
+        pass
+
+
+@contextmanager
+def serve_fixtures(fixture_dir=FIXTURE_DIR, host='127.0.0.1', port=0):
+    """fixture 를 응답하는 로컬 HTTP 서버를 띄우고 base_url 반환 (port=0 이면 빈 포트 사용)"""
+    manifest = load_manifest(fixture_dir)
+    search_pages = {str(page['search_page']): page['file'] for page in manifest['pages'] if page.get('search_page')}
+    handler = partial(FixtureRequestHandler, directory=fixture_dir, search_pages=search_pages,
+                      empty_page=manifest.get('empty_page'), routes=manifest.get('routes'))
+
+    server = ThreadingHTTPServer((host, port), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://{host}:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+        thread.join()
+
+
+def _profile_functions(profile):
+    """cProfile 결과에서 이 저장소 모듈의 함수별 호출 수/시간 (누적 시간 순)"""
+    functions = []
+    for (filename, lineno, name), (_, calls, total, cumulative, _) in pstats.Stats(profile).stats.items():
+        if not filename.startswith(PROFILE_MODULE_DIR) or os.path.basename(filename) == os.path.basename(__file__):
+            continue
+        functions.append({
+            'function': f"{os.path.basename(filename)}:{name}",
+            'calls': calls,
+            'total_seconds': round(total, 6),
+            'cumulative_seconds': round(cumulative, 6),
+        })
+    functions.sort(key=lambda item: item['cumulative_seconds'], reverse=True)
+    return functions[:PROFILE_TOP_FUNCTIONS]
+
+def measure_stage(func, pages, repeat=3):
+    """
+    단계 함수를 실행해서 처리량/함수별 시간/최대 메모리 측정
+
+    func 는 처리한 공고 수를 반환해야 한다. 시간은 프로파일러 없이 repeat 번 실행한 중 가장 빠른 값을,
+    함수별 시간과 최대 메모리는 별도로 한 번 더 실행해서 잰다.
+    """
+    best = None
+    cards = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        cards = func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+
+    profile = cProfile.Profile()
+    tracemalloc.start()
+    try:
+        profile.runcall(func)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        'pages': pages,
+        'cards': cards,
+        'seconds': round(best, 6),
+        'pages_per_sec': round(pages / best, 2) if best else None,
+        'cards_per_sec': round(cards / best, 2) if best else None,
+        'peak_memory_kb': round(peak / 1024, 1),
+        'functions': _profile_functions(profile),
+    }
+
+
+def bench_fetch(corpus, base_url, repeat=3):
+    """로컬 대체 서버에서 검색 페이지 다운로드 (커넥션 풀 세션 사용)"""
+    import requests
+
+    urls = [(build_search_url('rpa', page['search_page'], base_url=base_url), page['expected']['cards'])
+            for page, _ in corpus if page.get('search_page')]
+    session = requests.Session()
+
+    def run():
+        for url, _ in urls:
+            fetch_page_html(url, session=session)
+        return sum(cards for _, cards in urls)
+
+    try:
+        return measure_stage(run, len(urls), repeat)
+    finally:
+        session.close()
+
+def bench_parse(corpus, html_parser, repeat=3):
+    """파서 백엔드별 파싱 + 컨테이너 탐색 + 채용 정보 추출"""
+    def run():
+        return sum(len(extract_page_jobs(html, html_parser)) for _, html in corpus)
+
+    return measure_stage(run, len(corpus), repeat)
+
+def bench_normalize(jobs_df, pages, repeat=3):
+    """추출 결과 DataFrame 정리 (normalize_jobs_df)"""
+    def run():
+        return len(normalize_jobs_df(jobs_df))
+
+    return measure_stage(run, pages, repeat)
+
+def bench_save(df, file_format, pages, repeat=3):
+    """정리된 DataFrame 을 임시 디렉터리에 저장"""
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, f'jobs.{file_format}')
+
+        def run():
+            save_jobs_file(df, path)
+            return len(df)
+
+        result = measure_stage(run, pages, repeat)
+        result['file_bytes'] = os.path.getsize(path)
+    return result
+
+def bench_selenium(corpus, base_url):
+    """(선택) Chrome 으로 로컬 대체 서버 페이지를 열어 Selenium 추출 경로 측정"""
+    from saramin_scraper_final import WebDriverPool, scrape_jobs_with_driver
+
+    urls = [build_search_url('rpa', page['search_page'], base_url=base_url)
+            for page, _ in corpus if page.get('search_page')]
+    with WebDriverPool(size=1) as driver_pool, driver_pool.driver() as driver:
+        def run():
+            return sum(len(scrape_jobs_with_driver(driver, url, max_jobs=None)) for url in urls)
+
+        return measure_stage(run, len(urls), repeat=1)
+
+
+def check_selectors(corpus, parsers):
+    """fixture 별 추출 결과가 manifest 기대값과 같은지 파서마다 확인하고 실패 목록 반환"""
+    failures = []
+    for page, html in corpus:
+        expected = page['expected']
+        for html_parser in parsers:
+            jobs = extract_page_jobs(html, html_parser)
+            actual = {
+                'cards': len(jobs),
+                'first_title': jobs[0]['title'] if jobs else '',
+                'digest': jobs_digest(jobs),
+            }
+            for key, value in expected.items():
+                if actual.get(key) != value:
+                    failures.append({'file': page['file'], 'parser': html_parser, 'field': key,
+                                     'expected': value, 'actual': actual.get(key)})
+    return failures
+
+def run_benchmark(fixture_dir=FIXTURE_DIR, parsers=None, scale=50, repeat=3, selenium=False):
+    """
+    fetch/parse/normalize/save 단계별 벤치마크 실행 결과 반환
+
+    normalize/save 단계는 corpus 에서 추출한 공고를 scale 배로 늘려서 측정한다.
+    """
+    corpus = load_corpus(fixture_dir)
+    parsers = parsers or available_parsers()
+    stages = {}
+
+    with serve_fixtures(fixture_dir) as base_url:
+        stages['fetch'] = bench_fetch(corpus, base_url, repeat)
+        if selenium:
+            try:
+                stages['selenium'] = bench_selenium(corpus, base_url)
+            except Exception as e:
+                print(f"Selenium 단계 측정 실패: {e}")
+
+    for html_parser in parsers:
+        stages[f'parse[{html_parser}]'] = bench_parse(corpus, html_parser, repeat)
+
+    jobs = [job for _, html in corpus for job in extract_page_jobs(html)]
+    jobs_df = pd.DataFrame(jobs * scale)
+    pages = len(corpus) * scale
+    stages['normalize'] = bench_normalize(jobs_df, pages, repeat)
+
+    normalized = normalize_jobs_df(jobs_df)
+    for file_format in SAVE_FORMATS:
+        try:
+            stages[f'save[{file_format}]'] = bench_save(normalized, file_format, pages, repeat)
+        except ImportError as e:
+            print(f"{file_format} 저장 단계 건너뜀 (pyarrow 필요): {e}")
+
+    return {
+        'created_at': datetime.now().isoformat(timespec='seconds'),
+        'python': sys.version.split()[0],
+        'pandas': pd.__version__,
+        'fixtures': [page['file'] for page, _ in corpus],
+        'parsers': parsers,
+        'scale': scale,
+        'repeat': repeat,
+        'selector_failures': check_selectors(corpus, parsers),
+        'stages': stages,
+    }
+
+def compare_results(current, previous, threshold=DEFAULT_REGRESSION_THRESHOLD):
+    """
+    이전 결과와 단계별 처리량/최대 메모리 비교
+
+    반환값: [{'stage', 'metric', 'previous', 'current', 'change', 'regression'}, ...]
+    """
+    rows = []
+    for stage, result in current['stages'].items():
+        before = previous.get('stages', {}).get(stage)
+        if not before:
+            continue
+        for metric, higher_is_better in [('cards_per_sec', True), ('pages_per_sec', True), ('peak_memory_kb', False)]:
+            old, new = before.get(metric), result.get(metric)
+            if not old or new is None:
+                continue
+            change = (new - old) / old
+            regression = -change > threshold if higher_is_better else change > threshold
+            rows.append({'stage': stage, 'metric': metric, 'previous': old, 'current': new,
+                         'change': round(change, 4), 'regression': regression})
+    return rows
+
+
+def print_report(result, comparison=None):
+    """벤치마크 결과 요약 출력"""
+    print(f"\n{'단계':<20}{'pages/s':>12}{'cards/s':>12}{'peak KB':>12}")
+    for stage, stats in result['stages'].items():
+        print(f"{stage:<20}{stats['pages_per_sec'] or 0:>12.1f}{stats['cards_per_sec'] or 0:>12.1f}"
+              f"{stats['peak_memory_kb']:>12.1f}")
+        for function in stats['functions'][:3]:
+            print(f"    {function['function']:<50}{function['cumulative_seconds']:>10.4f}s "
+                  f"({function['calls']}회)")
+
+    if result['selector_failures']:
+        print(f"\n셀렉터 확인 실패 {len(result['selector_failures'])}건:")
+        for failure in result['selector_failures']:
+            print(f"  {failure['file']} [{failure['parser']}] {failure['field']}: "
+                  f"기대 {failure['expected']!r}, 실제 {failure['actual']!r}")
+    else:
+        print("\n셀렉터 확인: 모든 fixture 가 기대값과 일치합니다.")
+
+    if comparison:
+        print("\n이전 결과 대비:")
+        for row in comparison:
+            mark = ' <- 회귀' if row['regression'] else ''
+            print(f"  {row['stage']:<20}{row['metric']:<16}{row['previous']:>12}{row['current']:>12}"
+                  f"{row['change']:>+10.1%}{mark}")
+
+def parse_args(argv=None):
+    """명령행 인자 파싱"""
+    parser = argparse.ArgumentParser(description='사람인 크롤러 오프라인 벤치마크')
+    parser.add_argument('--fixtures', default=FIXTURE_DIR, help='fixture 디렉터리')
+    subparsers = parser.add_subparsers(dest='command')
+
+    run_parser = subparsers.add_parser('run', help='단계별 벤치마크 실행 (기본)')
+    run_parser.add_argument('--parsers', nargs='+', choices=HTML_PARSERS, help='측정할 HTML 파서 (기본: 설치된 전체)')
+    run_parser.add_argument('--scale', type=int, default=50, help='normalize/save 단계에서 공고를 늘릴 배수')
+    run_parser.add_argument('--repeat', type=int, default=3, help='단계별 반복 횟수 (가장 빠른 값 사용)')
+    run_parser.add_argument('--selenium', action='store_true', help='Chrome 으로 Selenium 경로도 측정')
+    run_parser.add_argument('--output', help='결과를 저장할 JSON 파일')
+    run_parser.add_argument('--compare', help='비교할 이전 결과 JSON 파일')
+    run_parser.add_argument('--threshold', type=float, default=DEFAULT_REGRESSION_THRESHOLD,
+                            help='회귀로 판단할 변화 비율')
+
+    serve_parser = subparsers.add_parser('serve', help='fixture 를 응답하는 로컬 대체 서버 실행')
+    serve_parser.add_argument('--port', type=int, default=8000)
+
+    record_parser = subparsers.add_parser('record', help='실제 페이지를 fixture 로 저장')
+    record_parser.add_argument('url')
+    record_parser.add_argument('filename')
+    record_parser.add_argument('--search-page', type=int, help='로컬 서버에서 응답할 recruitPage 번호')
+    record_parser.add_argument('--description', default='')
+
+    subparsers.add_parser('update-manifest', help='현재 추출기 기준으로 fixture 기대값 갱신')
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    if args.command == 'serve':
+        with serve_fixtures(args.fixtures, port=args.port) as base_url:
+            print(f"로컬 대체 서버 실행 중: {base_url} (Ctrl+C 로 종료)")
+            print(f"예) python saramin_scraper_final.py --engine http --keywords rpa --pages 1-2 --base-url {base_url}")
+            try:
+                while True:
+                    time.sleep(1)
+            except KeyboardInterrupt:
+                pass
+        return 0
+
+    if args.command == 'record':
+        record_fixture(args.url, args.filename, args.search_page, args.description, args.fixtures)
+        return 0
+
+    if args.command == 'update-manifest':
+        manifest = update_manifest(args.fixtures)
+        print(f"fixture {len(manifest['pages'])}개의 기대값을 갱신했습니다.")
+        return 0
+
+    if args.command is None:
+        args = parse_args(['--fixtures', args.fixtures, 'run'])
+
+    result = run_benchmark(args.fixtures, args.parsers, args.scale, args.repeat, args.selenium)
+
+    comparison = None
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            previous = json.load(f)
+        if previous.get('scale') != result['scale']:
+            print(f"주의: 이전 결과와 scale 이 다릅니다 ({previous.get('scale')} -> {result['scale']})")
+        comparison = compare_results(result, previous, args.threshold)
+        result['comparison'] = comparison
+
+    print_report(result, comparison)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+        print(f"\n결과가 {args.output}에 저장되었습니다.")
+
+    regressions = [row for row in comparison or [] if row['regression']]
+    return 1 if result['selector_failures'] or regressions else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,195 @@
+import re
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urljoin, urlparse
+
+from saramin_scraper_final import (
+    DEFAULT_HTML_PARSER, clean_salary_data, get_http_session, governed_fetch_page, parse_html,
+)
+from saramin_governor import RequestGovernor
+from saramin_job_store import DETAIL_COLUMNS, extract_rec_idx, job_content_hash
+from saramin_metrics import metrics
+
+
+# 상세 페이지 경로 (rec_idx 만 남겨서 요청하므로 검색 파라미터가 달라도 캐시가 재사용됨)
+DETAIL_PATH = '/zf_user/jobs/relay/view'
+
+# 상세 요강 텍스트 최대 길이
+MAX_DESCRIPTION_LENGTH = 2000
+
+# 상세 페이지 요약 영역 (dt/dd 쌍)과 상세 요강 영역 셀렉터
+SUMMARY_SELECTORS = ['.jv_summary dl', '.jv_cont dl', '.cont dl']
+PERIOD_SELECTORS = ['.info_period dl', '.info_period']
+DESCRIPTION_SELECTORS = ['.user_content', '.jv_detail .cont', '.jv_detail']
+DESCRIPTION_IFRAME_SELECTOR = 'iframe#iframe_content_0, iframe[src*="view-detail"]'
+
+# 마감 일시 (예: 2025.08.14 23:59, 2025-08-14)
+DEADLINE_AT_PATTERN = re.compile(r'(\d{4})[.\-/]\s*(\d{1,2})[.\-/]\s*(\d{1,2})(?:\D{0,5}(\d{1,2}):(\d{2}))?')
+WHITESPACE_PATTERN = re.compile(r'\s+')
+
+
+def detail_url(link, base_url=None):
+    """채용공고 링크를 rec_idx 만 남긴 상세 페이지 URL 로 변환 (base_url 로 호스트 교체 가능)"""
+    rec_idx = extract_rec_idx(link)
+    if not rec_idx:
+        return link
+    parsed = urlparse(base_url or link)
+    return f"{parsed.scheme}://{parsed.netloc}{DETAIL_PATH}?rec_idx={rec_idx}"
+
+def parse_deadline_at(text):
+    """마감 일시 텍스트를 'YYYY-MM-DD' 또는 'YYYY-MM-DD HH:MM' 으로 변환 (없으면 빈 문자열)"""
+    match = DEADLINE_AT_PATTERN.search(text or '')
+    if not match:
+        return ''
+    year, month, day, hour, minute = match.groups()
+    result = f"{int(year):04d}-{int(month):02d}-{int(day):02d}"
+    if hour is not None:
+        result += f" {int(hour):02d}:{minute}"
+    return result
+
+def _definition_pairs(root, selectors):
+    """dl 영역의 dt/dd 를 {dt 텍스트: dd 텍스트} 로 반환"""
+    pairs = {}
+    for selector in selectors:
+        for definition_list in root.select(selector):
+            terms = definition_list.select('dt')
+            values = definition_list.select('dd')
+            for term, value in zip(terms, values):
+                pairs.setdefault(term.get_text(strip=True), value.get_text(' ', strip=True))
+        if pairs:
+            break
+    return pairs
+
+def parse_detail_html(html, html_parser=DEFAULT_HTML_PARSER):
+    """
+    상세 페이지 HTML 에서 급여/마감 일시/상세 요강 추출
+
+    반환값: {'salary', 'deadline_at', 'description', 'description_url'}
+    description_url 은 상세 요강이 iframe 으로 분리되어 있을 때 그 주소이다.
+    """
+    root = parse_html(html, html_parser)
+    summary = _definition_pairs(root, SUMMARY_SELECTORS)
+    period = _definition_pairs(root, PERIOD_SELECTORS)
+
+    salary = ''
+    for term, value in summary.items():
+        if '급여' in term or '연봉' in term:
+            salary = clean_salary_data(value)
+            break
+
+    deadline_at = ''
+    for term, value in period.items():
+        if '마감' in term:
+            deadline_at = parse_deadline_at(value)
+            break
+
+    # 상세 요강이 iframe 으로 분리되어 있으면 본문은 따로 받아야 함
+    iframe = root.select_one(DESCRIPTION_IFRAME_SELECTOR)
+    description_url = iframe.get('src', '') if iframe is not None else ''
+    return {
+        'salary': salary,
+        'deadline_at': deadline_at,
+        'description': '' if description_url else _description_text(root),
+        'description_url': description_url,
+    }
+
+def _description_text(root, selectors=DESCRIPTION_SELECTORS):
+    for selector in selectors:
+        element = root.select_one(selector)
+        if element is not None:
+            text = WHITESPACE_PATTERN.sub(' ', element.get_text(' ')).strip()
+            if text:
+                return text[:MAX_DESCRIPTION_LENGTH]
+    return ''
+
+def parse_description_html(html, html_parser=DEFAULT_HTML_PARSER):
+    """iframe 으로 분리된 상세 요강 페이지의 본문 텍스트"""
+    return _description_text(parse_html(html, html_parser), DESCRIPTION_SELECTORS + ['body'])
+
+
+class DetailEnricher:
+    """
+    채용공고 상세 페이지에서 급여/마감 일시/상세 요강을 가져와 DataFrame 을 보강
+
+    상세 페이지는 max_workers 개의 스레드로 동시에 받고, 요청 속도 조절과 재시도(연결 오류, 429/5xx)는
+    governor(RequestGovernor)가 맡는다. 검색 크롤링과 같은 governor 를 넘기면 같은 호스트의 요청 속도를
+    함께 조절하고, 없으면 requests_per_second/retries/backoff 로 새로 만든다.
+    store(JobStore)를 주면 보강 결과를 저장해 두고, 목록 내용이 바뀌지 않은 공고는
+    다시 받지 않고 저장된 결과를 쓴다.
+    """
+
+    def __init__(self, store=None, max_workers=8, requests_per_second=2.0, retries=2, backoff=1.0,
+                 timeout=10, html_parser=DEFAULT_HTML_PARSER, base_url=None, governor=None):
+        self.store = store
+        self.max_workers = max_workers
+        self.governor = governor or RequestGovernor(requests_per_second, max_concurrency=max_workers,
+                                                    retries=retries, backoff=backoff)
+        self.timeout = timeout
+        self.html_parser = html_parser
+        self.base_url = base_url
+        self.session = get_http_session(pool_size=max_workers)
+
+    def _get(self, url):
+        """governor 의 속도 조절과 재시도를 거쳐 페이지 HTML 반환 (유효한 캐시는 바로 사용)"""
+        return governed_fetch_page(url, self.governor, session=self.session, timeout=self.timeout).text
+
+    def fetch_details(self, link):
+        """공고 하나의 상세 정보 (실패하면 None)"""
+        url = detail_url(link, self.base_url)
+        try:
+            with metrics.timer('detail_fetch_seconds'):
+                details = parse_detail_html(self._get(url), self.html_parser)
+                if not details['description'] and details['description_url']:
+                    description_html = self._get(urljoin(url, details['description_url']))
+                    details['description'] = parse_description_html(description_html, self.html_parser)
+        except Exception as e:
+            metrics.increment('detail_pages_total', result='failed')
+            metrics.increment('swallowed_exceptions_total', site='detail_fetch', exception=type(e).__name__)
+            print(f"상세 페이지 수집 실패 ({url}): {e}")
+            return None
+        metrics.increment('detail_pages_total', result='fetched')
+        return {column: details[column] for column in DETAIL_COLUMNS}
+
+    def enrich(self, df):
+        """
+        정리된 채용 정보 DataFrame 에 상세 정보 컬럼을 채워서 반환
+
+        salary 는 상세 페이지 값이 있으면 그 값으로, deadline_at/description 은 새 컬럼으로 추가한다.
+        상세 정보를 가져오지 못한 공고는 기존 값(빈 값)을 유지한다.
+        """
+        df = df.copy()
+        records = df.to_dict('records')
+        rec_idxs = [extract_rec_idx(record.get('link')) for record in records]
+        hashes = [job_content_hash(record) for record in records]
+
+        stored = self.store.load_details(rec_idx for rec_idx in rec_idxs if rec_idx) if self.store else {}
+        details = [None] * len(records)
+        to_fetch = []
+        for position, (record, rec_idx, content_hash) in enumerate(zip(records, rec_idxs, hashes)):
+            previous = stored.get(rec_idx)
+            if previous is not None and previous['content_hash'] == content_hash:
+                details[position] = previous
+                metrics.increment('detail_pages_total', result='reused')
+            elif record.get('link'):
+                to_fetch.append(position)
+
+        if to_fetch:
+            print(f"상세 페이지 {len(to_fetch)}개 수집 (재사용 {len(records) - len(to_fetch)}개, "
+                  f"동시 작업: {self.max_workers})")
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                fetched = list(executor.map(self.fetch_details, [records[position]['link'] for position in to_fetch]))
+
+            new_details = {}
+            for position, result in zip(to_fetch, fetched):
+                details[position] = result
+                if result is not None and rec_idxs[position]:
+                    new_details[rec_idxs[position]] = dict(result, content_hash=hashes[position])
+            if self.store and new_details:
+                self.store.save_details(new_details)
+
+        for column in DETAIL_COLUMNS:
+            values = [(detail or {}).get(column) or '' for detail in details]
+            if column in df.columns:
+                df[column] = [value or current for value, current in zip(values, df[column].fillna(''))]
+            else:
+                df[column] = values
+        return df
@@ -0,0 +1,279 @@
+import time
+import random
+import threading
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlparse
+
+import requests
+
+from saramin_metrics import metrics
+
+
+# 다시 시도할 HTTP 상태 코드 (그 밖의 4xx 는 바로 실패 처리)
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+# 요청이 너무 많다는 신호로 보는 상태 코드 (통계에서 따로 집계)
+THROTTLE_STATUS_CODES = {429, 503}
+
+# 응답이 이보다 느리면(초) 서버가 부담을 느끼는 것으로 보고 속도를 낮춤
+DEFAULT_LATENCY_TARGET = 3.0
+
+# 재시도 대기 시간 상한(초)
+DEFAULT_MAX_BACKOFF = 60.0
+
+
+class CircuitOpenError(RuntimeError):
+    """사이트 상태가 계속 나빠서 circuit breaker 가 요청을 막고 있음"""
+
+
+def response_status(error):
+    """requests 예외의 HTTP 상태 코드 (응답이 없으면 None)"""
+    return getattr(getattr(error, 'response', None), 'status_code', None)
+
+def retry_after_seconds(error):
+    """429/503 응답의 Retry-After 헤더를 초 단위로 변환 (없으면 None)"""
+    response = getattr(error, 'response', None)
+    value = response.headers.get('Retry-After') if response is not None else None
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+def is_retryable(error, retry_on=()):
+    """일시적인 오류(연결 오류/시간 초과/429/5xx, retry_on 예외)인지 여부"""
+    status = response_status(error)
+    if status is not None:
+        return status in RETRY_STATUS_CODES
+    return isinstance(error, (requests.ConnectionError, requests.Timeout) + tuple(retry_on))
+
+
+class _HostState:
+    """호스트별 요청 속도와 circuit breaker 상태"""
+
+    def __init__(self, rate):
+        self.rate = rate
+        self.next_time = 0.0
+        self.successes = 0
+        self.last_decrease = 0.0
+        self.consecutive_failures = 0
+        self.open_until = 0.0
+        self.probing = False
+        self.trips = 0
+        self.broken = False
+
+
+class RequestGovernor:
+    """
+    모든 요청 경로(HTTP 검색, 상세 페이지, Selenium)가 함께 쓰는 요청 조절기
+
+    - 속도 조절 (AIMD): 요청이 문제없이 빠르게 끝나면 호스트별 초당 요청 수와 동시 요청 수를 조금씩 올리고,
+      429/5xx/연결 오류나 latency_target 보다 느린 응답이 오면 절반으로 줄인다.
+      이미 줄인 뒤에 시작한 요청의 신호만 반영하므로 한 번의 혼잡으로 여러 번 줄이지 않는다.
+    - 재시도: 일시적인 오류는 retries 번까지 지터를 넣은 지수 백오프(Retry-After 우선)로 다시 시도한다.
+    - circuit breaker: 같은 호스트에서 연속 failure_threshold 번 실패하면 cooldown 초 동안 요청을 멈추고,
+      이후 요청 하나로 상태를 확인한다. 확인 요청이 max_trips 번 연속 실패하면 CircuitOpenError 로 중단한다.
+    """
+
+    def __init__(self, requests_per_second=2.0, max_concurrency=4, min_rate=0.2, max_rate=None,
+                 min_concurrency=1, retries=3, backoff=1.0, max_backoff=DEFAULT_MAX_BACKOFF,
+                 latency_target=DEFAULT_LATENCY_TARGET, failure_threshold=5, cooldown=30.0, max_trips=3):
+        self.initial_rate = requests_per_second or 0.0
+        self.min_rate = min(min_rate, self.initial_rate) if self.initial_rate else 0.0
+        self.max_rate = max_rate or self.initial_rate * 4
+        self.rate_step = self.initial_rate * 0.1
+        self.max_concurrency = max_concurrency
+        self.min_concurrency = min(min_concurrency, max_concurrency)
+        self.concurrency = max_concurrency
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.latency_target = latency_target
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.max_trips = max_trips
+        self._hosts = {}
+        self._in_flight = 0
+        self._condition = threading.Condition()
+        self._started = time.monotonic()
+        self._stats = {'requests': 0, 'succeeded': 0, 'failed': 0, 'retries': 0, 'throttled': 0,
+                       'increases': 0, 'decreases': 0, 'breaker_trips': 0, 'latency_sum': 0.0}
+
+    def request(self, url, fetch, retry_on=(), latency_target=None):
+        """
+        fetch() 를 속도 조절/재시도/circuit breaker 를 거쳐 실행하고 결과 반환
+
+        retry_on 은 추가로 재시도할 예외 종류(예: Selenium WebDriverException),
+        latency_target 은 이 요청에 적용할 느린 응답 기준(초)이다.
+        재시도해도 실패하면 마지막 예외를 그대로 올린다.
+        """
+        host = urlparse(url).netloc
+        latency_target = self.latency_target if latency_target is None else latency_target
+        for attempt in range(self.retries + 1):
+            probe = self._acquire(host)
+            started = time.monotonic()
+            try:
+                result = fetch()
+            except Exception as e:
+                retryable = is_retryable(e, retry_on)
+                status = response_status(e)
+                self._release(host, probe, started, 'error' if retryable else 'fatal', status)
+                if not retryable or attempt >= self.retries:
+                    with self._condition:
+                        self._stats['failed'] += 1
+                    metrics.increment('governor_requests_total', result='failed')
+                    raise
+                with self._condition:
+                    self._stats['retries'] += 1
+                metrics.increment('governor_retries_total', reason=status or type(e).__name__)
+                time.sleep(self.backoff_delay(attempt, retry_after_seconds(e)))
+                continue
+            latency = time.monotonic() - started
+            self._release(host, probe, started, 'slow' if latency > latency_target else 'ok')
+            metrics.increment('governor_requests_total', result='succeeded')
+            return result
+
+    def backoff_delay(self, attempt, retry_after=None):
+        """attempt 번째 재시도 전 대기 시간 (지수 증가 + 절반 범위 지터, Retry-After 가 더 길면 그 값)"""
+        delay = min(self.max_backoff, self.backoff * 2 ** attempt)
+        delay = delay / 2 + random.uniform(0, delay / 2)
+        if retry_after is not None:
+            delay = max(delay, min(retry_after, self.max_backoff))
+        return delay
+
+    def _host(self, host):
+        state = self._hosts.get(host)
+        if state is None:
+            state = self._hosts[host] = _HostState(self.initial_rate)
+        return state
+
+    def _acquire(self, host):
+        """circuit breaker, 동시 요청 수, 호스트별 요청 간격을 확인하고 요청 차례가 될 때까지 대기"""
+        waited_from = time.monotonic()
+        probe = False
+        with self._condition:
+            state = self._host(host)
+            while True:
+                if state.broken:
+                    raise CircuitOpenError(f"{host} 요청이 계속 실패해서 중단합니다.")
+                now = time.monotonic()
+                if state.open_until > now:
+                    self._condition.wait(state.open_until - now)
+                    continue
+                if state.probing or self._in_flight >= self.concurrency:
+                    self._condition.wait()
+                    continue
+                if state.open_until:
+                    # cooldown 이 끝난 뒤 첫 요청은 사이트 상태를 확인하는 요청
+                    state.probing = probe = True
+                self._in_flight += 1
+                self._stats['requests'] += 1
+                scheduled = max(now, state.next_time)
+                if state.rate:
+                    state.next_time = scheduled + 1.0 / state.rate
+                break
+        delay = scheduled - now
+        if delay > 0:
+            time.sleep(delay)
+        metrics.observe('governor_wait_seconds', time.monotonic() - waited_from)
+        return probe
+
+    def _release(self, host, probe, started, outcome, status=None):
+        """요청 결과로 속도/동시 요청 수/circuit breaker 상태 갱신 (outcome: ok/slow/error/fatal)"""
+        now = time.monotonic()
+        with self._condition:
+            state = self._host(host)
+            self._in_flight -= 1
+            if status in THROTTLE_STATUS_CODES:
+                self._stats['throttled'] += 1
+                metrics.increment('governor_throttled_total', status=status)
+
+            if outcome in ('ok', 'slow', 'fatal'):
+                # 응답은 받았으므로(404 등 포함) 사이트는 살아 있음
+                state.consecutive_failures = 0
+                if probe:
+                    state.open_until = 0.0
+                    state.trips = 0
+                if outcome != 'fatal':
+                    self._stats['succeeded'] += 1
+                    self._stats['latency_sum'] += now - started
+                if outcome == 'ok':
+                    state.successes += 1
+                    if state.successes >= self.concurrency:
+                        self._increase(state)
+                elif outcome == 'slow':
+                    self._decrease(state, started, now, 'slow')
+            else:
+                state.consecutive_failures += 1
+                self._decrease(state, started, now, status or 'error')
+                if probe or state.consecutive_failures >= self.failure_threshold:
+                    self._trip(host, state, now)
+
+            if probe:
+                state.probing = False
+            self._condition.notify_all()
+
+    def _increase(self, state):
+        state.successes = 0
+        if (not state.rate or state.rate >= self.max_rate) and self.concurrency >= self.max_concurrency:
+            return
+        if state.rate:
+            state.rate = min(self.max_rate, state.rate + self.rate_step)
+        self.concurrency = min(self.max_concurrency, self.concurrency + 1)
+        self._stats['increases'] += 1
+        metrics.increment('governor_adjustments_total', direction='up', reason='ok')
+
+    def _decrease(self, state, started, now, reason):
+        state.successes = 0
+        if started < state.last_decrease:
+            return
+        state.last_decrease = now
+        if state.rate:
+            state.rate = max(self.min_rate, state.rate / 2)
+        self.concurrency = max(self.min_concurrency, self.concurrency // 2)
+        self._stats['decreases'] += 1
+        metrics.increment('governor_adjustments_total', direction='down', reason=reason)
+
+    def _trip(self, host, state, now):
+        state.trips += 1
+        state.consecutive_failures = 0
+        self._stats['breaker_trips'] += 1
+        metrics.increment('circuit_breaker_trips_total', host=host)
+        if state.trips > self.max_trips:
+            state.broken = True
+            print(f"{host} circuit breaker: {self.max_trips}번 연속 복구 실패 - 요청을 중단합니다.")
+            return
+        state.open_until = now + self.cooldown
+        print(f"{host} circuit breaker 열림: 연속 실패로 {self.cooldown:g}초 동안 요청을 멈춥니다.")
+
+    def stats(self):
+        """실행 중 처리량/속도 조절 통계"""
+        with self._condition:
+            stats = dict(self._stats)
+            rates = {host: round(state.rate, 3) for host, state in self._hosts.items()}
+            concurrency = self.concurrency
+        elapsed = time.monotonic() - self._started
+        latency_sum = stats.pop('latency_sum')
+        stats.update({
+            'elapsed_seconds': round(elapsed, 3),
+            'throughput_per_second': round(stats['succeeded'] / elapsed, 3) if elapsed else 0.0,
+            'average_latency_seconds': round(latency_sum / stats['succeeded'], 3) if stats['succeeded'] else 0.0,
+            'concurrency': concurrency,
+            'rates': rates,
+        })
+        return stats
+
+    def summary(self):
+        """stats() 를 한 줄 요약 문자열로"""
+        stats = self.stats()
+        rates = ', '.join(f"{host} {rate}/s" for host, rate in stats['rates'].items()) or '-'
+        return (f"요청 {stats['requests']}회 (성공 {stats['succeeded']}, 실패 {stats['failed']}, "
+                f"재시도 {stats['retries']}, 429/503 {stats['throttled']}), "
+                f"처리량 {stats['throughput_per_second']}/s, 평균 응답 {stats['average_latency_seconds']}초, "
+                f"속도 조절 +{stats['increases']}/-{stats['decreases']}, 차단기 작동 {stats['breaker_trips']}회, "
+                f"현재 동시 요청 {stats['concurrency']}, 초당 요청 {rates}")
@@ -0,0 +1,259 @@
+import json
+import sqlite3
+import hashlib
+import threading
+import time
+import zlib
+from dataclasses import dataclass
+from urllib.parse import urlparse, urlencode, parse_qsl
+
+from saramin_metrics import metrics
+
+
+# 기본 캐시 유효 시간(초)과 최대 크기
+DEFAULT_CACHE_TTL = 3600
+DEFAULT_CACHE_MAX_BYTES = 200 * 1024 * 1024
+
+# 경로별 유효 시간 (검색 결과는 자주 바뀌고 상세 페이지는 잘 바뀌지 않음)
+DEFAULT_TTL_OVERRIDES = {
+    '/zf_user/search': 600,
+    '/zf_user/jobs/relay/view': 86400,
+    '/zf_user/jobs/view': 86400,
+}
+
+CREATE_RESPONSES_TABLE = """
+CREATE TABLE IF NOT EXISTS responses (
+    url TEXT PRIMARY KEY,
+    body BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    content_hash TEXT NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    fetched_at REAL NOT NULL,
+    expires_at REAL NOT NULL,
+    last_access REAL NOT NULL
+)
+"""
+
+CREATE_PARSED_TABLE = """
+CREATE TABLE IF NOT EXISTS parsed (
+    url TEXT NOT NULL,
+    content_hash TEXT NOT NULL,
+    parse_key TEXT NOT NULL,
+    jobs TEXT NOT NULL,
+    PRIMARY KEY (url, parse_key)
+)
+"""
+
+
+# parsed.jobs 의 크기(바이트) - 응답 본문과 함께 max_bytes 에 포함
+PARSED_SIZE = 'length(CAST(jobs AS BLOB))'
+
+
+def normalize_cache_url(url):
+    """캐시 키로 쓸 URL (쿼리 파라미터 순서를 정렬)"""
+    parsed = urlparse(url)
+    query = urlencode(sorted(parse_qsl(parsed.query, keep_blank_values=True)))
+    return parsed._replace(query=query, fragment='').geturl()
+
+def content_hash(text):
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()
+
+
+@dataclass
+class CachedPage:
+    """
+    페이지 응답 (캐시를 거친 경우 변경 여부 포함)
+
+    source: 'network'(캐시 없음/새로 받음), 'fresh'(유효 시간 안의 캐시),
+            'not_modified'(304 응답), 'unchanged'(다시 받았지만 내용 해시가 같음)
+    """
+    url: str
+    text: str
+    content_hash: str
+    changed: bool
+    source: str
+
+
+class HttpCache:
+    """
+    URL 기준 디스크(SQLite) 응답 캐시
+
+    유효 시간(ttl, 경로별 ttl_overrides) 안에는 요청 없이 캐시를 쓰고, 지나면 ETag/Last-Modified 가
+    있으면 조건부 요청으로, 없으면 다시 받은 본문의 해시로 변경 여부를 확인한다.
+    본문이 바뀌지 않았으면 이전 파싱 결과(parsed)를 그대로 쓸 수 있다.
+    전체 크기(압축한 응답 본문 + 저장해 둔 추출 결과)가 max_bytes 를 넘으면
+    가장 오래 사용하지 않은 응답부터 그 추출 결과와 함께 지운다.
+    """
+
+    def __init__(self, path='saramin_http_cache.db', ttl=DEFAULT_CACHE_TTL, max_bytes=DEFAULT_CACHE_MAX_BYTES,
+                 ttl_overrides=None):
+        self.path = path
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.ttl_overrides = DEFAULT_TTL_OVERRIDES if ttl_overrides is None else ttl_overrides
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self.conn:
+            self.conn.execute(CREATE_RESPONSES_TABLE)
+            self.conn.execute(CREATE_PARSED_TABLE)
+            self.conn.execute("CREATE INDEX IF NOT EXISTS idx_responses_access ON responses (last_access)")
+            self._total_bytes = self.conn.execute(
+                f"SELECT (SELECT COALESCE(SUM(size), 0) FROM responses) + "
+                f"(SELECT COALESCE(SUM({PARSED_SIZE}), 0) FROM parsed)"
+            ).fetchone()[0]
+
+    def ttl_for(self, url):
+        """URL 경로에 맞는 유효 시간(초)"""
+        path = urlparse(url).path
+        for prefix, ttl in self.ttl_overrides.items():
+            if path.startswith(prefix):
+                return ttl
+        return self.ttl
+
+    def _entry(self, key):
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT body, content_hash, etag, last_modified, expires_at FROM responses WHERE url = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        body, digest, etag, last_modified, expires_at = row
+        return {'text': zlib.decompress(body).decode('utf-8'), 'content_hash': digest, 'etag': etag,
+                'last_modified': last_modified, 'expires_at': expires_at}
+
+    def fresh(self, url):
+        """유효 시간 안의 캐시가 있으면 요청 없이 CachedPage 반환 (없거나 지났으면 None)"""
+        key = normalize_cache_url(url)
+        return self._fresh_page(url, key, self._entry(key), time.time())
+
+    def _fresh_page(self, url, key, entry, now):
+        if entry is None or now >= entry['expires_at']:
+            return None
+        self._touch(key, now)
+        metrics.increment('http_cache_total', result='fresh')
+        return CachedPage(url, entry['text'], entry['content_hash'], changed=False, source='fresh')
+
+    def fetch(self, url, session, timeout=10):
+        """캐시를 거쳐 페이지를 가져와 CachedPage 반환 (HTTP 오류는 예외)"""
+        key = normalize_cache_url(url)
+        entry = self._entry(key)
+        now = time.time()
+
+        page = self._fresh_page(url, key, entry, now)
+        if page is not None:
+            return page
+
+        headers = {}
+        if entry is not None:
+            if entry['etag']:
+                headers['If-None-Match'] = entry['etag']
+            if entry['last_modified']:
+                headers['If-Modified-Since'] = entry['last_modified']
+
+        response = session.get(url, timeout=timeout, headers=headers)
+        if entry is not None and response.status_code == 304:
+            self._refresh(key, now, response.headers)
+            metrics.increment('http_cache_total', result='not_modified')
+            return CachedPage(url, entry['text'], entry['content_hash'], changed=False, source='not_modified')
+        response.raise_for_status()
+
+        text = response.text
+        digest = content_hash(text)
+        self._store(key, text, digest, response.headers, now)
+        if entry is not None and entry['content_hash'] == digest:
+            metrics.increment('http_cache_total', result='unchanged')
+            return CachedPage(url, text, digest, changed=False, source='unchanged')
+        metrics.increment('http_cache_total', result='changed' if entry is not None else 'miss')
+        return CachedPage(url, text, digest, changed=True, source='network')
+
+    def _store(self, key, text, digest, headers, now):
+        body = zlib.compress(text.encode('utf-8'))
+        with self._lock, self.conn:
+            previous = self.conn.execute("SELECT size FROM responses WHERE url = ?", (key,)).fetchone()
+            self.conn.execute(
+                "INSERT OR REPLACE INTO responses (url, body, size, content_hash, etag, last_modified, "
+                "fetched_at, expires_at, last_access) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, body, len(body), digest, headers.get('ETag'), headers.get('Last-Modified'),
+                 now, now + self.ttl_for(key), now)
+            )
+            self._total_bytes += len(body) - (previous[0] if previous else 0)
+            self._evict()
+
+    def _refresh(self, key, now, headers):
+        """304 응답: 본문은 그대로 두고 유효 시간과 검증자만 갱신"""
+        with self._lock, self.conn:
+            self.conn.execute(
+                "UPDATE responses SET expires_at = ?, last_access = ?, etag = COALESCE(?, etag), "
+                "last_modified = COALESCE(?, last_modified) WHERE url = ?",
+                (now + self.ttl_for(key), now, headers.get('ETag'), headers.get('Last-Modified'), key)
+            )
+
+    def _touch(self, key, now):
+        with self._lock, self.conn:
+            self.conn.execute("UPDATE responses SET last_access = ? WHERE url = ?", (now, key))
+
+    def _evict(self):
+        """전체 크기가 max_bytes 이하가 될 때까지 오래 사용하지 않은 응답부터 추출 결과와 함께 삭제 (lock 안에서 호출)"""
+        if not self.max_bytes or self._total_bytes <= self.max_bytes:
+            return
+        evicted = []
+        rows = self.conn.execute(
+            f"SELECT url, size + COALESCE((SELECT SUM({PARSED_SIZE}) FROM parsed WHERE parsed.url = responses.url), 0) "
+            f"FROM responses ORDER BY last_access"
+        )
+        for url, size in rows:
+            if self._total_bytes <= self.max_bytes:
+                break
+            evicted.append((url,))
+            self._total_bytes -= size
+        self.conn.executemany("DELETE FROM responses WHERE url = ?", evicted)
+        self.conn.executemany("DELETE FROM parsed WHERE url = ?", evicted)
+        metrics.increment('http_cache_evictions_total', len(evicted))
+
+    def get_parsed(self, url, digest, parse_key):
+        """같은 본문(content_hash)에 대해 같은 파서/추출기(parse_key)로 저장해 둔 추출 결과 (없으면 None)"""
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT jobs FROM parsed WHERE url = ? AND parse_key = ? AND content_hash = ?",
+                (normalize_cache_url(url), parse_key, digest)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def set_parsed(self, url, digest, parse_key, jobs):
+        key = normalize_cache_url(url)
+        text = json.dumps(jobs, ensure_ascii=False)
+        with self._lock, self.conn:
+            previous = self.conn.execute(
+                f"SELECT {PARSED_SIZE} FROM parsed WHERE url = ? AND parse_key = ?", (key, parse_key)
+            ).fetchone()
+            self.conn.execute(
+                "INSERT OR REPLACE INTO parsed (url, content_hash, parse_key, jobs) VALUES (?, ?, ?, ?)",
+                (key, digest, parse_key, text)
+            )
+            self._total_bytes += len(text.encode('utf-8')) - (previous[0] if previous else 0)
+            self._evict()
+
+    def iter_pages(self, path_prefix=''):
+        """캐시된 페이지를 (URL, HTML) 로 반환 (path_prefix 로 경로 제한, 네트워크 요청 없음)"""
+        with self._lock:
+            urls = [row[0] for row in self.conn.execute("SELECT url FROM responses ORDER BY fetched_at, url")]
+        for url in urls:
+            if not urlparse(url).path.startswith(path_prefix):
+                continue
+            entry = self._entry(url)
+            if entry is not None:
+                yield url, entry['text']
+
+    @property
+    def total_bytes(self):
+        return self._total_bytes
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
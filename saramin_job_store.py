@@ -0,0 +1,344 @@
+import sqlite3
+import hashlib
+import json
+from datetime import datetime, date, timedelta
+from urllib.parse import urlparse, parse_qs
+
+import pandas as pd
+
+
+# 채용공고 스키마 (scrape_saramin_jobs 의 job_info 와 동일)
+JOB_COLUMNS = ['title', 'company', 'location', 'experience', 'education',
+               'employment_type', 'salary', 'deadline', 'link']
+
+# 상세 페이지에서 채우는 컬럼 (목록 페이지 내용 해시에서 제외)
+DETAIL_COLUMNS = ['salary', 'deadline_at', 'description']
+
+CREATE_JOBS_TABLE = f"""
+CREATE TABLE IF NOT EXISTS jobs (
+    rec_idx TEXT PRIMARY KEY,
+    {', '.join(f'{column} TEXT' for column in JOB_COLUMNS)},
+    content_hash TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'open',
+    first_seen TEXT NOT NULL,
+    last_seen TEXT NOT NULL,
+    last_changed TEXT NOT NULL,
+    closed_at TEXT
+)
+"""
+
+CREATE_DETAILS_TABLE = f"""
+CREATE TABLE IF NOT EXISTS job_details (
+    rec_idx TEXT PRIMARY KEY,
+    content_hash TEXT NOT NULL,
+    {', '.join(f'{column} TEXT' for column in DETAIL_COLUMNS)},
+    enriched_at TEXT NOT NULL
+)
+"""
+
+# 일별 집계(rollup) 대상 컬럼과 값이 비어 있을 때 쓰는 이름
+ROLLUP_DIMENSIONS = ['location', 'experience', 'employment_type', 'company']
+EMPTY_ROLLUP_VALUE = '미기재'
+
+CREATE_DAILY_POSTINGS_TABLE = """
+CREATE TABLE IF NOT EXISTS daily_postings (
+    day TEXT NOT NULL,
+    dimension TEXT NOT NULL,
+    value TEXT NOT NULL,
+    postings INTEGER NOT NULL,
+    PRIMARY KEY (day, dimension, value)
+)
+"""
+
+CREATE_DAILY_ACTIVITY_TABLE = """
+CREATE TABLE IF NOT EXISTS daily_activity (
+    day TEXT PRIMARY KEY,
+    open_postings INTEGER NOT NULL,
+    new_postings INTEGER NOT NULL,
+    changed_postings INTEGER NOT NULL,
+    closed_postings INTEGER NOT NULL,
+    updated_at TEXT NOT NULL
+)
+"""
+
+
+def extract_rec_idx(link):
+    """사람인 채용공고 링크에서 rec_idx 값 추출 (없으면 빈 문자열)"""
+    if not link:
+        return ''
+    values = parse_qs(urlparse(link).query).get('rec_idx')
+    return values[0] if values else ''
+
+def job_content_hash(job):
+    """
+    채용공고 목록 내용 해시
+
+    link 는 검색 파라미터에 따라 매번 달라지고, 상세 페이지에서 채우는 컬럼(salary 등)은
+    보강 여부에 따라 값이 달라지므로 둘 다 해시에서 제외한다.
+    """
+    content = {column: str(job.get(column) or '') for column in JOB_COLUMNS
+               if column != 'link' and column not in DETAIL_COLUMNS}
+    return hashlib.sha1(json.dumps(content, ensure_ascii=False, sort_keys=True).encode('utf-8')).hexdigest()
+
+def _now():
+    return datetime.now().isoformat(timespec='seconds')
+
+def _day_range(day):
+    """'YYYY-MM-DD' 하루에 해당하는 ISO 시각 문자열 범위 [시작, 다음 날)"""
+    next_day = date.fromisoformat(day) + timedelta(days=1)
+    return day, next_day.isoformat()
+
+
+class JobStore:
+    """
+    rec_idx 를 키로 채용공고를 누적 저장하는 SQLite 저장소
+
+    크롤링 결과를 upsert 하면서 처음/마지막으로 본 시각을 기록하고,
+    전체 크롤링에서 더 이상 보이지 않는 공고는 closed 로 표시한다.
+    크롤링마다 그날의 일별 집계(daily_postings, daily_activity)를 갱신해 두므로
+    추이 차트는 전체 이력 대신 작은 집계 테이블만 읽으면 된다.
+    """
+
+    def __init__(self, path='saramin_jobs.db', read_only=False):
+        self.path = path
+        if read_only:
+            # 조회만 하는 쪽(대시보드)은 파일을 만들거나 스키마를 바꾸지 않도록 읽기 전용으로 열기
+            self.conn = sqlite3.connect(f'file:{path}?mode=ro', uri=True)
+            return
+        self.conn = sqlite3.connect(path)
+        self.conn.execute(CREATE_JOBS_TABLE)
+        self.conn.execute(CREATE_DETAILS_TABLE)
+        self.conn.execute(CREATE_DAILY_POSTINGS_TABLE)
+        self.conn.execute(CREATE_DAILY_ACTIVITY_TABLE)
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs (status)")
+        # 일별 집계는 그날 본/마감된 공고만 범위 조회
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_last_seen ON jobs (last_seen)")
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_closed_at ON jobs (closed_at)")
+        self.conn.commit()
+
+    def known_hashes(self):
+        """{rec_idx: content_hash}"""
+        return dict(self.conn.execute("SELECT rec_idx, content_hash FROM jobs"))
+
+    def upsert_jobs(self, jobs, seen_at=None):
+        """
+        채용공고 목록을 저장하고 변경 내역 반환
+
+        반환값: {'new': [...], 'changed': [...], 'unchanged': [...], 'skipped': n}
+        (rec_idx 가 없는 공고는 저장하지 않고 skipped 로 센다)
+        """
+        seen_at = seen_at or _now()
+        known = self.known_hashes()
+        result = {'new': [], 'changed': [], 'unchanged': [], 'skipped': 0}
+        inserts, updates, touches = [], [], []
+        processed = set()
+
+        for job in jobs:
+            rec_idx = extract_rec_idx(job.get('link'))
+            if not rec_idx:
+                result['skipped'] += 1
+                continue
+            # 같은 실행 안에서 중복된 공고는 한 번만 처리
+            if rec_idx in processed:
+                continue
+            processed.add(rec_idx)
+            content_hash = job_content_hash(job)
+            values = [str(job.get(column) or '') for column in JOB_COLUMNS]
+
+            if rec_idx not in known:
+                inserts.append([rec_idx] + values + [content_hash, seen_at, seen_at, seen_at])
+                result['new'].append(rec_idx)
+            elif known[rec_idx] != content_hash:
+                updates.append(values + [content_hash, seen_at, seen_at, rec_idx])
+                result['changed'].append(rec_idx)
+            else:
+                touches.append((seen_at, rec_idx))
+                result['unchanged'].append(rec_idx)
+
+        with self.conn:
+            self.conn.executemany(
+                f"INSERT INTO jobs (rec_idx, {', '.join(JOB_COLUMNS)}, content_hash, "
+                f"first_seen, last_seen, last_changed) VALUES ({', '.join('?' * (len(JOB_COLUMNS) + 5))})",
+                inserts
+            )
+            self.conn.executemany(
+                f"UPDATE jobs SET {', '.join(f'{column} = ?' for column in JOB_COLUMNS)}, content_hash = ?, "
+                f"last_seen = ?, last_changed = ?, status = 'open', closed_at = NULL WHERE rec_idx = ?",
+                updates
+            )
+            self.conn.executemany(
+                "UPDATE jobs SET last_seen = ?, status = 'open', closed_at = NULL WHERE rec_idx = ?",
+                touches
+            )
+
+        return result
+
+    def mark_missing_closed(self, seen_rec_idxs, closed_at=None):
+        """이번 크롤링에서 보이지 않은 open 공고를 closed 로 표시하고 개수 반환"""
+        closed_at = closed_at or _now()
+        seen = set(seen_rec_idxs)
+        open_rec_idxs = [row[0] for row in self.conn.execute("SELECT rec_idx FROM jobs WHERE status = 'open'")]
+        missing = [(closed_at, rec_idx) for rec_idx in open_rec_idxs if rec_idx not in seen]
+        with self.conn:
+            self.conn.executemany(
+                "UPDATE jobs SET status = 'closed', closed_at = ? WHERE rec_idx = ?",
+                missing
+            )
+        return len(missing)
+
+    def sync_crawl(self, jobs, full_crawl=False):
+        """
+        크롤링 결과를 반영 (upsert 후 full_crawl 이면 사라진 공고를 closed 처리)
+
+        저장소의 open 공고 전체를 다시 크롤링한 경우에만 full_crawl=True 로 호출해야 한다.
+        키워드/페이지 일부만 크롤링한 결과로 마감 판정을 하면 다른 키워드의 공고까지 닫힌다.
+        """
+        seen_at = _now()
+        result = self.upsert_jobs(jobs, seen_at=seen_at)
+        result['closed'] = 0
+        if full_crawl:
+            seen = result['new'] + result['changed'] + result['unchanged']
+            result['closed'] = self.mark_missing_closed(seen, closed_at=seen_at)
+        self.update_daily_rollup(seen_at[:10])
+        return result
+
+    def update_daily_rollup(self, day=None):
+        """
+        하루(기본: 오늘)의 일별 집계를 다시 계산해서 저장
+
+        그날 크롤링에서 본 공고의 컬럼별 개수(daily_postings)와 신규/변경/마감 공고 수(daily_activity)를
+        그날 범위의 공고만 조회해서 계산한다. 같은 날 여러 번 크롤링하면 마지막 상태로 덮어쓰고,
+        지난 날짜의 집계는 그대로 남는다.
+        """
+        day = day or _now()[:10]
+        start, end = _day_range(day)
+        self._save_daily_rollup(day, "last_seen >= ? AND last_seen < ?", (start, end))
+
+    def rebuild_daily_rollup(self, start_day=None, end_day=None):
+        """
+        jobs 테이블의 이력으로 지난 날짜의 일별 집계를 채움 (집계 테이블이 생기기 전에 쌓인 저장소용)
+
+        공고마다 마지막 상태만 남아 있으므로 근사값이다. 처음 본 날부터 마지막으로 본 날까지 매일 본 것으로 보고
+        컬럼 값은 현재 값을 쓰며, 변경 공고 수는 마지막으로 바뀐 날에만 센다.
+        기간을 주지 않으면 첫 집계가 있는 날의 전날까지만 채운다 (그 뒤 크롤링하지 않은 날은 비워 둠).
+        start_day/end_day('YYYY-MM-DD')를 주면 그 기간의 집계를 이미 있더라도 다시 만든다.
+        반환값: 집계한 날짜 수
+        """
+        first_day, last_day = self.conn.execute(
+            "SELECT MIN(substr(first_seen, 1, 10)), MAX(substr(last_seen, 1, 10)) FROM jobs"
+        ).fetchone()
+        if first_day is None:
+            return 0
+        if start_day is None and end_day is None:
+            first_rollup_day = self.conn.execute("SELECT MIN(day) FROM daily_activity").fetchone()[0]
+            if first_rollup_day is not None:
+                last_day = (date.fromisoformat(first_rollup_day) - timedelta(days=1)).isoformat()
+        first_day, last_day = start_day or first_day, end_day or last_day
+
+        rebuilt = 0
+        day = date.fromisoformat(first_day)
+        while day.isoformat() <= last_day:
+            start, end = _day_range(day.isoformat())
+            self._save_daily_rollup(day.isoformat(), "first_seen < ? AND last_seen >= ?", (end, start))
+            rebuilt += 1
+            day += timedelta(days=1)
+        return rebuilt
+
+    def _save_daily_rollup(self, day, seen_condition, seen_params):
+        """seen_condition 에 해당하는 공고를 그날 본 공고로 보고 day 의 일별 집계를 저장"""
+        start, end = _day_range(day)
+        seen_filter = f"FROM jobs WHERE {seen_condition}"
+
+        postings = []
+        for dimension in ROLLUP_DIMENSIONS:
+            rows = self.conn.execute(
+                f"SELECT COALESCE(NULLIF({dimension}, ''), ?), COUNT(*) {seen_filter} GROUP BY 1",
+                (EMPTY_ROLLUP_VALUE, *seen_params)
+            )
+            postings.extend((day, dimension, value, count) for value, count in rows)
+
+        open_count, new_count, changed_count = self.conn.execute(
+            f"SELECT COUNT(*), COALESCE(SUM(first_seen >= ?), 0), "
+            f"COALESCE(SUM(last_changed >= ? AND last_changed < ? AND first_seen < ?), 0) {seen_filter}",
+            (start, start, end, start, *seen_params)
+        ).fetchone()
+        closed_count = self.conn.execute(
+            "SELECT COUNT(*) FROM jobs WHERE closed_at >= ? AND closed_at < ?", (start, end)
+        ).fetchone()[0]
+
+        with self.conn:
+            self.conn.execute("DELETE FROM daily_postings WHERE day = ?", (day,))
+            self.conn.executemany("INSERT INTO daily_postings (day, dimension, value, postings) "
+                                  "VALUES (?, ?, ?, ?)", postings)
+            self.conn.execute(
+                "INSERT OR REPLACE INTO daily_activity (day, open_postings, new_postings, changed_postings, "
+                "closed_postings, updated_at) VALUES (?, ?, ?, ?, ?, ?)",
+                (day, open_count, new_count, changed_count, closed_count, _now())
+            )
+
+    def load_daily_activity(self, start_day=None):
+        """일별 본 공고/신규/변경/마감 공고 수 DataFrame (day 순)"""
+        return pd.read_sql_query(
+            "SELECT day, open_postings, new_postings, changed_postings, closed_postings FROM daily_activity "
+            "WHERE day >= ? ORDER BY day",
+            self.conn, params=(start_day or '',)
+        )
+
+    def load_daily_postings(self, dimension, start_day=None, top=None):
+        """
+        일별 컬럼 값별 공고 수 DataFrame (day, value, postings)
+
+        top 을 주면 기간 전체 공고 수 기준 상위 top 개 값만 반환한다.
+        """
+        if dimension not in ROLLUP_DIMENSIONS:
+            raise ValueError(f"집계하지 않는 컬럼입니다: {dimension}")
+        params = [dimension, start_day or '']
+        query = "SELECT day, value, postings FROM daily_postings WHERE dimension = ? AND day >= ?"
+        if top:
+            query += (" AND value IN (SELECT value FROM daily_postings WHERE dimension = ? AND day >= ? "
+                      "GROUP BY value ORDER BY SUM(postings) DESC LIMIT ?)")
+            params += [dimension, start_day or '', top]
+        return pd.read_sql_query(query + " ORDER BY day, postings DESC", self.conn, params=params)
+
+    def load_jobs(self, include_closed=False):
+        """저장된 채용공고를 DataFrame 으로 반환"""
+        query = "SELECT * FROM jobs"
+        if not include_closed:
+            query += " WHERE status = 'open'"
+        return pd.read_sql_query(query + " ORDER BY first_seen, rec_idx", self.conn)
+
+    def load_details(self, rec_idxs):
+        """{rec_idx: {'content_hash': 보강 당시 목록 해시, 'salary': ..., 'deadline_at': ..., 'description': ...}}"""
+        rec_idxs = list(rec_idxs)
+        details = {}
+        # SQLite 변수 개수 제한을 넘지 않도록 나눠서 조회
+        for start in range(0, len(rec_idxs), 500):
+            chunk = rec_idxs[start:start + 500]
+            rows = self.conn.execute(
+                f"SELECT rec_idx, content_hash, {', '.join(DETAIL_COLUMNS)} FROM job_details "
+                f"WHERE rec_idx IN ({', '.join('?' * len(chunk))})",
+                chunk
+            )
+            for rec_idx, content_hash, *values in rows:
+                details[rec_idx] = dict(zip(DETAIL_COLUMNS, values), content_hash=content_hash)
+        return details
+
+    def save_details(self, details, enriched_at=None):
+        """상세 페이지 보강 결과 저장 (details: {rec_idx: {'content_hash': ..., 컬럼: 값}})"""
+        enriched_at = enriched_at or _now()
+        with self.conn:
+            self.conn.executemany(
+                f"INSERT OR REPLACE INTO job_details (rec_idx, content_hash, {', '.join(DETAIL_COLUMNS)}, "
+                f"enriched_at) VALUES ({', '.join('?' * (len(DETAIL_COLUMNS) + 3))})",
+                [[rec_idx, detail['content_hash']] + [str(detail.get(column) or '') for column in DETAIL_COLUMNS]
+                 + [enriched_at] for rec_idx, detail in details.items()]
+            )
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
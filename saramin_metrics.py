@@ -0,0 +1,175 @@
+import json
+import time
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+
+
+# Prometheus 메트릭 이름 앞에 붙이는 접두사
+METRIC_PREFIX = 'saramin_'
+METRIC_FORMATS = ['jsonl', 'prometheus']
+
+# 메트릭 설명 (Prometheus HELP 줄)
+METRIC_HELP = {
+    'driver_start_seconds': 'Chrome 웹드라이버 생성 시간',
+    'driver_recycles_total': '메모리 한도를 넘어 새로 만든 웹드라이버 수',
+    'page_load_seconds': '페이지 요청/로딩 시간',
+    'page_wait_seconds': '채용공고 리스트 대기 시간',
+    'pages_total': '처리한 페이지 수',
+    'selector_hits_total': '채용공고 리스트를 찾은 셀렉터별 횟수',
+    'cards_parsed_total': '추출을 시도한 채용공고 카드 수',
+    'cards_kept_total': '결과에 포함된 채용공고 수',
+    'cards_dropped_total': '결과에서 제외된 채용공고 수 (사유별)',
+    'swallowed_exceptions_total': '무시하고 진행한 예외 수 (위치/예외 종류별)',
+    'normalize_seconds': '채용 정보 정리(normalize_jobs_df) 시간',
+    'write_seconds': '파일 저장 시간',
+    'http_cache_total': 'HTTP 응답 캐시 결과 (fresh/not_modified/unchanged/changed/miss)',
+    'http_cache_evictions_total': '크기 제한으로 삭제한 캐시 응답 수',
+    'parse_skipped_total': '본문이 바뀌지 않아 파싱을 생략한 페이지 수',
+    'enrich_seconds': '상세 페이지 보강 단계 시간',
+    'detail_fetch_seconds': '상세 페이지 하나를 받아서 파싱하는 시간',
+    'detail_pages_total': '상세 페이지 처리 결과 (fetched/reused/failed)',
+    'pages_failed_total': '재시도 후에도 수집하지 못한 검색 페이지 수',
+    'governor_requests_total': '요청 조절기를 거친 요청 결과 (succeeded/failed)',
+    'governor_retries_total': '재시도한 요청 수 (상태 코드/예외별)',
+    'governor_throttled_total': '429/503 응답 수',
+    'governor_adjustments_total': '요청 속도/동시 요청 수 조절 횟수 (up/down)',
+    'governor_wait_seconds': '요청 차례(동시 요청 수/요청 간격)를 기다린 시간',
+    'circuit_breaker_trips_total': 'circuit breaker 가 열린 횟수',
+    'blocked_requests_total': 'Selenium 엔진에서 차단한 요청 수 (리소스 종류별)',
+    'page_requests_total': 'Selenium 엔진 페이지에서 발생한 요청 수',
+    'page_transfer_bytes_total': 'Selenium 엔진 페이지 전송량 (바이트)',
+}
+
+
+def _label_key(labels):
+    return tuple(sorted((name, str(value)) for name, value in labels.items()))
+
+def _escape_label(value):
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+class ScraperMetrics:
+    """
+    크롤러 단계별 카운터/시간 측정 (스레드 안전)
+
+    카운터는 increment 로 더하고, 시간은 observe 또는 timer 로 기록한다 (횟수/합계/최대).
+    레이블(engine, selector 등)별로 따로 집계하며 JSON lines 또는 Prometheus 텍스트로 내보낸다.
+    """
+
+    def __init__(self):
+        self._counters = {}
+        self._timings = {}
+        self._lock = threading.Lock()
+        self.started_at = datetime.now().isoformat(timespec='seconds')
+
+    def increment(self, name, value=1, **labels):
+        """카운터 증가"""
+        key = (name, _label_key(labels))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def observe(self, name, seconds, **labels):
+        """소요 시간(초) 기록"""
+        key = (name, _label_key(labels))
+        with self._lock:
+            count, total, maximum = self._timings.get(key, (0, 0.0, 0.0))
+            self._timings[key] = (count + 1, total + seconds, max(maximum, seconds))
+
+    @contextmanager
+    def timer(self, name, **labels):
+        """with 블록의 실행 시간 기록 (예외가 나도 기록)"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, **labels)
+
+    def counter_value(self, name, **labels):
+        """카운터 값 (labels 를 주면 해당 레이블만, 없으면 전체 합)"""
+        with self._lock:
+            if labels:
+                return self._counters.get((name, _label_key(labels)), 0)
+            return sum(value for (counter, _), value in self._counters.items() if counter == name)
+
+    def snapshot(self):
+        """현재 값 목록 [{'name', 'type', 'labels', ...}, ...]"""
+        with self._lock:
+            counters = sorted(self._counters.items())
+            timings = sorted(self._timings.items())
+
+        samples = [{'name': name, 'type': 'counter', 'labels': dict(labels), 'value': value}
+                   for (name, labels), value in counters]
+        samples += [{'name': name, 'type': 'timing', 'labels': dict(labels), 'count': count,
+                     'sum': round(total, 6), 'max': round(maximum, 6)}
+                    for (name, labels), (count, total, maximum) in timings]
+        return samples
+
+    def reset(self):
+        with self._lock:
+            self._counters.clear()
+            self._timings.clear()
+        self.started_at = datetime.now().isoformat(timespec='seconds')
+
+    def to_json_lines(self):
+        """메트릭 하나당 JSON 한 줄 (실행 시작/기록 시각 포함)"""
+        recorded_at = datetime.now().isoformat(timespec='seconds')
+        return ''.join(
+            json.dumps(dict(sample, run_started_at=self.started_at, recorded_at=recorded_at),
+                       ensure_ascii=False) + '\n'
+            for sample in self.snapshot()
+        )
+
+    def to_prometheus(self):
+        """Prometheus 텍스트 형식 (시간은 summary 의 _sum/_count 와 최대값 gauge)"""
+        lines = []
+        described = set()
+
+        def describe(name, metric_type):
+            if name not in described:
+                described.add(name)
+                help_text = METRIC_HELP.get(name[len(METRIC_PREFIX):].replace('_max', ''), name)
+                lines.append(f"# HELP {name} {help_text}")
+                lines.append(f"# TYPE {name} {metric_type}")
+
+        def label_text(labels):
+            if not labels:
+                return ''
+            return '{' + ','.join(f'{name}="{_escape_label(value)}"' for name, value in labels.items()) + '}'
+
+        for sample in self.snapshot():
+            name = METRIC_PREFIX + sample['name']
+            labels = label_text(sample['labels'])
+            if sample['type'] == 'counter':
+                describe(name, 'counter')
+                lines.append(f"{name}{labels} {sample['value']}")
+            else:
+                describe(name, 'summary')
+                lines.append(f"{name}_sum{labels} {sample['sum']}")
+                lines.append(f"{name}_count{labels} {sample['count']}")
+        for sample in self.snapshot():
+            if sample['type'] == 'timing':
+                name = METRIC_PREFIX + sample['name'] + '_max'
+                describe(name, 'gauge')
+                lines.append(f"{name}{label_text(sample['labels'])} {sample['max']}")
+        return '\n'.join(lines) + '\n'
+
+    def export(self, path, metric_format='jsonl'):
+        """
+        파일로 내보내기
+
+        jsonl 은 실행마다 기존 파일 뒤에 추가하고, prometheus 는 textfile collector 가
+        읽을 수 있도록 파일을 새로 쓴다.
+        """
+        if metric_format == 'jsonl':
+            with open(path, 'a', encoding='utf-8') as f:
+                f.write(self.to_json_lines())
+        elif metric_format == 'prometheus':
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(self.to_prometheus())
+        else:
+            raise ValueError(f"지원하지 않는 메트릭 형식입니다: {metric_format}")
+
+
+# 크롤러 전체에서 공유하는 메트릭 (프로세스당 1개)
+metrics = ScraperMetrics()
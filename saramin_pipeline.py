@@ -0,0 +1,207 @@
+import os
+from datetime import date, timedelta
+from itertools import islice
+
+import pandas as pd
+
+from saramin_scraper_final import (
+    DEFAULT_WAIT_TIMEOUT, DEFAULT_HTML_PARSER, SARAMIN_BASE_URL,
+    build_search_url, iter_crawl_pages, iter_unique_jobs, normalize_jobs_df,
+)
+from saramin_job_store import JOB_COLUMNS, JobStore
+from saramin_metrics import metrics
+from saramin_storage import CATEGORY_COLUMNS, to_columnar_frame
+
+
+# 정리/저장 단계에서 한 번에 처리하는 공고 수
+DEFAULT_CHUNK_SIZE = 200
+
+# 스트리밍으로 저장할 수 있는 컬럼형 형식 (feather 는 파일 끝에서 한 번에 써야 해서 제외)
+STREAMING_FORMATS = ['parquet']
+
+
+def iter_chunks(jobs, chunk_size=DEFAULT_CHUNK_SIZE):
+    """공고를 chunk_size 개씩 묶어서 반환 (마지막 묶음은 더 작을 수 있음)"""
+    jobs = iter(jobs)
+    while True:
+        chunk = list(islice(jobs, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+def iter_normalized(chunks):
+    """공고 묶음을 정리된 DataFrame 으로 변환"""
+    for chunk in chunks:
+        with metrics.timer('normalize_seconds'):
+            df = normalize_jobs_df(pd.DataFrame(chunk, columns=JOB_COLUMNS))
+        yield df
+
+
+def iter_enriched(frames, enricher):
+    """정리된 묶음마다 상세 페이지 정보로 보강"""
+    for df in frames:
+        with metrics.timer('enrich_seconds'):
+            df = enricher.enrich(df)
+        yield df
+
+
+class CsvSink:
+    """
+    CSV 파일에 묶음 단위로 이어 쓰는 저장소
+
+    append=False 면 처음 묶음에서 파일을 새로 만들고(헤더 포함) 이후 묶음은 뒤에 추가한다.
+    묶음마다 파일을 닫으므로 중간에 멈춰도 그때까지의 행은 남는다.
+    """
+
+    name = 'csv'
+
+    def __init__(self, path, append=False):
+        self.path = path
+        self._has_header = append and os.path.exists(path) and os.path.getsize(path) > 0
+
+    def write(self, df):
+        if self._has_header:
+            df.to_csv(self.path, mode='a', header=False, index=False, encoding='utf-8')
+        else:
+            df.to_csv(self.path, mode='w', index=False, encoding='utf-8-sig')
+            self._has_header = True
+
+    def close(self, completed=False):
+        pass
+
+
+class ParquetSink:
+    """
+    Parquet 파일에 묶음마다 row group 을 하나씩 쓰는 저장소 (pyarrow 필요)
+
+    스키마는 첫 묶음의 컬럼으로 정한다. 파일 끝의 메타데이터는 close 때 기록되므로
+    중간에 프로세스가 죽으면 파일을 읽을 수 없다. (중간 결과 보존이 필요하면 CSV/SQLite 저장소를 함께 사용)
+    """
+
+    name = 'parquet'
+
+    def __init__(self, path, reference=None):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        self.path = path
+        self.reference = reference
+        self._pa = pa
+        self._pq = pq
+        self.schema = None
+        self._writer = None
+
+    def _build_schema(self, columns):
+        # 묶음마다 카테고리 값이 달라도 같은 스키마로 쓰도록 범주형 컬럼은 사전(dictionary) 타입으로 고정
+        pa = self._pa
+        fields = []
+        for column in columns:
+            if column == 'deadline_date':
+                fields.append((column, pa.timestamp('ns')))
+            elif column in CATEGORY_COLUMNS:
+                fields.append((column, pa.dictionary(pa.int32(), pa.string())))
+            else:
+                fields.append((column, pa.string()))
+        return pa.schema(fields)
+
+    def write(self, df):
+        frame = to_columnar_frame(df, self.reference)
+        if self._writer is None:
+            self.schema = self._build_schema(frame.columns)
+            self._writer = self._pq.ParquetWriter(self.path, self.schema)
+        table = self._pa.Table.from_pandas(frame[self.schema.names], schema=self.schema, preserve_index=False)
+        self._writer.write_table(table)
+
+    def close(self, completed=False):
+        if self._writer is not None:
+            self._writer.close()
+
+
+class SQLiteSink:
+    """
+    JobStore(SQLite)에 묶음마다 upsert 하는 저장소
+
+    full_crawl 이면(추적 중인 공고 전체를 덮는 크롤링) 크롤링이 끝까지 완료된 경우에만
+    (close(completed=True)) 이번 실행에서 보이지 않은 공고를 closed 로 표시한다. 중간에 실패하면 그때까지 upsert 한 내용만 남는다.
+    닫을 때 크롤링을 시작한 날부터 닫는 날까지 매일의 일별 집계를 갱신한다 (자정을 넘긴 크롤링 포함).
+    """
+
+    name = 'sqlite'
+
+    def __init__(self, path, full_crawl=False):
+        self.store = JobStore(path)
+        self.full_crawl = full_crawl
+        self.changes = {'new': 0, 'changed': 0, 'unchanged': 0, 'skipped': 0, 'closed': 0}
+        self._seen = set()
+        self._started_day = date.today()
+
+    def write(self, df):
+        result = self.store.upsert_jobs(df.to_dict('records'))
+        for key in ['new', 'changed', 'unchanged']:
+            self.changes[key] += len(result[key])
+            self._seen.update(result[key])
+        self.changes['skipped'] += result['skipped']
+
+    def close(self, completed=False):
+        try:
+            if self.full_crawl and completed:
+                self.changes['closed'] = self.store.mark_missing_closed(self._seen)
+            day = self._started_day
+            while day <= date.today():
+                self.store.update_daily_rollup(day.isoformat())
+                day += timedelta(days=1)
+        finally:
+            self.store.close()
+
+
+def write_chunks(frames, sinks):
+    """정리된 DataFrame 을 모든 저장소에 차례로 쓰면서 반환 (다음 단계로 그대로 전달)"""
+    for df in frames:
+        for sink in sinks:
+            with metrics.timer('write_seconds', format=sink.name):
+                sink.write(df)
+        yield df
+
+def run_pipeline(keywords, sinks, pages=range(1, 11), engine='http', max_workers=4,
+                 requests_per_second=2.0, page_count=40, wait_timeout=DEFAULT_WAIT_TIMEOUT,
+                 html_parser=DEFAULT_HTML_PARSER, base_url=SARAMIN_BASE_URL,
+                 chunk_size=DEFAULT_CHUNK_SIZE, max_pending=None, enricher=None, governor=None):
+    """
+    크롤링 -> 중복 제거 -> 묶음 정리 -> 저장을 제너레이터로 연결해서 스트리밍 처리
+
+    각 단계는 앞 단계에서 필요한 만큼만 가져가므로 메모리에는 진행 중인 페이지와
+    묶음 하나 정도만 올라가고, 크롤링 규모와 관계없이 일정하다.
+    enricher(DetailEnricher)를 주면 묶음마다 상세 페이지 정보로 보강한 뒤 저장한다.
+    governor(RequestGovernor)는 크롤링과 보강 요청이 함께 쓰는 요청 조절기이다.
+    수집하지 못한 페이지가 있으면 완료되지 않은 크롤링으로 보고 저장소를 닫는다 (마감 판정 안 함).
+    반환값: {'pages': 페이지 수, 'jobs': 저장한 공고 수, 'chunks': 묶음 수, 'failed_pages': 실패한 페이지 수}
+    """
+    summary = {'pages': 0, 'jobs': 0, 'chunks': 0, 'failed_pages': 0}
+    failed_urls = []
+    urls = (build_search_url(keyword, page, page_count, base_url) for keyword in keywords for page in pages)
+
+    def counted_pages(page_results):
+        for page_jobs in page_results:
+            summary['pages'] += 1
+            yield page_jobs
+
+    page_results = iter_crawl_pages(urls, engine=engine, max_workers=max_workers,
+                                    requests_per_second=requests_per_second, wait_timeout=wait_timeout,
+                                    html_parser=html_parser, max_pending=max_pending,
+                                    governor=governor, failed_urls=failed_urls)
+    frames = iter_normalized(iter_chunks(iter_unique_jobs(counted_pages(page_results)), chunk_size))
+    if enricher is not None:
+        frames = iter_enriched(frames, enricher)
+
+    completed = False
+    try:
+        for df in write_chunks(frames, sinks):
+            summary['chunks'] += 1
+            summary['jobs'] += len(df)
+            print(f"{summary['pages']}개 페이지 처리, 공고 {summary['jobs']}개 저장")
+        completed = not failed_urls
+    finally:
+        summary['failed_pages'] = len(failed_urls)
+        for sink in sinks:
+            sink.close(completed)
+    return summary
@@ -1,97 +1,890 @@
 import requests
+from requests.adapters import HTTPAdapter
 from bs4 import BeautifulSoup
 import pandas as pd
 import time
 import json
 import re
-from datetime import datetime, timedelta
+import os
+import argparse
+import hashlib
+import inspect
+import threading
+import queue
+from contextlib import contextmanager
+from collections import deque
+from functools import lru_cache, partial
+from itertools import islice
+from datetime import date, datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from urllib.parse import urlencode
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException, WebDriverException
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
 from webdriver_manager.chrome import ChromeDriverManager
+from saramin_job_store import JobStore, JOB_COLUMNS
+from saramin_storage import save_jobs_file
+from saramin_metrics import metrics, METRIC_FORMATS
+from saramin_http_cache import HttpCache, CachedPage, content_hash, DEFAULT_CACHE_TTL, DEFAULT_CACHE_MAX_BYTES
+from saramin_governor import RequestGovernor, CircuitOpenError, DEFAULT_LATENCY_TARGET
 
+try:
+    from selectolax.lexbor import LexborHTMLParser as SelectolaxHTMLParser
+except ImportError:
+    try:
+        from selectolax.parser import HTMLParser as SelectolaxHTMLParser
+    except ImportError:
+        SelectolaxHTMLParser = None
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+
+SARAMIN_BASE_URL = 'https://www.saramin.co.kr'
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+
+# 채용공고 리스트 셀렉터 (우선순위 순)
+JOB_LIST_SELECTORS = [
+    '.item_recruit',
+    '.list_item',
+    '[class*="recruit"]',
+    '[class*="item"]'
+]
+
+# Selenium 페이지 로딩 최대 대기 시간(초)과 페이지별 실제 대기 기록
+DEFAULT_WAIT_TIMEOUT = 10
+page_wait_times = deque(maxlen=1000)
+
+# HTML 파싱 백엔드 (lxml, selectolax 는 설치된 경우에만 사용 가능)
+HTML_PARSERS = ['html.parser', 'lxml', 'selectolax']
+DEFAULT_HTML_PARSER = 'html.parser'
+
+# 검색 결과 리스트 영역 셀렉터 (찾으면 이 영역 안에서만 컨테이너를 찾음)
+RESULT_LIST_SELECTORS = ['#recruit_info_list', '#content']
+
+# 클래스명에 item/recruit/job/list 가 포함된 div (대소문자 무시)
+GENERIC_CONTAINER_SELECTOR = ', '.join(
+    f'div[class*="{keyword}" i]' for keyword in ['item', 'recruit', 'job', 'list']
+)
+
+# 검색 결과 페이지 경로 (캐시에서 검색 페이지만 다시 파싱할 때 사용)
+SEARCH_PATH_PREFIX = '/zf_user/search'
+
+# Selenium 엔진에서 차단할 리소스 종류별 URL 패턴 (텍스트와 링크만 읽으므로 필요 없음)
+BLOCKABLE_RESOURCE_PATTERNS = {
+    'image': ['*.png*', '*.jpg*', '*.jpeg*', '*.gif*', '*.webp*', '*.svg*', '*.ico*'],
+    'font': ['*.woff*', '*.ttf*', '*.otf*', '*.eot*'],
+    'media': ['*.mp4*', '*.webm*', '*.mp3*', '*.m3u8*'],
+}
+DEFAULT_BLOCKED_RESOURCE_TYPES = ['image', 'font', 'media']
+
+# 광고/트래커 등 외부 스크립트 (채용공고 리스트 렌더링과 무관)
+DEFAULT_BLOCKED_URL_PATTERNS = [
+    '*googletagmanager.com*',
+    '*google-analytics.com*',
+    '*doubleclick.net*',
+    '*googlesyndication.com*',
+    '*googleadservices.com*',
+    '*facebook.net*',
+    '*criteo.com*',
+    '*criteo.net*',
+    '*adnxs.com*',
+    '*mobon.net*',
+    '*wcs.naver.net*',
+    '*hotjar.com*',
+    '*clarity.ms*',
+]
+
+# 페이지별 리소스 차단/전송량 기록 (Selenium 엔진)
+page_resource_stats = deque(maxlen=1000)
+
+# HTTP 엔진에서 공유하는 세션 (커넥션 풀 재사용)
+_http_session = None
+_http_session_lock = threading.Lock()
+
+# HTTP 엔진 응답 캐시 (set_http_cache 로 설정했을 때만 사용)
+_http_cache = None
+
+# Selenium 엔진 브라우저 설정 (configure_browser 로 변경)
+_headless = True
+_resource_blocker = None
+
+
+def get_http_session(pool_size=10):
+    """커넥션 풀을 재사용하는 requests 세션 반환 (프로세스당 1개)"""
+    global _http_session
+    with _http_session_lock:
+        if _http_session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            session.headers.update({
+                'User-Agent': USER_AGENT,
+                'Accept-Language': 'ko-KR,ko;q=0.9,en;q=0.8',
+            })
+            _http_session = session
+        return _http_session
+
+def set_http_cache(cache):
+    """HTTP 엔진이 사용할 응답 캐시(HttpCache) 설정 (None 이면 캐시 사용 안 함)"""
+    global _http_cache
+    _http_cache = cache
 
+def fetch_page(url, session=None, timeout=10):
+    """
+    requests 세션으로 페이지를 가져와 CachedPage 반환
+
+    응답 캐시가 설정되어 있으면 캐시/조건부 요청을 거치고, changed 로 본문 변경 여부를 알려준다.
+    """
+    session = session or get_http_session()
+    with metrics.timer('page_load_seconds', engine='http'):
+        if _http_cache is not None:
+            return _http_cache.fetch(url, session, timeout=timeout)
+        response = session.get(url, timeout=timeout)
+    response.raise_for_status()
+    return CachedPage(url, response.text, content_hash(response.text), changed=True, source='network')
+
+def governed_fetch_page(url, governor, session=None, timeout=10):
+    """
+    fetch_page 를 governor(RequestGovernor)를 거쳐 실행
 
-def scrape_saramin_jobs(url):
+    응답 캐시의 유효 시간 안에 있는 페이지는 요청이 아니므로 governor 를 거치지 않고 바로 반환한다
+    (속도 조절 대기와 성공 횟수에 포함되지 않음). 캐시 재검증을 포함한 네트워크 요청만 governor 로 보낸다.
+    """
+    if _http_cache is not None:
+        page = _http_cache.fresh(url)
+        if page is not None:
+            return page
+    return governor.request(url, partial(fetch_page, url, session=session, timeout=timeout))
+
+def fetch_page_html(url, session=None, timeout=10):
+    """requests 세션으로 페이지 HTML 다운로드"""
+    return fetch_page(url, session=session, timeout=timeout).text
+
+def scrape_saramin_jobs(url, engine='selenium', max_jobs=20, driver_pool=None,
+                        wait_timeout=DEFAULT_WAIT_TIMEOUT, html_parser=DEFAULT_HTML_PARSER, governor=None):
     """
     사람인 채용 페이지에서 채용 정보를 크롤링하는 함수
+
+    engine='http' 이면 Chrome 없이 정적 HTML만 받아서 파싱하고,
+    정적 HTML에 .item_recruit 요소가 없을 때만 Selenium으로 전환한다.
+    max_jobs=None 이면 페이지의 모든 채용공고를 반환한다.
+    driver_pool(WebDriverPool)을 넘기면 Chrome을 매번 새로 띄우지 않고 재사용한다.
+    wait_timeout 은 Selenium에서 채용공고 리스트를 기다리는 최대 시간(초)이다.
+    html_parser 는 HTML 파싱 백엔드('html.parser', 'lxml', 'selectolax')이다.
+    governor(RequestGovernor)를 넘기면 요청 속도 조절/재시도를 맡기고, 끝내 실패하면 빈 리스트 대신 예외를 올린다.
     """
-    # Chrome 옵션 설정
+    if engine == 'http':
+        jobs = scrape_saramin_jobs_http(url, max_jobs=max_jobs, html_parser=html_parser, governor=governor)
+        if jobs is not None:
+            return jobs
+        print("정적 HTML에서 채용공고를 찾지 못해 Selenium으로 전환합니다.")
+    elif engine != 'selenium':
+        raise ValueError(f"지원하지 않는 엔진입니다: {engine}")
+
+    return scrape_saramin_jobs_selenium(url, max_jobs=max_jobs, driver_pool=driver_pool,
+                                       wait_timeout=wait_timeout, html_parser=html_parser, governor=governor)
+
+def scrape_saramin_jobs_http(url, session=None, max_jobs=20, html_parser=DEFAULT_HTML_PARSER, governor=None):
+    """
+    requests + HTML 파서로 채용 정보를 크롤링하는 함수
+    정적 HTML에 .item_recruit 요소가 없으면 None 반환 (Selenium 전환 신호)
+    governor 가 있으면 요청을 governor 로 보내고 재시도 후에도 실패하면 예외를 올린다.
+    """
+    metrics.increment('pages_total', engine='http')
+    if governor is not None:
+        page = governed_fetch_page(url, governor, session=session)
+    else:
+        try:
+            page = fetch_page(url, session=session)
+        except Exception as e:
+            metrics.increment('swallowed_exceptions_total', site='http_fetch', exception=type(e).__name__)
+            print(f"크롤링 중 오류 발생: {e}")
+            return []
+
+    # 본문이 바뀌지 않았으면 이전 추출 결과를 그대로 사용 (파싱 생략)
+    cache = _http_cache
+    parse_key = f'{html_parser}:{extractor_version()}'
+    if cache is not None and not page.changed:
+        jobs = cache.get_parsed(url, page.content_hash, parse_key)
+        if jobs is not None:
+            metrics.increment('parse_skipped_total', engine='http')
+            return jobs if max_jobs is None else jobs[:max_jobs]
+
+    root = parse_html(page.text, html_parser)
+    containers = find_job_containers(root, generic_fallback=False)
+    if not containers:
+        metrics.increment('selector_hits_total', engine='http', selector='none')
+        return None
+
+    metrics.increment('selector_hits_total', engine='http', selector=JOB_LIST_SELECTORS[0])
+    print(f"채용공고 {len(containers)}개 발견 (HTTP 엔진)")
+
+    if cache is None:
+        return extract_jobs_from_containers(containers, max_jobs)
+
+    jobs = extract_jobs_from_containers(containers)
+    cache.set_parsed(url, page.content_hash, parse_key, jobs)
+    return jobs if max_jobs is None else jobs[:max_jobs]
+
+def scrape_cached_pages(cache, html_parser=DEFAULT_HTML_PARSER, path_prefix=SEARCH_PATH_PREFIX,
+                        workers=None, chunksize=8, normalize=False):
+    """
+    캐시에 저장된 검색 결과 페이지를 네트워크 요청 없이 다시 파싱
+
+    셀렉터/추출 로직을 고친 뒤 다시 받지 않고 결과를 확인할 때 사용한다.
+    workers 를 2 이상으로 주면 프로세스 풀에서 파싱한다 (parse_pages 참고).
+    같은 링크의 공고는 한 번만 포함한다.
+    추출 결과는 HTTP 엔진과 같은 parse_key 로 저장하므로 같은 규칙(generic_fallback=False)으로 파싱하고,
+    .item_recruit 가 없는 페이지는 저장하지 않는다 (HTTP 엔진이 다음에 Selenium 으로 전환할 수 있도록).
+    """
+    parse_key = f'{html_parser}:{extractor_version()}'
+
+    def page_results():
+        for url, html, jobs, records in parse_pages(cache.iter_pages(path_prefix), html_parser,
+                                                    workers, chunksize, normalize, generic_fallback=False):
+            if jobs is None:
+                metrics.increment('selector_hits_total', engine='cache', selector='none')
+                continue
+            cache.set_parsed(url, content_hash(html), parse_key, jobs)
+            yield records if normalize else jobs
+
+    return list(iter_unique_jobs(page_results()))
+
+def iter_html_files(paths):
+    """HTML 파일/디렉터리(안의 *.html) 경로 목록에서 (경로, HTML) 을 이름 순서대로 반환"""
+    for path in paths:
+        if os.path.isdir(path):
+            filenames = sorted(os.path.join(path, name) for name in os.listdir(path) if name.endswith('.html'))
+        else:
+            filenames = [path]
+        for filename in filenames:
+            with open(filename, encoding='utf-8') as f:
+                yield filename, f.read()
+
+def _parse_page_batch(pages, html_parser, normalize, generic_fallback=True):
+    """
+    프로세스 풀 작업 단위: (url, html) 묶음에서 채용공고를 추출
+
+    반환값: 페이지마다 (추출 결과, 정리된 레코드 또는 None)
+    generic_fallback=False 에서 채용공고 컨테이너가 없는 페이지는 (None, None) 이다.
+    """
+    results = []
+    for _, html in pages:
+        containers = find_job_containers(parse_html(html, html_parser), generic_fallback=generic_fallback)
+        if not containers and not generic_fallback:
+            results.append((None, None))
+            continue
+        jobs = extract_jobs_from_containers(containers)
+        records = None
+        if normalize:
+            records = normalize_jobs_df(pd.DataFrame(jobs, columns=JOB_COLUMNS)).to_dict('records') if jobs else []
+        results.append((jobs, records))
+    return results
+
+def parse_pages(pages, html_parser=DEFAULT_HTML_PARSER, workers=None, chunksize=8, normalize=False,
+                generic_fallback=True):
+    """
+    (url, html) 페이지들을 파싱해서 입력 순서대로 (url, html, 추출 결과, 정리된 레코드) 를 반환하는 제너레이터
+
+    workers 가 2 이상이면 페이지를 chunksize 개씩 묶어 프로세스 풀에서 추출(normalize 면 정리까지)하고,
+    한 번에 workers x 2 묶음까지만 넘겨서 메모리 사용량을 제한한다. 1 이하이면 현재 프로세스에서 처리한다.
+    (프로세스 풀 안에서 센 메트릭은 부모 프로세스의 metrics 에 합쳐지지 않는다)
+    generic_fallback=False 면 .item_recruit 가 없는 페이지의 추출 결과는 None 이다.
+    """
+    pages = iter(pages)
+    batches = iter(lambda: list(islice(pages, chunksize)), [])
+    parse_batch = partial(_parse_page_batch, html_parser=html_parser, normalize=normalize,
+                          generic_fallback=generic_fallback)
+
+    if not workers or workers <= 1:
+        for batch in batches:
+            for (url, html), (jobs, records) in zip(batch, parse_batch(batch)):
+                yield url, html, jobs, records
+        return
+
+    pending = deque()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        try:
+            for batch in batches:
+                pending.append((batch, executor.submit(parse_batch, batch)))
+                if len(pending) >= workers * 2:
+                    break
+            while pending:
+                batch, future = pending.popleft()
+                results = future.result()
+                for next_batch in batches:
+                    pending.append((next_batch, executor.submit(parse_batch, next_batch)))
+                    break
+                for (url, html), (jobs, records) in zip(batch, results):
+                    metrics.increment('cards_kept_total', len(jobs or []), source='process_pool')
+                    yield url, html, jobs, records
+        finally:
+            for _, future in pending:
+                future.cancel()
+
+def replay_html_files(paths, html_parser=DEFAULT_HTML_PARSER, workers=None, chunksize=8, normalize=False):
+    """저장해 둔 HTML 파일들을 다시 파싱 (같은 링크의 공고는 한 번만 포함)"""
+    page_results = (records if normalize else jobs
+                    for _, _, jobs, records in parse_pages(iter_html_files(paths), html_parser,
+                                                           workers, chunksize, normalize))
+    return list(iter_unique_jobs(page_results))
+
+_chromedriver_path = None
+_chromedriver_lock = threading.Lock()
+
+
+def get_chromedriver_path():
+    """ChromeDriver 경로를 한 번만 확인하고 캐시"""
+    global _chromedriver_path
+    with _chromedriver_lock:
+        if _chromedriver_path is None:
+            _chromedriver_path = ChromeDriverManager().install()
+        return _chromedriver_path
+
+def configure_browser(headless=True, resource_blocker=None):
+    """
+    이후 생성되는 Chrome 웹드라이버 설정
+
+    headless=False 면 브라우저 창을 띄우고(디버깅용), resource_blocker(ResourceBlocker)를 주면
+    이미지/폰트/광고 스크립트 등의 요청을 차단하고 페이지별 차단 요청 수와 전송량을 기록한다.
+    """
+    global _headless, _resource_blocker
+    _headless = headless
+    _resource_blocker = resource_blocker
+
+
+class ResourceBlocker:
+    """
+    Selenium 엔진에서 불필요한 리소스 요청을 차단하는 설정
+
+    block_types 의 리소스(image/font/media)는 Chrome 설정(prefs)과 DevTools(Network.setBlockedURLs)로,
+    deny_patterns 의 URL(광고/트래커 등)은 DevTools 로 차단한다.
+    unblock_patterns 는 차단 목록에서 뺄 패턴이다. 요청 URL 이 아니라 차단 패턴 문자열과
+    정확히 같은 항목만 빠지므로 blocked_patterns() 에 있는 패턴을 그대로 지정해야 한다.
+    패턴은 DevTools 형식('*' 와일드카드)이다.
+    """
+
+    def __init__(self, block_types=None, deny_patterns=None, unblock_patterns=None):
+        self.block_types = list(DEFAULT_BLOCKED_RESOURCE_TYPES if block_types is None else block_types)
+        self.deny_patterns = DEFAULT_BLOCKED_URL_PATTERNS + list(deny_patterns or [])
+        self.unblock_patterns = set(unblock_patterns or [])
+        unknown = self.unblock_patterns.difference(self.blocked_patterns())
+        if unknown:
+            raise ValueError(f"차단 목록에 없는 패턴입니다: {', '.join(sorted(unknown))}")
+
+    def blocked_patterns(self):
+        """unblock_patterns 를 빼기 전의 차단 패턴 목록 (중복 제거, 순서 유지)"""
+        patterns = []
+        for resource_type in self.block_types:
+            patterns.extend(BLOCKABLE_RESOURCE_PATTERNS[resource_type])
+        patterns.extend(self.deny_patterns)
+        return list(dict.fromkeys(patterns))
+
+    def url_patterns(self):
+        """Network.setBlockedURLs 에 넘길 패턴 목록"""
+        return [pattern for pattern in self.blocked_patterns() if pattern not in self.unblock_patterns]
+
+    def chrome_prefs(self):
+        """Chrome 콘텐츠 설정 (이미지 로딩과 알림/팝업 차단)"""
+        prefs = {
+            'profile.default_content_setting_values.notifications': 2,
+            'profile.default_content_setting_values.popups': 2,
+        }
+        if 'image' in self.block_types and not self.unblock_patterns & set(BLOCKABLE_RESOURCE_PATTERNS['image']):
+            prefs['profile.managed_default_content_settings.images'] = 2
+        return prefs
+
+    def apply(self, driver):
+        """드라이버에 DevTools 요청 차단 적용 (같은 탭에서는 페이지를 이동해도 유지됨)"""
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': self.url_patterns()})
+
+
+def build_chrome_options(headless=None, resource_blocker=None):
+    """Chrome 옵션 설정 (기본값은 configure_browser 로 설정한 값)"""
+    headless = _headless if headless is None else headless
+    resource_blocker = resource_blocker or _resource_blocker
+
     chrome_options = Options()
-    # chrome_options.add_argument('--headless')  # 디버깅을을 띄우지 않음
+    if headless:
+        chrome_options.add_argument('--headless=new')
+        chrome_options.add_argument('--window-size=1920,1080')
     chrome_options.add_argument('--no-sandbox')
     chrome_options.add_argument('--disable-dev-shm-usage')
-    chrome_options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36')
-    
+    chrome_options.add_argument(f'--user-agent={USER_AGENT}')
+    if resource_blocker is not None:
+        chrome_options.add_experimental_option('prefs', resource_blocker.chrome_prefs())
+        # 차단/전송 요청 집계를 위해 DevTools 네트워크 이벤트를 성능 로그로 받음
+        chrome_options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+    return chrome_options
+
+def create_driver():
+    """새 Chrome 웹드라이버 생성"""
+    with metrics.timer('driver_start_seconds'):
+        service = Service(get_chromedriver_path())
+        driver = webdriver.Chrome(service=service, options=build_chrome_options())
+        if _resource_blocker is not None:
+            try:
+                _resource_blocker.apply(driver)
+            except Exception as e:
+                metrics.increment('swallowed_exceptions_total', site='resource_blocking', exception=type(e).__name__)
+                print(f"리소스 차단 설정 실패 - 차단 없이 진행합니다: {e}")
+        return driver
+
+def _proc_children():
+    """/proc 에서 {부모 pid: [자식 pid, ...]} 수집 (psutil 이 없을 때 사용)"""
+    children = {}
+    for name in os.listdir('/proc'):
+        if not name.isdigit():
+            continue
+        try:
+            with open(f'/proc/{name}/stat') as f:
+                # comm 에 공백/괄호가 있을 수 있으므로 마지막 ')' 뒤부터 읽음 (state, ppid, ...)
+                ppid = int(f.read().rsplit(')', 1)[1].split()[1])
+        except (OSError, ValueError, IndexError):
+            continue
+        children.setdefault(ppid, []).append(int(name))
+    return children
+
+def process_tree_rss_mb(pid):
+    """pid 프로세스와 모든 자식 프로세스의 상주 메모리(RSS) 합계 (MB) - 확인할 수 없으면 None"""
+    if pid is None:
+        return None
+    if psutil is not None:
+        try:
+            root = psutil.Process(pid)
+            processes = [root] + root.children(recursive=True)
+        except psutil.Error:
+            return None
+        total = 0
+        for process in processes:
+            try:
+                total += process.memory_info().rss
+            except psutil.Error:
+                pass
+        return total / (1024 * 1024)
     try:
+        children = _proc_children()
+    except OSError:
+        return None
+    total, stack = 0, [pid]
+    while stack:
+        current = stack.pop()
+        try:
+            with open(f'/proc/{current}/statm') as f:
+                total += int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+        except (OSError, ValueError):
+            if current == pid:
+                return None
+            continue
+        stack.extend(children.get(current, []))
+    return total / (1024 * 1024)
+
+def drain_performance_log(driver):
+    """지금까지 쌓인 성능 로그(DevTools 이벤트)를 비우고 [(method, params), ...] 로 반환"""
+    try:
+        entries = driver.get_log('performance')
+    except Exception:
+        return []
+    events = []
+    for entry in entries:
+        message = json.loads(entry['message']).get('message', {})
+        events.append((message.get('method'), message.get('params', {})))
+    return events
+
+def summarize_network_events(events):
+    """
+    DevTools 네트워크 이벤트에서 페이지의 요청/차단/전송량 집계
+
+    반환값: {'requests', 'blocked', 'blocked_by_type', 'transferred_bytes'}
+    차단된 요청은 응답을 받지 않으므로 바이트 수 대신 요청 수(종류별)만 집계한다.
+    """
+    types = {}
+    summary = {'requests': 0, 'blocked': 0, 'blocked_by_type': {}, 'transferred_bytes': 0}
+    for method, params in events:
+        if method == 'Network.requestWillBeSent':
+            summary['requests'] += 1
+            types[params.get('requestId')] = params.get('type', 'Other')
+        elif method == 'Network.loadingFinished':
+            summary['transferred_bytes'] += int(params.get('encodedDataLength') or 0)
+        elif method == 'Network.loadingFailed' and params.get('blockedReason'):
+            resource_type = params.get('type') or types.get(params.get('requestId'), 'Other')
+            summary['blocked'] += 1
+            summary['blocked_by_type'][resource_type] = summary['blocked_by_type'].get(resource_type, 0) + 1
+    return summary
+
+def record_page_resources(driver, url):
+    """페이지를 연 뒤 차단/전송 요청을 집계해서 기록 (리소스 차단을 켠 경우만)"""
+    if _resource_blocker is None:
+        return None
+    summary = summarize_network_events(drain_performance_log(driver))
+    for resource_type, count in summary['blocked_by_type'].items():
+        metrics.increment('blocked_requests_total', count, type=resource_type)
+    metrics.increment('page_requests_total', summary['requests'], engine='selenium')
+    metrics.increment('page_transfer_bytes_total', summary['transferred_bytes'], engine='selenium')
+    page_resource_stats.append(dict(summary, url=url))
+    print(f"요청 {summary['requests']}개 중 {summary['blocked']}개 차단, "
+          f"전송 {summary['transferred_bytes'] / 1024:.1f}KB")
+    return summary
+
+
+class WebDriverPool:
+    """
+    오래 유지되는 Chrome 웹드라이버 풀
+
+    드라이버는 필요할 때 최대 size개까지 생성되고, 사용 후 상태를 초기화해서 재사용한다.
+    오류가 난 드라이버나 max_pages / max_memory_mb 를 넘긴 드라이버는 새로 만든다.
+    """
+
+    def __init__(self, size=2, max_pages=50, max_memory_mb=512):
+        self.size = size
+        self.max_pages = max_pages
+        self.max_memory_mb = max_memory_mb
+        self._idle = queue.LifoQueue()
+        self._slots = threading.Semaphore(size)
+        self._page_counts = {}
+        self._lock = threading.Lock()
+        self._closed = False
+
+    @contextmanager
+    def driver(self):
+        """풀에서 드라이버를 하나 빌려오는 컨텍스트 매니저"""
+        driver = self.acquire()
+        try:
+            yield driver
+        except Exception:
+            self.release(driver, broken=True)
+            raise
+        else:
+            self.release(driver)
+
+    def acquire(self):
+        """유휴 드라이버를 꺼내거나 새로 생성"""
+        if self._closed:
+            raise RuntimeError("이미 종료된 드라이버 풀입니다.")
+        self._slots.acquire()
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        try:
+            driver = create_driver()
+        except Exception:
+            self._slots.release()
+            raise
+        with self._lock:
+            self._page_counts[id(driver)] = 0
+        return driver
+
+    def release(self, driver, broken=False):
+        """드라이버를 초기화해서 풀에 반납 (문제가 있으면 폐기)"""
+        try:
+            with self._lock:
+                self._page_counts[id(driver)] = self._page_counts.get(id(driver), 0) + 1
+                page_count = self._page_counts[id(driver)]
+
+            if self._closed or broken or page_count >= self.max_pages:
+                self._discard(driver)
+                return
+
+            # 초기화(about:blank) 전에 측정해야 방금 처리한 페이지까지 포함한 사용량이 나옴
+            memory_mb = self._memory_mb(driver)
+            if memory_mb is not None and memory_mb >= self.max_memory_mb:
+                metrics.increment('driver_recycles_total', reason='memory')
+                self._discard(driver)
+                return
+
+            try:
+                self._reset(driver)
+            except Exception:
+                self._discard(driver)
+                return
+
+            self._idle.put(driver)
+        finally:
+            self._slots.release()
+
+    def close(self):
+        """풀의 모든 드라이버 종료"""
+        self._closed = True
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._discard(driver)
+
+    def _reset(self, driver):
+        """다음 페이지를 위해 쿠키/스토리지/추가 창 정리"""
+        handles = driver.window_handles
+        for handle in handles[1:]:
+            driver.switch_to.window(handle)
+            driver.close()
+        driver.switch_to.window(handles[0])
+        driver.delete_all_cookies()
+        driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+        driver.get('about:blank')
+
+    def _memory_mb(self, driver):
+        """chromedriver 와 그 아래 Chrome(브라우저/렌더러/GPU 등) 프로세스의 RSS 합계 (MB, 확인할 수 없으면 None)"""
+        process = getattr(getattr(driver, 'service', None), 'process', None)
+        return process_tree_rss_mb(getattr(process, 'pid', None))
+
+    def _discard(self, driver):
+        with self._lock:
+            self._page_counts.pop(id(driver), None)
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+def scrape_saramin_jobs_selenium(url, max_jobs=20, driver_pool=None, wait_timeout=DEFAULT_WAIT_TIMEOUT,
+                                html_parser=DEFAULT_HTML_PARSER, governor=None):
+    """
+    Selenium(Chrome)으로 채용 정보를 크롤링하는 함수
+    driver_pool 이 주어지면 풀의 드라이버를 재사용하고, 없으면 1회용 드라이버를 띄운다.
+    governor 가 있으면 WebDriver 오류를 재시도하고, 끝내 실패하면 예외를 올린다.
+    (페이지 로딩과 리스트 대기를 합친 시간이 wait_timeout 을 넘으면 느린 응답으로 본다)
+    """
+    def scrape():
+        if driver_pool is not None:
+            with driver_pool.driver() as driver:
+                return scrape_jobs_with_driver(driver, url, max_jobs, wait_timeout, html_parser)
+
         # 웹드라이버 초기화
-        service = Service(ChromeDriverManager().install())
-        driver = webdriver.Chrome(service=service, options=chrome_options)
+        driver = create_driver()
+        try:
+            return scrape_jobs_with_driver(driver, url, max_jobs, wait_timeout, html_parser)
+        finally:
+            driver.quit()
+
+    if governor is not None:
+        return governor.request(url, scrape, retry_on=(WebDriverException,), latency_target=wait_timeout)
+    try:
+        return scrape()
+    except Exception as e:
+        metrics.increment('swallowed_exceptions_total', site='selenium_scrape', exception=type(e).__name__)
+        print(f"크롤링 중 오류 발생: {e}")
+        return []
+
+def wait_for_job_list(driver, timeout=DEFAULT_WAIT_TIMEOUT, poll_interval=0.1, stable_polls=3):
+    """
+    채용공고 리스트가 준비될 때까지 대기하고 실제 대기 시간(초)을 반환
+
+    .item_recruit 가 나타나면 바로 반환하고, 없으면 대체 셀렉터의 요소 수가
+    stable_polls 번 연속 변하지 않을 때(문서 로딩 완료 후) 준비된 것으로 본다.
+    timeout 안에 준비되지 않아도 예외 없이 현재 상태로 진행한다.
+    """
+    state = {'count': -1, 'stable': 0}
+    fallback_selector = ', '.join(JOB_LIST_SELECTORS[1:])
+
+    def job_list_ready(d):
+        if d.find_elements(By.CSS_SELECTOR, JOB_LIST_SELECTORS[0]):
+            return True
+        if d.execute_script("return document.readyState") != 'complete':
+            return False
+        count = len(d.find_elements(By.CSS_SELECTOR, fallback_selector))
+        if count and count == state['count']:
+            state['stable'] += 1
+        else:
+            state['stable'] = 0
+        state['count'] = count
+        return state['stable'] >= stable_polls
+
+    start = time.monotonic()
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=poll_interval).until(job_list_ready)
+        ready = True
+    except TimeoutException:
+        ready = False
+    waited = time.monotonic() - start
+
+    page_wait_times.append({'url': driver.current_url, 'waited': round(waited, 3), 'ready': ready})
+    metrics.observe('page_wait_seconds', waited, ready=ready)
+    if not ready:
+        print(f"페이지 로딩 대기 시간 초과 ({timeout}초) - 현재 상태로 추출합니다.")
+    return waited
+
+def scrape_jobs_with_driver(driver, url, max_jobs=20, wait_timeout=DEFAULT_WAIT_TIMEOUT,
+                            html_parser=DEFAULT_HTML_PARSER):
+    """이미 생성된 웹드라이버로 페이지를 열고 채용 정보 추출"""
+    metrics.increment('pages_total', engine='selenium')
+    if _resource_blocker is not None:
+        # 이전 페이지(about:blank 초기화 포함)의 네트워크 이벤트는 버림
+        drain_performance_log(driver)
+    with metrics.timer('page_load_seconds', engine='selenium'):
         driver.get(url)
+    
+    # 채용공고 리스트가 나타날 때까지 대기
+    wait_for_job_list(driver, timeout=wait_timeout)
+    record_page_resources(driver, url)
+    
+    jobs = []
+    
+    # 채용 공고 리스트 찾기
+    job_elements = []
+    for selector in JOB_LIST_SELECTORS:
+        try:
+            job_elements = driver.find_elements(By.CSS_SELECTOR, selector)
+            if job_elements:
+                metrics.increment('selector_hits_total', engine='selenium', selector=selector)
+                print(f"채용공고 {len(job_elements)}개 발견 (셀렉터: {selector})")
+                break
+        except Exception as e:
+            metrics.increment('swallowed_exceptions_total', site='selenium_find_elements', exception=type(e).__name__)
+            continue
+    
+    if not job_elements:
+        # 페이지 소스를 HTML 파서로 파싱
+        root = parse_html(driver.page_source, html_parser)
         
-        # 페이지 로딩 대기
-        time.sleep(3)
-        
-        jobs = []
-        
-        # 채용 공고 리스트 찾기
-        job_selectors = [
-            '.item_recruit',
-            '.list_item',
-            '[class*="recruit"]',
-            '[class*="item"]'
-        ]
-        
-        job_elements = []
-        for selector in job_selectors:
-            try:
-                job_elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                if job_elements:
-                    print(f"채용공고 {len(job_elements)}개 발견 (셀렉터: {selector})")
-                    break
-            except:
-                continue
+        # 사람인 특정 구조 찾기
+        containers = find_job_containers(root)
+        metrics.increment('selector_hits_total', engine='selenium',
+                          selector=f'{html_parser}:generic' if containers else 'none')
         
-        if not job_elements:
-            # BeautifulSoup으로 페이지 파싱
-            soup = BeautifulSoup(driver.page_source, 'html.parser')
-            
-            # 사람인 특정 구조 찾기
-            containers = soup.find_all(['div'], class_=lambda x: x and any(
-                keyword in x.lower() for keyword in ['item', 'recruit', 'job', 'list']
-            ))
-            
-            print(f"BeautifulSoup으로 {len(containers)}개 컨테이너 발견")
-            
-            for container in containers:  # 모든 컨테이너 처리
-                try:
-                    job_info = extract_job_info_from_soup(container)
-                    if job_info['title'] and len(jobs) < 20:  # 제목이 있고 20개 미만인 경우만 추가
-                        jobs.append(job_info)
-                except Exception as e:
-                    continue
+        print(f"{html_parser} 파서로 {len(containers)}개 컨테이너 발견")
         
+        jobs = extract_jobs_from_containers(containers, max_jobs)
+    
+    else:
+        # 브라우저 안에서 모든 카드를 한 번에 추출 (실패하면 요소별 추출로 대체)
+        try:
+            job_infos = extract_jobs_with_script(driver, selector)
+        except Exception as e:
+            metrics.increment('swallowed_exceptions_total', site='selenium_script', exception=type(e).__name__)
+            print(f"스크립트 일괄 추출 실패, 요소별 추출로 전환합니다: {e}")
+            job_infos = None
+
+        if job_infos is not None:
+            for job_info in job_infos:
+                keep_job(jobs, job_info, max_jobs, source='selenium_script')
         else:
             # Selenium으로 채용 정보 추출
             for element in job_elements:  # 모든 요소 처리
                 try:
                     job_info = extract_job_info_from_selenium(element)
-                    if job_info['title'] and len(jobs) < 20:  # 제목이 있고 20개 미만인 경우만 추가
-                        jobs.append(job_info)
                 except Exception as e:
+                    metrics.increment('swallowed_exceptions_total', site='selenium_card', exception=type(e).__name__)
                     continue
-        
-        driver.quit()
-        return jobs
-        
-    except Exception as e:
-        print(f"크롤링 중 오류 발생: {e}")
-        if 'driver' in locals():
-            driver.quit()
-        return []
+                keep_job(jobs, job_info, max_jobs, source='selenium_element')
+    
+    return jobs
+
+def keep_job(jobs, job_info, max_jobs, source):
+    """제목이 있고 최대 개수 미만인 경우만 jobs 에 추가하고 카드 수/제외 사유를 집계"""
+    metrics.increment('cards_parsed_total', source=source)
+    if not job_info['title']:
+        metrics.increment('cards_dropped_total', source=source, reason='no_title')
+        return False
+    if max_jobs is not None and len(jobs) >= max_jobs:
+        metrics.increment('cards_dropped_total', source=source, reason='max_jobs')
+        return False
+    jobs.append(job_info)
+    metrics.increment('cards_kept_total', source=source)
+    return True
+
+def build_search_url(keyword, page=1, page_count=40, base_url=SARAMIN_BASE_URL):
+    """검색 키워드와 페이지 번호로 사람인 검색 URL 생성 (base_url 로 로컬 대체 서버 지정 가능)"""
+    params = {
+        'searchType': 'search',
+        'searchword': keyword,
+        'recruitPage': page,
+        'recruitPageCount': page_count,
+    }
+    return f"{base_url}/zf_user/search/recruit?{urlencode(params)}"
+
+def crawl_saramin_jobs(keywords, pages=range(1, 11), engine='http', max_workers=4,
+                       requests_per_second=2.0, page_count=40, wait_timeout=DEFAULT_WAIT_TIMEOUT,
+                       html_parser=DEFAULT_HTML_PARSER, base_url=SARAMIN_BASE_URL, governor=None,
+                       failed_urls=None):
+    """
+    여러 키워드 x 여러 페이지를 병렬로 크롤링하여 하나의 채용공고 리스트로 병합
+
+    max_workers 로 동시 작업 수를, requests_per_second 로 호스트별 시작 요청 속도를 정한다
+    (이후 속도는 governor 가 응답에 따라 조절). 결과는 (키워드, 페이지) 순서를 유지하며
+    같은 링크의 공고는 한 번만 포함한다. 재시도 후에도 실패한 페이지는 failed_urls 에 추가된다.
+    """
+    urls = [build_search_url(keyword, page, page_count, base_url) for keyword in keywords for page in pages]
+    print(f"총 {len(urls)}개 페이지 크롤링 시작 (동시 작업: {max_workers})")
+    page_results = iter_crawl_pages(urls, engine=engine, max_workers=max_workers,
+                                    requests_per_second=requests_per_second,
+                                    wait_timeout=wait_timeout, html_parser=html_parser,
+                                    governor=governor, failed_urls=failed_urls)
+    return list(iter_unique_jobs(page_results))
+
+def iter_crawl_pages(urls, engine='http', max_workers=4, requests_per_second=2.0,
+                     wait_timeout=DEFAULT_WAIT_TIMEOUT, html_parser=DEFAULT_HTML_PARSER, max_pending=None,
+                     governor=None, failed_urls=None):
+    """
+    URL 목록을 병렬로 크롤링하면서 페이지별 채용공고 리스트를 URL 순서대로 하나씩 반환하는 제너레이터
+
+    동시에 요청 중이거나 결과를 기다리는 페이지는 max_pending 개(기본 max_workers x 2)까지만 두고,
+    소비하는 쪽이 결과를 가져가야 다음 URL 을 요청한다 (소비가 느리면 크롤링도 멈춤).
+    요청은 governor(없으면 새로 생성)를 거치며, 재시도 후에도 실패한 페이지는 빈 리스트로 반환하고
+    failed_urls 에 추가한다. circuit breaker 가 크롤링을 중단하면 CircuitOpenError 를 올린다.
+    """
+    governor = governor or RequestGovernor(requests_per_second, max_concurrency=max_workers)
+    max_pending = max_pending or max_workers * 2
+    # 드라이버는 Selenium이 실제로 필요할 때만 생성된다
+    driver_pool = WebDriverPool(size=max_workers)
+
+    def fetch(url):
+        try:
+            return scrape_saramin_jobs(url, engine=engine, max_jobs=None, driver_pool=driver_pool,
+                                       wait_timeout=wait_timeout, html_parser=html_parser, governor=governor)
+        except CircuitOpenError:
+            raise
+        except Exception as e:
+            metrics.increment('pages_failed_total', engine=engine, exception=type(e).__name__)
+            print(f"페이지 수집 실패 ({url}): {e}")
+            if failed_urls is not None:
+                failed_urls.append(url)
+            return []
+
+    urls = iter(urls)
+    pending = deque()
+    with driver_pool, ThreadPoolExecutor(max_workers=max_workers) as executor:
+        try:
+            for url in urls:
+                pending.append(executor.submit(fetch, url))
+                if len(pending) >= max_pending:
+                    break
+            while pending:
+                page_jobs = pending.popleft().result()
+                for url in urls:
+                    pending.append(executor.submit(fetch, url))
+                    break
+                yield page_jobs
+        finally:
+            # 소비하는 쪽이 중간에 멈추면 아직 시작하지 않은 요청은 취소
+            for future in pending:
+                future.cancel()
+
+def iter_unique_jobs(page_results):
+    """페이지별 결과를 순서대로 펼치면서 같은 링크의 공고는 처음 한 번만 반환"""
+    seen_links = set()
+    for page_jobs in page_results:
+        for job in page_jobs:
+            if job['link']:
+                if job['link'] in seen_links:
+                    continue
+                seen_links.add(job['link'])
+            yield job
 
 def extract_job_info_from_selenium(element):
     """Selenium 요소에서 채용 정보 추출"""
@@ -118,7 +911,8 @@ def extract_job_info_from_selenium(element):
                     # 링크도 함께 추출
                     job_info['link'] = title_elem.get_attribute('href') or ''
                     break
-            except:
+            except Exception as e:
+                metrics.increment('swallowed_exceptions_total', site='selenium_title', exception=type(e).__name__)
                 continue
         
         # 회사명 추출
@@ -129,7 +923,8 @@ def extract_job_info_from_selenium(element):
                 if company_elem.text.strip():
                     job_info['company'] = company_elem.text.strip()
                     break
-            except:
+            except Exception as e:
+                metrics.increment('swallowed_exceptions_total', site='selenium_company', exception=type(e).__name__)
                 continue
         
         # 지역 추출
@@ -141,7 +936,8 @@ def extract_job_info_from_selenium(element):
                 if text and ('서울' in text or '경기' in text or '부산' in text or '지역' in text or '구' in text):
                     job_info['location'] = text
                     break
-            except:
+            except Exception as e:
+                metrics.increment('swallowed_exceptions_total', site='selenium_location', exception=type(e).__name__)
                 continue
         
         # 경력 추출
@@ -153,7 +949,8 @@ def extract_job_info_from_selenium(element):
                 if text and ('경력' in text or '신입' in text or '년' in text):
                     job_info['experience'] = text
                     break
-            except:
+            except Exception as e:
+                metrics.increment('swallowed_exceptions_total', site='selenium_experience', exception=type(e).__name__)
                 continue
         
         # 학력 추출
@@ -165,7 +962,8 @@ def extract_job_info_from_selenium(element):
                 if text and ('학력' in text or '대졸' in text or '고졸' in text or '무관' in text):
                     job_info['education'] = text
                     break
-            except:
+            except Exception as e:
+                metrics.increment('swallowed_exceptions_total', site='selenium_education', exception=type(e).__name__)
                 continue
         
         # 고용형태 추출
@@ -177,7 +975,8 @@ def extract_job_info_from_selenium(element):
                 if text and ('정규직' in text or '계약직' in text or '파트' in text or '인턴' in text):
                     job_info['employment_type'] = text
                     break
-            except:
+            except Exception as e:
+                metrics.increment('swallowed_exceptions_total', site='selenium_employment_type', exception=type(e).__name__)
                 continue
         
 
@@ -191,14 +990,165 @@ def extract_job_info_from_selenium(element):
                 if text and ('~' in text or '마감' in text or 'D-' in text or '/' in text or '상시' in text or '채용시' in text):
                     job_info['deadline'] = text
                     break
-            except:
+            except Exception as e:
+                metrics.increment('swallowed_exceptions_total', site='selenium_deadline', exception=type(e).__name__)
                 continue
                 
     except Exception as e:
-        pass
+        metrics.increment('swallowed_exceptions_total', site='selenium_card', exception=type(e).__name__)
     
     return job_info
 
+# extract_job_info_from_selenium 과 같은 셀렉터/키워드 규칙을 브라우저 안에서 한 번에 실행하는 스크립트
+EXTRACT_JOBS_SCRIPT = r"""
+const cards = document.querySelectorAll(arguments[0]);
+const has = (text, keywords) => keywords.some(k => text.includes(k));
+const firstText = (card, selectors, keywords) => {
+    for (const selector of selectors) {
+        const elem = card.querySelector(selector);
+        if (!elem) continue;
+        const text = (elem.innerText || '').trim();
+        if (text && (!keywords || has(text, keywords))) return text;
+    }
+    return '';
+};
+const jobs = [];
+for (const card of cards) {
+    const job = {
+        title: '', company: '', location: '', experience: '', education: '',
+        employment_type: '', salary: '', deadline: '', link: ''
+    };
+    for (const selector of ['.job_tit a', '.recruit_tit', 'h2 a', '.tit a', 'a[title]']) {
+        const elem = card.querySelector(selector);
+        const text = elem ? (elem.innerText || '').trim() : '';
+        if (text) {
+            job.title = text;
+            job.link = elem.href || elem.getAttribute('href') || '';
+            break;
+        }
+    }
+    job.company = firstText(card, ['.corp_name a', '.company', '.corp', '[class*="company"]']);
+    job.location = firstText(card, ['.job_condition .condition', '.location', '[class*="location"]', '[class*="area"]'],
+                             ['서울', '경기', '부산', '지역', '구']);
+    job.experience = firstText(card, ['.job_condition', '.condition', '[class*="career"]', '[class*="experience"]'],
+                               ['경력', '신입', '년']);
+    job.education = firstText(card, ['.job_condition', '.condition', '[class*="education"]'],
+                              ['학력', '대졸', '고졸', '무관']);
+    job.employment_type = firstText(card, ['.job_condition', '.condition', '[class*="employment"]'],
+                                    ['정규직', '계약직', '파트', '인턴']);
+    job.deadline = firstText(card, ['.job_date', '.date', '[class*="deadline"]', '[class*="dday"]'],
+                             ['~', '마감', 'D-', '/', '상시', '채용시']);
+    jobs.push(job);
+}
+return jobs;
+"""
+
+def extract_jobs_with_script(driver, selector):
+    """execute_script 한 번으로 selector 에 해당하는 모든 카드의 채용 정보 추출"""
+    return driver.execute_script(EXTRACT_JOBS_SCRIPT, selector) or []
+
+class SelectolaxNode:
+    """selectolax 노드를 BeautifulSoup 과 같은 인터페이스(select_one/select/get_text/get)로 감싼 어댑터"""
+
+    __slots__ = ('node',)
+
+    def __init__(self, node):
+        self.node = node
+
+    def select_one(self, selector):
+        if ',' not in selector:
+            found = self._first(selector)
+            return SelectolaxNode(found) if found is not None else None
+        # 셀렉터 목록은 셀렉터마다 첫 매치만 찾고, 그중 문서 순서로 가장 앞선 노드를 반환
+        candidates = {node.mem_id for node in map(self._first, selector.split(',')) if node is not None}
+        if not candidates:
+            return None
+        for node in self.node.traverse():
+            if node.mem_id in candidates:
+                return SelectolaxNode(node)
+        return None
+
+    def _first(self, selector):
+        """자손 중 selector 에 처음 매치되는 selectolax 노드 (자기 자신은 제외)"""
+        found = self.node.css_first(selector.strip())
+        if found is not None and found.mem_id == self.node.mem_id:
+            found = next((node for node in self.node.css(selector.strip()) if node.mem_id != self.node.mem_id), None)
+        return found
+
+    def select(self, selector):
+        # selectolax 는 자기 자신도 매치 대상에 포함하므로 BeautifulSoup 처럼 자손만 남김
+        nodes = [node for node in self.node.css(selector) if node.mem_id != self.node.mem_id]
+        if ',' in selector and len(nodes) > 1:
+            # 셀렉터 목록(a, b)은 셀렉터별로 중복 반환되므로 문서 순서로 한 번씩만 반환
+            matched = {node.mem_id for node in nodes}
+            nodes = [node for node in self.node.traverse() if node.mem_id in matched]
+        return [SelectolaxNode(node) for node in nodes]
+
+    def get_text(self, separator='', strip=False):
+        return self.node.text(deep=True, separator=separator, strip=strip)
+
+    def get(self, name, default=None):
+        value = self.node.attributes.get(name)
+        return default if value is None else value
+
+@lru_cache(maxsize=None)
+def extractor_version():
+    """
+    HTML 추출 로직 버전 (추출 함수 소스/셀렉터/패턴의 해시)
+
+    추출 로직이 바뀌면 값이 달라지므로 캐시에 저장된 이전 추출 결과를 쓰지 않게 된다.
+    """
+    parts = [JOB_LIST_SELECTORS, RESULT_LIST_SELECTORS, GENERIC_CONTAINER_SELECTOR, REGION_NAMES,
+             [pattern.pattern for pattern in EXPERIENCE_PATTERNS + EDUCATION_PATTERNS + EMPLOYMENT_PATTERNS]]
+    for func in [SelectolaxNode, find_job_containers, extract_jobs_from_containers, keep_job,
+                 extract_job_info_from_soup, KeywordClassifier, classify_condition_line]:
+        try:
+            parts.append(inspect.getsource(func))
+        except (OSError, TypeError):
+            parts.append(func.__qualname__)
+    return hashlib.sha1(repr(parts).encode('utf-8')).hexdigest()[:12]
+
+def parse_html(html, html_parser=DEFAULT_HTML_PARSER):
+    """선택한 백엔드로 HTML 을 파싱해서 select/select_one 이 가능한 루트 노드 반환"""
+    if html_parser == 'selectolax':
+        if SelectolaxHTMLParser is None:
+            raise ImportError("selectolax 가 설치되어 있지 않습니다. (pip install selectolax)")
+        return SelectolaxNode(SelectolaxHTMLParser(html).root)
+    if html_parser not in HTML_PARSERS:
+        raise ValueError(f"지원하지 않는 HTML 파서입니다: {html_parser}")
+    return BeautifulSoup(html, html_parser)
+
+def find_job_containers(root, generic_fallback=True):
+    """
+    검색 결과 리스트 영역으로 범위를 좁힌 뒤 채용공고 컨테이너 목록 반환
+
+    .item_recruit 카드가 있으면 그것만 사용하고, 없으면 generic_fallback 일 때
+    클래스명에 item/recruit/job/list 가 들어간 div 전체를 사용한다.
+    """
+    for selector in RESULT_LIST_SELECTORS:
+        result_list = root.select_one(selector)
+        if result_list is not None:
+            root = result_list
+            break
+
+    containers = root.select(JOB_LIST_SELECTORS[0])
+    if containers or not generic_fallback:
+        return containers
+
+    return root.select(GENERIC_CONTAINER_SELECTOR)
+
+def extract_jobs_from_containers(containers, max_jobs=None):
+    """컨테이너 목록에서 채용 정보를 추출 (제목이 없는 컨테이너는 제외)"""
+    jobs = []
+    for container in containers:  # 모든 컨테이너 처리
+        try:
+            job_info = extract_job_info_from_soup(container)
+        except Exception as e:
+            metrics.increment('swallowed_exceptions_total', site='soup_card', exception=type(e).__name__)
+            continue
+        keep_job(jobs, job_info, max_jobs, source='soup')
+    return jobs
+
 def extract_job_info_from_soup(container):
     """BeautifulSoup 요소에서 채용 정보 추출"""
     job_info = {
@@ -222,7 +1172,7 @@ def extract_job_info_from_soup(container):
                 job_info['title'] = title_elem.get_text(strip=True)
                 job_info['link'] = title_elem.get('href', '')
                 if job_info['link'] and not job_info['link'].startswith('http'):
-                    job_info['link'] = 'https://www.saramin.co.kr' + job_info['link']
+                    job_info['link'] = SARAMIN_BASE_URL + job_info['link']
                 break
         
         # 회사명 추출
@@ -248,23 +1198,12 @@ def extract_job_info_from_soup(container):
         lines = [line.strip() for line in condition_text.split('\n') if line.strip()]
         
         for line in lines:
-            # 지역 정보 (시/구 포함)
-            if not job_info['location'] and any(keyword in line for keyword in ['서울', '경기', '부산', '대구', '인천', '광주', '대전', '울산', '세종', '강원', '충북', '충남', '전북', '전남', '경북', '경남', '제주']):
-                job_info['location'] = line
-            
-            # 경력 정보 (년수 관련)
-            elif not job_info['experience'] and ('경력' in line or '신입' in line or ('년' in line and ('이상' in line or '~' in line))):
-                job_info['experience'] = line
-            
-            # 학력 정보
-            elif not job_info['education'] and ('학력' in line or '대졸' in line or '고졸' in line or '무관' in line or '초대졸' in line):
-                job_info['education'] = line
-            
-            # 고용형태
-            elif not job_info['employment_type'] and ('정규직' in line or '계약직' in line or '파트' in line or '인턴' in line or '기간제' in line):
-                job_info['employment_type'] = line
-            
-
+            # 한 번의 스캔으로 이 줄이 해당될 수 있는 필드를 찾고 (지역 > 경력 > 학력 > 고용형태 순)
+            # 아직 채워지지 않은 첫 번째 필드에 넣음
+            for field in classify_condition_line(line):
+                if not job_info[field]:
+                    job_info[field] = line
+                    break
         
         # 마감일 추출
         deadline_selectors = ['.job_date', '.date', '.dday']
@@ -277,10 +1216,102 @@ def extract_job_info_from_soup(container):
                     break
                     
     except Exception as e:
-        pass
+        metrics.increment('swallowed_exceptions_total', site='soup_card', exception=type(e).__name__)
     
     return job_info
 
+# 데이터 정리에 쓰는 정규식 (모듈 로드 시 한 번만 컴파일)
+REGION_NAMES = ['서울', '부산', '대구', '인천', '광주', '대전', '울산', '세종', '경기', '강원',
+                '충북', '충남', '전북', '전남', '경북', '경남', '제주']
+METROPOLITAN_CITIES = ['서울', '부산', '대구', '인천', '광주', '대전', '울산']
+
+# 시/구 패턴 (예: "서울 종로구", "경기 성남시")
+CITY_PATTERN = re.compile(r'(' + '|'.join(REGION_NAMES) + r')\s*([가-힣]+시|[가-힣]+구|[가-힣]+군)')
+DATE_PATTERN = re.compile(r'(\d{1,2})/(\d{1,2})')
+
+EXPERIENCE_PATTERNS = [re.compile(pattern) for pattern in [
+    r'경력\s*\d+~?\d*\s*년',   # 경력 1~5년, 경력 3년 등
+    r'경력\s*무관',             # 경력 무관
+    r'신입',                   # 신입
+    r'\d+년\s*이상',           # 3년 이상
+    r'\d+~\d+년',             # 1~5년
+]]
+
+EDUCATION_PATTERNS = [re.compile(pattern) for pattern in [
+    r'[가-힣]*졸',             # 대졸, 고졸, 초대졸 등
+    r'학력\s*무관',            # 학력 무관
+    r'대학교\s*졸업',          # 대학교 졸업
+    r'전문대\s*졸업',          # 전문대 졸업
+]]
+
+EMPLOYMENT_PATTERNS = [re.compile(pattern) for pattern in [
+    r'정규직',
+    r'계약직',
+    r'파트타임',
+    r'인턴',
+    r'기간제',
+    r'프리랜서',
+]]
+
+
+class KeywordClassifier:
+    """
+    (이름, 정규식) 목록을 하나의 정규식으로 합쳐 텍스트를 한 번만 스캔하는 분류기
+
+    모든 위치에서 lookahead 로 매치하므로 키워드가 서로 겹쳐 있어도 빠짐없이 찾고,
+    같은 위치에서 여러 패턴이 매치되면 목록 앞쪽 패턴이 우선한다.
+    """
+
+    def __init__(self, named_patterns):
+        self.names = [name for name, _ in named_patterns]
+        alternatives = '|'.join(f'(?P<{name}>{pattern})' for name, pattern in named_patterns)
+        self.pattern = re.compile(f'(?=(?:{alternatives}))')
+
+    def scan(self, text):
+        """{패턴 이름: 처음 매치된 문자열} 반환"""
+        found = {}
+        for match in self.pattern.finditer(text):
+            name = match.lastgroup
+            if name not in found:
+                found[name] = match.group(name)
+        return found
+
+    def first_match(self, text):
+        """목록에서 가장 앞쪽 패턴의 첫 매치 문자열 (순서대로 re.search 한 것과 같은 결과)"""
+        found = self.scan(text)
+        for name in self.names:
+            if name in found:
+                return found[name]
+        return ''
+
+    @classmethod
+    def from_patterns(cls, patterns):
+        """우선순위 순 정규식 목록으로 분류기 생성"""
+        return cls([(f'p{i}', pattern.pattern) for i, pattern in enumerate(patterns)])
+
+# 조건 텍스트 줄 분류용 키워드 (extract_job_info_from_soup 의 필드 판별 규칙)
+CONDITION_FIELDS = ['location', 'experience', 'education', 'employment_type']
+CONDITION_LINE_CLASSIFIER = KeywordClassifier([
+    ('location', '|'.join(REGION_NAMES)),
+    ('experience', '경력|신입'),
+    ('year', '년'),
+    ('year_qualifier', '이상|~'),  # '년' 과 함께 있으면 경력 정보
+    ('education', '학력|대졸|고졸|무관|초대졸'),
+    ('employment_type', '정규직|계약직|파트|인턴|기간제'),
+])
+
+EXPERIENCE_CLASSIFIER = KeywordClassifier.from_patterns(EXPERIENCE_PATTERNS)
+EDUCATION_CLASSIFIER = KeywordClassifier.from_patterns(EDUCATION_PATTERNS)
+EMPLOYMENT_CLASSIFIER = KeywordClassifier.from_patterns(EMPLOYMENT_PATTERNS)
+
+@lru_cache(maxsize=4096)
+def classify_condition_line(line):
+    """조건 텍스트 한 줄이 해당될 수 있는 필드 목록 (우선순위 순)"""
+    found = CONDITION_LINE_CLASSIFIER.scan(line)
+    if 'year' in found and 'year_qualifier' in found:
+        found['experience'] = found['year']
+    return tuple(field for field in CONDITION_FIELDS if field in found)
+
 def format_deadline(deadline_text):
     """마감일을 m/d 형식으로 변환"""
     if not deadline_text or deadline_text.strip() == '':
@@ -290,8 +1321,7 @@ def format_deadline(deadline_text):
     cleaned_text = deadline_text.replace('~', '').replace('입사지원', '').replace('홈페이지 지원', '').strip()
     
     # 날짜 패턴 찾기 (mm/dd 형식)
-    date_pattern = r'(\d{1,2})/(\d{1,2})'
-    match = re.search(date_pattern, cleaned_text)
+    match = DATE_PATTERN.search(cleaned_text)
     
     if match:
         month = match.group(1)
@@ -322,15 +1352,14 @@ def format_location(location_text):
     
     # 시/구 패턴 찾기
     # 예: "서울 종로구", "경기 성남시 수정구", "부산 해운대구" 등
-    city_pattern = r'(서울|부산|대구|인천|광주|대전|울산|세종|경기|강원|충북|충남|전북|전남|경북|경남|제주)\s*([가-힣]+시|[가-힣]+구|[가-힣]+군)'
-    match = re.search(city_pattern, cleaned_text)
+    match = CITY_PATTERN.search(cleaned_text)
     
     if match:
         province = match.group(1)
         city_or_district = match.group(2)
         
         # 특별시/광역시의 경우 구만 표시
-        if province in ['서울', '부산', '대구', '인천', '광주', '대전', '울산']:
+        if province in METROPOLITAN_CITIES:
             if '구' in city_or_district:
                 return city_or_district
             else:
@@ -349,15 +1378,14 @@ def extract_location_from_experience(experience_text):
         return '', experience_text
     
     # 시/구 패턴 찾기
-    city_pattern = r'(서울|부산|대구|인천|광주|대전|울산|세종|경기|강원|충북|충남|전북|전남|경북|경남|제주)\s*([가-힣]+시|[가-힣]+구|[가-힣]+군)'
-    match = re.search(city_pattern, experience_text)
+    match = CITY_PATTERN.search(experience_text)
     
     if match:
         province = match.group(1)
         city_or_district = match.group(2)
         
         # 지역 정보 추출
-        if province in ['서울', '부산', '대구', '인천', '광주', '대전', '울산']:
+        if province in METROPOLITAN_CITIES:
             if '구' in city_or_district:
                 location = city_or_district
             else:
@@ -366,7 +1394,7 @@ def extract_location_from_experience(experience_text):
             location = f"{city_or_district}"
         
         # experience에서 지역 정보 제거
-        cleaned_experience = re.sub(city_pattern, '', experience_text).strip()
+        cleaned_experience = CITY_PATTERN.sub('', experience_text).strip()
         # 연속된 공백이나 줄바꿈 정리
         cleaned_experience = re.sub(r'\s+', ' ', cleaned_experience).strip()
         
@@ -380,20 +1408,7 @@ def clean_experience_data(text):
         return ''
     
     # 경력 관련 패턴 찾기
-    experience_patterns = [
-        r'경력\s*\d+~?\d*\s*년',  # 경력 1~5년, 경력 3년 등
-        r'경력\s*무관',           # 경력 무관
-        r'신입',                 # 신입
-        r'\d+년\s*이상',         # 3년 이상
-        r'\d+~\d+년',           # 1~5년
-    ]
-    
-    for pattern in experience_patterns:
-        match = re.search(pattern, text)
-        if match:
-            return match.group(0)
-    
-    return ''
+    return EXPERIENCE_CLASSIFIER.first_match(text)
 
 def clean_education_data(text):
     """학력 데이터만 추출 (*졸 or 학력 무관)"""
@@ -401,19 +1416,7 @@ def clean_education_data(text):
         return ''
     
     # 학력 관련 패턴 찾기
-    education_patterns = [
-        r'[가-힣]*졸',           # 대졸, 고졸, 초대졸 등
-        r'학력\s*무관',          # 학력 무관
-        r'대학교\s*졸업',        # 대학교 졸업
-        r'전문대\s*졸업',        # 전문대 졸업
-    ]
-    
-    for pattern in education_patterns:
-        match = re.search(pattern, text)
-        if match:
-            return match.group(0)
-    
-    return ''
+    return EDUCATION_CLASSIFIER.first_match(text)
 
 def clean_employment_type_data(text):
     """고용형태 데이터만 추출 (정규직 or 계약직)"""
@@ -421,21 +1424,7 @@ def clean_employment_type_data(text):
         return ''
     
     # 고용형태 관련 패턴 찾기
-    employment_patterns = [
-        r'정규직',
-        r'계약직',
-        r'파트타임',
-        r'인턴',
-        r'기간제',
-        r'프리랜서',
-    ]
-    
-    for pattern in employment_patterns:
-        match = re.search(pattern, text)
-        if match:
-            return match.group(0)
-    
-    return ''
+    return EMPLOYMENT_CLASSIFIER.first_match(text)
 
 def clean_salary_data(text):
     """급여 데이터만 추출 (*만원 or *원)"""
@@ -444,6 +1433,7 @@ def clean_salary_data(text):
     
     # 급여 관련 패턴 찾기 (더 포괄적으로)
     salary_patterns = [
+        r'(?:연봉|월급|시급)?\s*\d[\d,]*\s*~\s*\d[\d,]*\s*만?원',  # 연봉 4,000~5,000만원 등 범위
         r'\d+,?\d*만원',                    # 3000만원, 2,500만원 등
         r'\d+,?\d*원',                      # 300000원, 2,500,000원 등
         r'연봉\s*\d+,?\d*만원',             # 연봉 3000만원
@@ -483,53 +1473,283 @@ def clean_salary_data(text):
     
     return ''
 
-def save_to_csv(jobs, filename='saramin_jobs.csv'):
-    """채용 정보를 CSV 파일로 저장"""
-    if jobs:
-        df = pd.DataFrame(jobs)
-        
-        # 각 컬럼별로 데이터 정리
-        for idx, row in df.iterrows():
-            # 지역 정보 추출 및 이동
-            extracted_location, cleaned_text = extract_location_from_experience(row['experience'])
-            
-            if not row['location'] and extracted_location:
-                df.at[idx, 'location'] = extracted_location
-            elif extracted_location and extracted_location not in str(row['location']):
-                df.at[idx, 'location'] = extracted_location
-            
-            # experience 컬럼 정리 - 경력 정보만 추출
-            experience_clean = clean_experience_data(row['experience'])
-            df.at[idx, 'experience'] = experience_clean
-            
-            # education 컬럼 정리 - 학력 정보만 추출
-            education_clean = clean_education_data(row['education'])
-            df.at[idx, 'education'] = education_clean
-            
-            # employment_type 컬럼 정리 - 고용형태 정보만 추출
-            employment_clean = clean_employment_type_data(row['employment_type'])
-            df.at[idx, 'employment_type'] = employment_clean
-            
+def _first_match(series, classifier):
+    """classifier.first_match 의 컬럼 버전 (clean_*_data 와 같은 분류기를 쓰고, 같은 값은 한 번만 스캔)"""
+    matches = {value: classifier.first_match(value) for value in series.unique()}
+    return series.map(matches)
+
+def _region_from_parts(parts):
+    """CITY_PATTERN 추출 결과(도/시, 시/구/군)를 지역 표기로 변환 (매치 없으면 NaN)"""
+    province, city_or_district = parts[0], parts[1]
+    keep_district = ~province.isin(METROPOLITAN_CITIES) | city_or_district.str.contains('구', regex=False, na=False)
+    return city_or_district.where(keep_district, province + ' ' + city_or_district)
+
+def normalize_location_column(location):
+    """format_location 의 벡터 버전"""
+    cleaned = location.str.replace('\n', ' ', regex=False).str.strip()
+    region = _region_from_parts(cleaned.str.extract(CITY_PATTERN))
+    first_word = cleaned.str.split().str[0]
+    return region.fillna(first_word).fillna('')
+
+def normalize_deadline_column(deadline):
+    """format_deadline 의 벡터 버전"""
+    cleaned = (deadline.str.replace('~', '', regex=False)
+               .str.replace('입사지원', '', regex=False)
+               .str.replace('홈페이지 지원', '', regex=False)
+               .str.strip())
+    date_parts = cleaned.str.extract(DATE_PATTERN)
+    today = datetime.now()
+    tomorrow = today + timedelta(days=1)
+
+    result = pd.Series('', index=deadline.index, dtype=object)
+    # 뒤쪽 규칙부터 채워서 앞쪽 규칙이 우선하도록 함
+    result = result.mask(cleaned.str.contains('채용시', regex=False), '채용시')
+    result = result.mask(cleaned.str.contains('상시채용', regex=False), '상시채용')
+    result = result.mask(cleaned.str.contains('내일마감', regex=False), f"{tomorrow.month}/{tomorrow.day}")
+    result = result.mask(cleaned.str.contains('오늘마감', regex=False), f"{today.month}/{today.day}")
+    result = result.mask(date_parts[0].notna(), date_parts[0] + '/' + date_parts[1])
+    return result
+
+def normalize_jobs_df(df):
+    """
+    채용 정보 DataFrame 의 컬럼을 정리 (save_to_csv 의 행 단위 정리와 같은 결과)
+
+    experience 에서 지역을 찾아 location 을 보정하고, experience/education/employment_type
+    은 해당 정보만 남기며, deadline 과 location 은 표시 형식으로 변환한다.
+    """
+    df = df.copy()
+    for column in ['location', 'experience', 'education', 'employment_type', 'deadline']:
+        df[column] = df[column].fillna('').astype(str)
+
+    # 지역 정보 추출 및 이동
+    extracted_location = _region_from_parts(df['experience'].str.extract(CITY_PATTERN)).fillna('')
+    location_missing = [
+        not location or extracted not in location
+        for extracted, location in zip(extracted_location, df['location'])
+    ]
+    replace_location = extracted_location.ne('') & pd.Series(location_missing, index=df.index)
+    df['location'] = df['location'].mask(replace_location, extracted_location)
+
+    # 경력/학력/고용형태 정보만 추출
+    df['experience'] = _first_match(df['experience'], EXPERIENCE_CLASSIFIER)
+    df['education'] = _first_match(df['education'], EDUCATION_CLASSIFIER)
+    df['employment_type'] = _first_match(df['employment_type'], EMPLOYMENT_CLASSIFIER)
+
+    # deadline / location 형식 변환
+    df['deadline'] = normalize_deadline_column(df['deadline'])
+    df['location'] = normalize_location_column(df['location'])
+    return df
+
+def save_to_csv(jobs, filename='saramin_jobs.csv', enricher=None, normalized=False):
+    """
+    채용 정보를 CSV 파일로 저장 (enricher 를 주면 상세 페이지 정보로 보강한 뒤 저장)
 
+    normalized=True 면 이미 normalize_jobs_df 로 정리된 레코드로 보고 정리를 생략한다.
+    """
+    if jobs:
+        if normalized:
+            df = pd.DataFrame(jobs)
+        else:
+            with metrics.timer('normalize_seconds'):
+                df = normalize_jobs_df(pd.DataFrame(jobs))
         
-        # deadline 컬럼 형식 변환 (문자열로 변환)
-        df['deadline'] = df['deadline'].apply(lambda x: str(format_deadline(x)) if format_deadline(x) else '')
-        # location 컬럼 형식 변환
-        df['location'] = df['location'].apply(format_location)
+        if enricher is not None:
+            with metrics.timer('enrich_seconds'):
+                df = enricher.enrich(df)
         
-        df.to_csv(filename, index=False, encoding='utf-8-sig')
+        with metrics.timer('write_seconds', format='csv'):
+            df.to_csv(filename, index=False, encoding='utf-8-sig')
         print(f"데이터가 {filename}에 저장되었습니다.")
         return df
     else:
         print("저장할 데이터가 없습니다.")
         return None
 
-def main():
+def parse_args(argv=None):
+    """명령행 인자 파싱"""
+    parser = argparse.ArgumentParser(description='사람인 채용 정보 크롤러')
+    parser.add_argument('--engine', choices=['selenium', 'http'], default='selenium',
+                        help='크롤링 엔진 (http: Chrome 없이 정적 HTML 파싱)')
+    parser.add_argument('--keywords', nargs='+',
+                        help='검색 키워드 목록 (지정하면 여러 페이지를 병렬 크롤링)')
+    parser.add_argument('--pages', default='1-10',
+                        help='크롤링할 페이지 범위 (예: 1-10)')
+    parser.add_argument('--workers', type=int, default=4,
+                        help='동시 크롤링 작업 수')
+    parser.add_argument('--rate', type=float, default=2.0,
+                        help='호스트별 초당 요청 수 (시작 값, 응답에 따라 자동 조절)')
+    parser.add_argument('--max-rate', type=float,
+                        help='자동 조절로 올릴 수 있는 호스트별 초당 최대 요청 수 (기본: --rate 의 4배)')
+    parser.add_argument('--retries', type=int, default=3,
+                        help='요청 실패(연결 오류/429/5xx) 시 재시도 횟수')
+    parser.add_argument('--latency-target', type=float, default=DEFAULT_LATENCY_TARGET,
+                        help='이보다 느린 응답(초)이 오면 요청 속도를 낮춤')
+    parser.add_argument('--breaker-threshold', type=int, default=5,
+                        help='연속으로 이만큼 실패하면 circuit breaker 로 요청을 잠시 멈춤')
+    parser.add_argument('--breaker-cooldown', type=float, default=30.0,
+                        help='circuit breaker 가 요청을 멈추는 시간(초)')
+    parser.add_argument('--wait-timeout', type=float, default=DEFAULT_WAIT_TIMEOUT,
+                        help='Selenium 페이지 로딩 최대 대기 시간(초)')
+    parser.add_argument('--headed', action='store_true',
+                        help='Selenium 엔진에서 브라우저 창을 띄움 (기본: headless)')
+    parser.add_argument('--no-block-resources', action='store_true',
+                        help='Selenium 엔진에서 이미지/폰트/광고 스크립트 요청을 차단하지 않음')
+    parser.add_argument('--block-types', nargs='*', choices=sorted(BLOCKABLE_RESOURCE_PATTERNS),
+                        default=DEFAULT_BLOCKED_RESOURCE_TYPES, help='차단할 리소스 종류')
+    parser.add_argument('--block-url', nargs='+', default=[], metavar='PATTERN',
+                        help="추가로 차단할 URL 패턴 (예: '*ads.example.com*')")
+    parser.add_argument('--unblock-url', nargs='+', default=[], metavar='PATTERN',
+                        help="차단 목록에서 뺄 패턴 (차단 패턴 문자열 그대로, 예: '*.svg*' 또는 '*hotjar.com*')")
+    parser.add_argument('--parser', dest='html_parser', choices=HTML_PARSERS, default=DEFAULT_HTML_PARSER,
+                        help='HTML 파싱 백엔드')
+    parser.add_argument('--format', dest='formats', nargs='+', choices=['parquet', 'feather'], default=[],
+                        help='CSV 와 함께 저장할 컬럼형 파일 형식 (pyarrow 필요)')
+    parser.add_argument('--store', metavar='DB_PATH',
+                        help='rec_idx 기준으로 공고를 누적 저장할 SQLite 파일 (증분 크롤링)')
+    parser.add_argument('--full-crawl', action='store_true',
+                        help='이번 키워드/페이지 범위가 추적 중인 공고 전체를 덮는 크롤링이면 지정 '
+                             '(--store 에서 이번에 보이지 않은 공고를 마감 처리)')
+    parser.add_argument('--rebuild-rollup', nargs='?', const='', metavar='START:END',
+                        help='크롤링하지 않고 --store 의 공고 이력으로 일별 집계를 채움 '
+                             '(기본: 첫 집계 이전 날짜만, START:END(YYYY-MM-DD) 를 주면 그 기간을 다시 계산)')
+    parser.add_argument('--base-url', default=SARAMIN_BASE_URL,
+                        help='검색 요청을 보낼 주소 (saramin_benchmark.py serve 로 띄운 로컬 대체 서버 등)')
+    parser.add_argument('--metrics', metavar='PATH',
+                        help='단계별 시간/카운터를 내보낼 파일')
+    parser.add_argument('--metrics-format', choices=METRIC_FORMATS, default='jsonl',
+                        help='메트릭 형식 (jsonl: 실행마다 추가, prometheus: textfile collector 용)')
+    parser.add_argument('--cache', metavar='CACHE_PATH',
+                        help='HTTP 엔진 응답 캐시 파일 (SQLite, 조건부 요청/파싱 생략)')
+    parser.add_argument('--cache-ttl', type=float, default=DEFAULT_CACHE_TTL,
+                        help='경로별 기본값이 없는 페이지의 캐시 유효 시간(초)')
+    parser.add_argument('--cache-max-mb', type=float, default=DEFAULT_CACHE_MAX_BYTES / (1024 * 1024),
+                        help='응답 캐시 최대 크기(MB), 넘으면 오래 사용하지 않은 응답부터 삭제')
+    parser.add_argument('--from-cache', action='store_true',
+                        help='크롤링하지 않고 캐시된 검색 페이지를 다시 파싱 (--cache 필요)')
+    parser.add_argument('--from-html', nargs='+', metavar='PATH',
+                        help='크롤링하지 않고 저장해 둔 HTML 파일(또는 디렉터리)을 파싱')
+    parser.add_argument('--parse-workers', type=int, default=1,
+                        help='--from-cache/--from-html 파싱에 쓸 프로세스 수 (2 이상이면 프로세스 풀 사용)')
+    parser.add_argument('--parse-chunksize', type=int, default=8,
+                        help='프로세스 풀에 한 번에 넘기는 페이지 수')
+    parser.add_argument('--enrich', action='store_true',
+                        help='상세 페이지에서 급여/마감 일시/상세 요강을 가져와 보강 (--store 가 있으면 신규/변경 공고만)')
+    parser.add_argument('--detail-workers', type=int, default=8,
+                        help='상세 페이지 동시 요청 수')
+    parser.add_argument('--stream', action='store_true',
+                        help='크롤링 결과를 묶음 단위로 바로 저장 (--keywords 필요, 메모리 사용량 일정)')
+    parser.add_argument('--chunk-size', type=int, default=200,
+                        help='스트리밍 모드에서 한 번에 정리/저장하는 공고 수')
+    args = parser.parse_args(argv)
+    if args.stream and not args.keywords:
+        parser.error('--stream 은 --keywords 와 함께 사용해야 합니다.')
+    if args.full_crawl and not (args.store and args.keywords):
+        parser.error('--full-crawl 은 --store, --keywords 와 함께 사용해야 합니다.')
+    if args.rebuild_rollup is not None:
+        if not args.store:
+            parser.error('--rebuild-rollup 은 --store 와 함께 사용해야 합니다.')
+        try:
+            args.rollup_range = parse_day_range(args.rebuild_rollup)
+        except ValueError:
+            parser.error('--rebuild-rollup 기간은 YYYY-MM-DD:YYYY-MM-DD 형식이어야 합니다.')
+    if args.unblock_url:
+        try:
+            ResourceBlocker(args.block_types, args.block_url, args.unblock_url)
+        except ValueError as e:
+            parser.error(f'--unblock-url: {e}')
+    if args.from_cache and not args.cache:
+        parser.error('--from-cache 는 --cache 와 함께 사용해야 합니다.')
+    return args
+
+def parse_day_range(text):
+    """'YYYY-MM-DD:YYYY-MM-DD' (또는 하루 'YYYY-MM-DD') 를 (시작일, 종료일) 로 변환 (빈 문자열이면 (None, None))"""
+    if not text:
+        return None, None
+    start, _, end = text.partition(':')
+    start_day, end_day = date.fromisoformat(start).isoformat(), date.fromisoformat(end or start).isoformat()
+    if start_day > end_day:
+        raise ValueError(text)
+    return start_day, end_day
+
+def parse_page_range(text):
+    """'1-10' 또는 '3' 형식의 페이지 범위를 range로 변환"""
+    start, _, end = text.partition('-')
+    return range(int(start), int(end or start) + 1)
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    if args.rebuild_rollup is not None:
+        with JobStore(args.store) as store:
+            rebuilt = store.rebuild_daily_rollup(*args.rollup_range)
+        print(f"{args.store}: 일별 집계 {rebuilt}일치를 공고 이력으로 채웠습니다.")
+        return
+
+    if args.cache:
+        set_http_cache(HttpCache(args.cache, ttl=args.cache_ttl, max_bytes=int(args.cache_max_mb * 1024 * 1024)))
+    try:
+        run_crawl(args)
+    finally:
+        # abort_crawl(SystemExit) 등 어떤 경로로 끝나도 캐시 연결을 닫음
+        if _http_cache is not None:
+            _http_cache.close()
+            set_http_cache(None)
+
+def run_crawl(args):
+    """명령행 인자대로 크롤링(또는 캐시/HTML 재파싱)하고 결과를 저장"""
     # 사람인 업무자동화 검색 URL
     url = "https://www.saramin.co.kr/zf_user/search?search_area=main&search_done=y&search_optional_item=n&searchType=search&searchword=%rpa"
     
-    print("사람인 채용 정보 크롤링을 시작합니다...")
-    jobs = scrape_saramin_jobs(url)
+    configure_browser(
+        headless=not args.headed,
+        resource_blocker=None if args.no_block_resources else ResourceBlocker(
+            args.block_types, args.block_url, args.unblock_url),
+    )
+
+    print(f"사람인 채용 정보 크롤링을 시작합니다... (엔진: {args.engine})")
+    governor = build_governor(args)
+    if args.stream:
+        try:
+            run_streaming_crawl(args, governor)
+        except CircuitOpenError as e:
+            abort_crawl(args, governor, e)
+        print(f"\n요청 통계: {governor.summary()}")
+        export_metrics(args)
+        return
+
+    enricher = None
+    if args.enrich:
+        enricher = build_enricher(args, JobStore(args.store) if args.store else None, governor)
+
+    # 저장된 페이지를 다시 파싱하는 경우에는 파싱과 정리를 프로세스 풀에서 함께 처리
+    normalized = bool(args.from_cache or args.from_html)
+    failed_urls = []
+    if args.from_cache:
+        jobs = scrape_cached_pages(_http_cache, html_parser=args.html_parser, workers=args.parse_workers,
+                                   chunksize=args.parse_chunksize, normalize=True)
+        print(f"캐시된 검색 페이지에서 다시 추출했습니다. (네트워크 요청 없음)")
+    elif args.from_html:
+        jobs = replay_html_files(args.from_html, html_parser=args.html_parser, workers=args.parse_workers,
+                                 chunksize=args.parse_chunksize, normalize=True)
+        print(f"저장된 HTML 파일에서 다시 추출했습니다. (네트워크 요청 없음)")
+    elif args.keywords:
+        try:
+            jobs = crawl_saramin_jobs(args.keywords, pages=parse_page_range(args.pages), engine=args.engine,
+                                      max_workers=args.workers, requests_per_second=args.rate,
+                                      wait_timeout=args.wait_timeout, html_parser=args.html_parser,
+                                      base_url=args.base_url, governor=governor, failed_urls=failed_urls)
+        except CircuitOpenError as e:
+            abort_crawl(args, governor, e)
+    else:
+        try:
+            jobs = scrape_saramin_jobs(url, engine=args.engine, wait_timeout=args.wait_timeout,
+                                       html_parser=args.html_parser, governor=governor)
+        except Exception as e:
+            abort_crawl(args, governor, e)
+    print(f"\n요청 통계: {governor.summary()}")
+    if failed_urls:
+        print(f"재시도 후에도 {len(failed_urls)}개 페이지를 수집하지 못했습니다. "
+              f"(이번 실행에서는 마감 공고를 판정하지 않습니다)")
     
     if jobs:
         print(f"\n총 {len(jobs)}개의 채용 정보를 수집했습니다.")
@@ -548,16 +1768,116 @@ def main():
             print(f"링크: {job['link']}")
         
         # CSV 파일로 저장
-        df = save_to_csv(jobs, 'saramin_automation_jobs.csv')
+        df = save_to_csv(jobs, 'saramin_automation_jobs.csv', enricher=enricher, normalized=normalized)
+        
+        # 컬럼형 파일로도 저장 (대시보드가 자동으로 우선 사용)
+        if df is not None:
+            for file_format in args.formats:
+                filename = f'saramin_automation_jobs.{file_format}'
+                try:
+                    with metrics.timer('write_seconds', format=file_format):
+                        save_jobs_file(df, filename)
+                    print(f"데이터가 {filename}에 저장되었습니다.")
+                except ImportError as e:
+                    print(f"{file_format} 저장 실패 (pyarrow 필요): {e}")
         
         if df is not None:
             print(f"\n데이터프레임 정보:")
             print(df.info())
             print(f"\n처음 5개 행:")
             print(df.head())
+        
+        # 누적 저장소에 반영 (새 공고/변경된 공고/마감된 공고 집계)
+        if df is not None and args.store:
+            with JobStore(args.store) as store:
+                changes = store.sync_crawl(df.to_dict('records'), full_crawl=args.full_crawl and not failed_urls)
+            print(f"\n저장소 반영: 신규 {len(changes['new'])}개, 변경 {len(changes['changed'])}개, "
+                  f"기존 {len(changes['unchanged'])}개, 마감 처리 {changes['closed']}개")
     
     else:
         print("채용 정보를 수집하지 못했습니다.")
+    
+    if enricher is not None and enricher.store is not None:
+        enricher.store.close()
+    export_metrics(args)
+    if not jobs and failed_urls:
+        # 요청이 실패해서 결과가 없는 경우는 정상 종료로 보지 않음
+        raise SystemExit(1)
+
+def build_governor(args):
+    """명령행 인자로 모든 요청 경로가 함께 쓰는 요청 조절기(RequestGovernor) 생성"""
+    return RequestGovernor(args.rate, max_concurrency=max(args.workers, args.detail_workers),
+                           max_rate=args.max_rate, retries=args.retries, latency_target=args.latency_target,
+                           failure_threshold=args.breaker_threshold, cooldown=args.breaker_cooldown)
+
+def abort_crawl(args, governor, error):
+    """요청 실패로 크롤링을 계속할 수 없을 때 통계/메트릭을 남기고 종료 (빈 결과를 저장하지 않음)"""
+    print(f"크롤링을 중단합니다: {error}")
+    print(f"요청 통계: {governor.summary()}")
+    export_metrics(args)
+    raise SystemExit(1)
+
+def build_enricher(args, store=None, governor=None):
+    """명령행 인자로 상세 페이지 보강기(DetailEnricher) 생성"""
+    from saramin_enrichment import DetailEnricher
+
+    base_url = args.base_url if args.base_url != SARAMIN_BASE_URL else None
+    return DetailEnricher(store=store, max_workers=args.detail_workers, requests_per_second=args.rate,
+                          retries=args.retries, html_parser=args.html_parser, base_url=base_url,
+                          governor=governor)
+
+def run_streaming_crawl(args, governor=None, filename='saramin_automation_jobs.csv'):
+    """크롤링 결과를 묶음 단위로 CSV(와 Parquet/SQLite)에 바로 저장 (--stream)"""
+    from saramin_pipeline import CsvSink, ParquetSink, SQLiteSink, STREAMING_FORMATS, run_pipeline
+
+    sinks = [CsvSink(filename)]
+    enricher = None
+    try:
+        if args.enrich:
+            enricher = build_enricher(args, JobStore(args.store) if args.store else None, governor)
+        for file_format in args.formats:
+            if file_format not in STREAMING_FORMATS:
+                print(f"{file_format} 형식은 스트리밍 저장을 지원하지 않아 건너뜁니다.")
+                continue
+            try:
+                sinks.append(ParquetSink(filename.rsplit('.', 1)[0] + f'.{file_format}'))
+            except ImportError as e:
+                print(f"{file_format} 저장 실패 (pyarrow 필요): {e}")
+        if args.store:
+            sinks.append(SQLiteSink(args.store, full_crawl=args.full_crawl))
+    except Exception:
+        for sink in sinks:
+            sink.close()
+        if enricher is not None and enricher.store is not None:
+            enricher.store.close()
+        raise
+
+    try:
+        summary = run_pipeline(args.keywords, sinks, pages=parse_page_range(args.pages), engine=args.engine,
+                               max_workers=args.workers, requests_per_second=args.rate,
+                               wait_timeout=args.wait_timeout, html_parser=args.html_parser,
+                               base_url=args.base_url, chunk_size=args.chunk_size, enricher=enricher,
+                               governor=governor)
+    finally:
+        if enricher is not None and enricher.store is not None:
+            enricher.store.close()
+
+    print(f"\n총 {summary['pages']}개 페이지에서 {summary['jobs']}개의 채용 정보를 저장했습니다. "
+          f"({', '.join(sink.name for sink in sinks)})")
+    if summary['failed_pages']:
+        print(f"재시도 후에도 {summary['failed_pages']}개 페이지를 수집하지 못했습니다. "
+              f"(이번 실행에서는 마감 공고를 판정하지 않습니다)")
+    for sink in sinks:
+        if isinstance(sink, SQLiteSink):
+            changes = sink.changes
+            print(f"저장소 반영: 신규 {changes['new']}개, 변경 {changes['changed']}개, "
+                  f"기존 {changes['unchanged']}개, 마감 처리 {changes['closed']}개")
+
+def export_metrics(args):
+    """단계별 시간/카운터 내보내기 (--metrics)"""
+    if args.metrics:
+        metrics.export(args.metrics, args.metrics_format)
+        print(f"메트릭이 {args.metrics}에 저장되었습니다. ({args.metrics_format})")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
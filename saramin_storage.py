@@ -0,0 +1,84 @@
+import os
+from datetime import datetime, timedelta
+
+import pandas as pd
+
+
+# 범주형으로 저장할 컬럼 (값의 종류가 적은 컬럼)
+CATEGORY_COLUMNS = ['location', 'experience', 'education', 'employment_type', 'deadline']
+
+# 확장자별 저장 형식 (컬럼형 형식은 pyarrow 가 필요)
+COLUMNAR_FORMATS = {'.parquet': 'parquet', '.feather': 'feather'}
+SUPPORTED_FORMATS = dict(COLUMNAR_FORMATS, **{'.csv': 'csv'})
+
+
+def parse_deadline_dates(deadline, reference=None):
+    """
+    'm/d' 형식 마감일을 실제 날짜로 변환 (상시채용/채용시 등은 NaT)
+
+    연도는 기준일(reference) 기준으로 정하고, 기준일보다 한 달 넘게 지난 날짜는 다음 해로 본다.
+    """
+    reference = pd.Timestamp(reference or datetime.now()).normalize()
+    parts = deadline.astype(object).str.extract(r'^(\d{1,2})/(\d{1,2})$')
+    dates = pd.to_datetime(f'{reference.year}-' + parts[0] + '-' + parts[1], format='%Y-%m-%d', errors='coerce')
+    next_year = dates < reference - timedelta(days=30)
+    return dates.mask(next_year, dates + pd.DateOffset(years=1))
+
+def to_columnar_frame(df, reference=None):
+    """
+    컬럼형 저장용 DataFrame 으로 변환
+
+    빈 문자열은 CSV 를 다시 읽었을 때처럼 결측값으로 바꾸고, 값 종류가 적은 컬럼은
+    category 로, 마감일은 표시용 텍스트(deadline)와 실제 날짜(deadline_date)로 저장한다.
+    (상세 페이지 마감 일시 deadline_at 이 있으면 deadline_date 는 그 날짜를 따른다)
+    """
+    df = df.replace('', pd.NA)
+    df['deadline_date'] = parse_deadline_dates(df['deadline'], reference)
+    if 'deadline_at' in df.columns:
+        # 상세 페이지에서 가져온 마감 일시(연도 포함)가 있으면 그 날짜를 우선 사용
+        deadline_at = pd.to_datetime(df['deadline_at'].astype(object).str[:10], format='%Y-%m-%d', errors='coerce')
+        df['deadline_date'] = deadline_at.fillna(df['deadline_date'])
+    for column in CATEGORY_COLUMNS:
+        if column in df.columns:
+            df[column] = df[column].astype('category')
+    return df
+
+def save_jobs_file(df, path, reference=None):
+    """확장자(.csv/.parquet/.feather)에 맞는 형식으로 채용 정보 저장"""
+    file_format = SUPPORTED_FORMATS.get(os.path.splitext(path)[1].lower())
+    if file_format is None:
+        raise ValueError(f"지원하지 않는 파일 형식입니다: {path}")
+
+    if file_format == 'csv':
+        df.to_csv(path, index=False, encoding='utf-8-sig')
+    elif file_format == 'parquet':
+        to_columnar_frame(df, reference).to_parquet(path, index=False)
+    else:
+        to_columnar_frame(df, reference).reset_index(drop=True).to_feather(path)
+
+def read_jobs_file(path):
+    """확장자에 맞는 형식으로 채용 정보 파일 읽기"""
+    file_format = SUPPORTED_FORMATS.get(os.path.splitext(path)[1].lower())
+    if file_format == 'parquet':
+        return pd.read_parquet(path)
+    if file_format == 'feather':
+        return pd.read_feather(path)
+    if file_format == 'csv':
+        return pd.read_csv(path)
+    raise ValueError(f"지원하지 않는 파일 형식입니다: {path}")
+
+def find_jobs_file(base_path):
+    """
+    확장자를 뺀 경로(base_path)에 해당하는 데이터 파일 중 읽을 파일 선택
+
+    컬럼형 파일이 있고 CSV 보다 오래되지 않았으면 컬럼형 파일을 우선 사용한다.
+    """
+    csv_path = base_path + '.csv'
+    csv_mtime = os.path.getmtime(csv_path) if os.path.exists(csv_path) else None
+
+    for extension in COLUMNAR_FORMATS:
+        path = base_path + extension
+        if os.path.exists(path) and (csv_mtime is None or os.path.getmtime(path) >= csv_mtime):
+            return path
+
+    return csv_path if csv_mtime is not None else None
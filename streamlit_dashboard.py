@@ -2,8 +2,17 @@ import streamlit as st
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
-from collections import Counter
 import re
+import io
+import os
+import sqlite3
+from datetime import date, timedelta
+from dashboard_data import JobAggregates, FilterIndex, DatasetLoader, TableView, process_memory_mb
+from keyword_analytics import TitleKeywordIndex, TextSearchIndex, DEFAULT_KEYWORDS
+from saramin_job_store import JobStore
+
+# 모든 세션이 같은 DataFrame 을 공유하므로, 세션 쪽 연산이 공유본을 수정하지 않고 필요할 때만 복사하도록 함
+pd.set_option('mode.copy_on_write', True)
 
 # 페이지 설정
 st.set_page_config(
@@ -12,63 +21,146 @@ st.set_page_config(
     layout="wide"
 )
 
+# 파일이 그대로여도 전체를 다시 읽는 주기(초), None 이면 파일이 바뀔 때만 다시 읽음
+DATA_TTL_SECONDS = None
+
+# 일별 집계가 들어 있는 누적 저장소 (크롤러 --store 경로)
+JOB_STORE_PATH = 'saramin_jobs.db'
+
+# 추이 차트 기간 선택지 (일 수, None 이면 전체)
+TREND_PERIODS = {'최근 30일': 30, '최근 90일': 90, '전체': None}
+TREND_DIMENSIONS = {'지역': 'location', '경력': 'experience', '고용형태': 'employment_type', '기업': 'company'}
+
 # 제목
 st.title("📊 사람인 업무자동화 채용 통계 대시보드")
 st.markdown("---")
 
-# 데이터 로드
-@st.cache_data
+# 데이터 로드 (Parquet/Feather 파일이 있으면 CSV 대신 사용)
+# 로더는 프로세스당 하나이며 파일의 수정 시각/크기가 바뀔 때만 다시 읽음
+@st.cache_resource
+def get_dataset_loader():
+    return DatasetLoader('saramin_automation_jobs', ttl=DATA_TTL_SECONDS)
+
 def load_data():
-    try:
-        df = pd.read_csv('saramin_automation_jobs.csv')
-        return df
-    except FileNotFoundError:
+    df, data_version = get_dataset_loader().load()
+    if df is None:
         st.error("saramin_automation_jobs.csv 파일을 찾을 수 없습니다.")
+    return df, data_version
+
+# 필터 조합별 집계 (데이터 버전마다 한 번만 계산)
+@st.cache_resource(max_entries=2)
+def build_aggregates(data_version, _df):
+    return JobAggregates(_df)
+
+# 필터 컬럼 역색인 (데이터 버전마다 한 번만 생성)
+@st.cache_resource(max_entries=2)
+def build_filter_index(data_version, _df):
+    return FilterIndex(_df)
+
+# 제목 키워드 색인 (데이터 버전마다 한 번만 생성)
+@st.cache_resource(max_entries=2)
+def build_keyword_index(data_version, _df):
+    return TitleKeywordIndex(_df['title'])
+
+# 상세 테이블 제목/회사명 검색 색인과 정렬 (데이터 버전마다 한 번만 생성)
+@st.cache_resource(max_entries=2)
+def build_search_index(data_version, _df):
+    return TextSearchIndex(_df['title'].astype(object).fillna('') + ' ' + _df['company'].astype(object).fillna(''))
+
+@st.cache_resource(max_entries=2)
+def build_table_view(data_version, _df):
+    return TableView(_df)
+
+def get_store_version(path=JOB_STORE_PATH):
+    """누적 저장소 파일의 수정 시각/크기 (없으면 None)"""
+    if not os.path.exists(path):
         return None
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+# 일별 집계 테이블만 읽기 전용으로 읽음 (저장소가 바뀔 때만 다시 조회, 읽는 양은 기간의 일 수에 비례)
+@st.cache_data(max_entries=16)
+def load_daily_activity(store_version, start_day):
+    try:
+        with JobStore(JOB_STORE_PATH, read_only=True) as store:
+            return store.load_daily_activity(start_day)
+    except (sqlite3.Error, pd.errors.DatabaseError):
+        # 일별 집계 테이블이 생기기 전의 저장소 (크롤러를 한 번 더 실행하면 생김)
+        return pd.DataFrame()
+
+@st.cache_data(max_entries=32)
+def load_daily_postings(store_version, dimension, start_day, top):
+    try:
+        with JobStore(JOB_STORE_PATH, read_only=True) as store:
+            return store.load_daily_postings(dimension, start_day, top)
+    except (sqlite3.Error, pd.errors.DatabaseError):
+        return pd.DataFrame()
 
-df = load_data()
+def build_csv_bytes(frame, chunksize=50000):
+    """CSV 를 청크 단위로 써서 바이트로 반환"""
+    buffer = io.BytesIO()
+    buffer.write('\ufeff'.encode('utf-8'))
+    for start in range(0, len(frame), chunksize):
+        buffer.write(frame.iloc[start:start + chunksize].to_csv(index=False, header=start == 0).encode('utf-8'))
+    if frame.empty:
+        buffer.write(frame.to_csv(index=False).encode('utf-8'))
+    return buffer.getvalue()
+
+df, data_version = load_data()
 
 if df is not None:
     # 사이드바 - 필터링 옵션
     st.sidebar.header("🔍 필터링 옵션")
     
+    filter_index = build_filter_index(data_version, df)
+    
     # 지역 필터
-    locations = ['전체'] + sorted(df['location'].dropna().unique().tolist())
+    locations = ['전체'] + filter_index.options('location')
     selected_location = st.sidebar.selectbox("지역 선택", locations)
     
     # 경력 필터
-    experiences = ['전체'] + sorted(df['experience'].dropna().unique().tolist())
+    experiences = ['전체'] + filter_index.options('experience')
     selected_experience = st.sidebar.selectbox("경력 선택", experiences)
     
     # 고용형태 필터
-    employment_types = ['전체'] + sorted(df['employment_type'].dropna().unique().tolist())
+    employment_types = ['전체'] + filter_index.options('employment_type')
     selected_employment = st.sidebar.selectbox("고용형태 선택", employment_types)
     
-    # 데이터 필터링
-    filtered_df = df.copy()
-    if selected_location != '전체':
-        filtered_df = filtered_df[filtered_df['location'] == selected_location]
-    if selected_experience != '전체':
-        filtered_df = filtered_df[filtered_df['experience'] == selected_experience]
-    if selected_employment != '전체':
-        filtered_df = filtered_df[filtered_df['employment_type'] == selected_employment]
+    # 메모리 사용량 (데이터셋은 프로세스당 하나를 모든 세션이 공유)
+    st.sidebar.markdown("---")
+    st.sidebar.subheader("🧠 메모리 사용량")
+    dataset_bytes = get_dataset_loader().memory_bytes
+    st.sidebar.metric("공유 데이터셋", f"{dataset_bytes / (1024 * 1024):.1f} MB" if dataset_bytes >= 1024 * 1024
+                      else f"{dataset_bytes / 1024:.0f} KB",
+                      help=f"{len(df):,}행, 모든 세션이 같은 데이터를 읽습니다.")
+    rss_mb = process_memory_mb()
+    if rss_mb is not None:
+        st.sidebar.metric("대시보드 프로세스", f"{rss_mb:.0f} MB")
+    
+    # 데이터 필터링 (역색인 교집합으로 해당 행 위치만 선택)
+    filter_positions = filter_index.positions(selected_location, selected_experience, selected_employment)
+    
+    # 미리 계산된 집계에서 현재 필터 조합 조회
+    aggregates = build_aggregates(data_version, df).lookup(
+        selected_location, selected_experience, selected_employment
+    )
     
     # 메인 대시보드
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
-        st.metric("총 채용공고", len(filtered_df))
+        st.metric("총 채용공고", aggregates['total'])
     
     with col2:
-        unique_companies = filtered_df['company'].nunique()
+        unique_companies = len(aggregates['company'])
         st.metric("참여 기업수", unique_companies)
     
     with col3:
-        regular_jobs = len(filtered_df[filtered_df['employment_type'] == '정규직'])
+        regular_jobs = int(aggregates['employment_type'].get('정규직', 0))
         st.metric("정규직 채용", regular_jobs)
     
     with col4:
-        deadline_jobs = len(filtered_df[filtered_df['deadline'].notna() & (filtered_df['deadline'] != '')])
+        deadline_jobs = aggregates['total'] - int(aggregates['deadline_status'].get('마감일 없음', 0))
         st.metric("마감일 있는 채용", deadline_jobs)
     
     st.markdown("---")
@@ -78,7 +170,7 @@ if df is not None:
     
     with col1:
         st.subheader("📍 지역별 채용공고 분포")
-        location_counts = filtered_df['location'].value_counts()
+        location_counts = aggregates['location']
         if not location_counts.empty:
             fig_location = px.pie(
                 values=location_counts.values,
@@ -92,7 +184,7 @@ if df is not None:
     
     with col2:
         st.subheader("💼 고용형태별 분포")
-        employment_counts = filtered_df['employment_type'].value_counts()
+        employment_counts = aggregates['employment_type']
         if not employment_counts.empty:
             fig_employment = px.bar(
                 x=employment_counts.index,
@@ -107,7 +199,7 @@ if df is not None:
     
     # 경력별 분석
     st.subheader("🎯 경력별 채용공고 분포")
-    experience_counts = filtered_df['experience'].value_counts()
+    experience_counts = aggregates['experience']
     if not experience_counts.empty:
         fig_experience = px.bar(
             x=experience_counts.values,
@@ -125,7 +217,7 @@ if df is not None:
     
     with col1:
         st.subheader("🎓 학력별 요구사항")
-        education_counts = filtered_df['education'].value_counts()
+        education_counts = aggregates['education']
         if not education_counts.empty:
             fig_education = px.pie(
                 values=education_counts.values,
@@ -138,22 +230,11 @@ if df is not None:
     
     with col2:
         st.subheader("📅 마감일 현황")
-        deadline_status = []
-        for deadline in filtered_df['deadline']:
-            if pd.isna(deadline) or deadline == '':
-                deadline_status.append('마감일 없음')
-            elif '상시채용' in str(deadline):
-                deadline_status.append('상시채용')
-            elif '채용시' in str(deadline):
-                deadline_status.append('채용시')
-            else:
-                deadline_status.append('마감일 있음')
-        
-        deadline_counts = Counter(deadline_status)
-        if deadline_counts:
+        deadline_counts = aggregates['deadline_status']
+        if not deadline_counts.empty:
             fig_deadline = px.pie(
-                values=list(deadline_counts.values()),
-                names=list(deadline_counts.keys()),
+                values=deadline_counts.values,
+                names=deadline_counts.index,
                 title="마감일 현황 분포"
             )
             st.plotly_chart(fig_deadline, use_container_width=True)
@@ -162,7 +243,7 @@ if df is not None:
     
     # 상위 기업 분석
     st.subheader("🏢 채용 활발한 기업 TOP 10")
-    company_counts = filtered_df['company'].value_counts().head(10)
+    company_counts = aggregates['company'].head(10)
     if not company_counts.empty:
         fig_companies = px.bar(
             x=company_counts.values,
@@ -175,56 +256,153 @@ if df is not None:
     else:
         st.info("표시할 기업 데이터가 없습니다.")
     
+    # 일별 추이 (누적 저장소의 일별 집계, 사이드바 필터와 무관)
+    st.subheader("📈 일별 채용 추이")
+    store_version = get_store_version()
+    if store_version is None:
+        st.info(f"크롤러를 --store {JOB_STORE_PATH} 옵션으로 실행하면 일별 추이가 표시됩니다.")
+    else:
+        col1, col2, col3 = st.columns([2, 2, 1])
+        with col1:
+            trend_period = st.selectbox("기간", list(TREND_PERIODS))
+        with col2:
+            trend_dimension = st.selectbox("구분", list(TREND_DIMENSIONS))
+        with col3:
+            trend_top = st.number_input("상위 항목 수", min_value=1, max_value=20, value=5, step=1)
+
+        period_days = TREND_PERIODS[trend_period]
+        start_day = (date.today() - timedelta(days=period_days - 1)).isoformat() if period_days else None
+        activity = load_daily_activity(store_version, start_day)
+
+        if not activity.empty:
+            col1, col2 = st.columns(2)
+            with col1:
+                fig_open = px.line(
+                    activity, x='day', y='open_postings', markers=True,
+                    title="일별 확인된 채용공고 수",
+                    labels={'day': '날짜', 'open_postings': '채용공고 수'}
+                )
+                st.plotly_chart(fig_open, use_container_width=True)
+            with col2:
+                fig_activity = px.bar(
+                    activity, x='day', y=['new_postings', 'closed_postings'], barmode='group',
+                    title="일별 신규/마감 채용공고",
+                    labels={'day': '날짜', 'value': '채용공고 수', 'variable': '구분'}
+                )
+                fig_activity.for_each_trace(lambda trace: trace.update(
+                    name={'new_postings': '신규', 'closed_postings': '마감'}[trace.name]
+                ))
+                st.plotly_chart(fig_activity, use_container_width=True)
+
+            daily_postings = load_daily_postings(store_version, TREND_DIMENSIONS[trend_dimension],
+                                                 start_day, int(trend_top))
+            if not daily_postings.empty:
+                fig_dimension = px.line(
+                    daily_postings, x='day', y='postings', color='value', markers=True,
+                    title=f"{trend_dimension}별 일별 채용공고 수 (상위 {int(trend_top)}개)",
+                    labels={'day': '날짜', 'postings': '채용공고 수', 'value': trend_dimension}
+                )
+                st.plotly_chart(fig_dimension, use_container_width=True)
+        else:
+            st.info("선택한 기간의 일별 집계가 없습니다. 집계 기능 이전에 쌓인 이력은 크롤러를 "
+                    f"--store {JOB_STORE_PATH} --rebuild-rollup 옵션으로 실행하면 채워집니다.")
+
     # 키워드 분석
     st.subheader("🔍 채용공고 제목 키워드 분석")
     
-    # 제목에서 키워드 추출
-    all_titles = ' '.join(filtered_df['title'].dropna().tolist())
-    keywords = ['AI', '인공지능', 'RPA', '자동화', '개발자', '시스템', '솔루션', '기술', '데이터', '프로그래밍']
-    keyword_counts = {}
+    # 분석할 키워드 (쉼표로 구분)
+    keyword_text = st.text_input("분석할 키워드 (쉼표로 구분)", value=', '.join(DEFAULT_KEYWORDS))
+    keywords = [keyword for keyword in keyword_text.split(',') if keyword.strip()]
     
-    for keyword in keywords:
-        count = all_titles.upper().count(keyword.upper())
-        if count > 0:
-            keyword_counts[keyword] = count
+    # 데이터 로드 시 만든 제목 색인에서 현재 필터 행만 집계
+    keyword_index = build_keyword_index(data_version, df)
+    keyword_stats = keyword_index.keyword_stats(keywords, filter_positions)
+    keyword_stats = keyword_stats[keyword_stats['frequency'] > 0]
     
-    if keyword_counts:
+    if not keyword_stats.empty:
         fig_keywords = px.bar(
-            x=list(keyword_counts.keys()),
-            y=list(keyword_counts.values()),
+            keyword_stats,
+            x='keyword',
+            y=['frequency', 'postings'],
+            barmode='group',
             title="채용공고 제목 키워드 빈도",
-            labels={'x': '키워드', 'y': '빈도'}
+            labels={'keyword': '키워드', 'value': '빈도', 'variable': '구분'}
         )
+        fig_keywords.for_each_trace(lambda trace: trace.update(
+            name={'frequency': '등장 횟수', 'postings': '포함 공고 수'}[trace.name]
+        ))
         st.plotly_chart(fig_keywords, use_container_width=True)
     else:
         st.info("표시할 키워드 데이터가 없습니다.")
     
+    # 자동 추출한 상위 단어
+    top_terms = keyword_index.top_terms(10, filter_positions)
+    if not top_terms.empty:
+        fig_terms = px.bar(
+            x=top_terms['postings'],
+            y=top_terms['term'],
+            orientation='h',
+            title="제목 상위 단어 TOP 10 (포함 공고 수)",
+            labels={'x': '채용공고 수', 'y': '단어'}
+        )
+        st.plotly_chart(fig_terms, use_container_width=True)
+    
     # 데이터 테이블
     st.subheader("📋 채용공고 상세 정보")
     
     # 컬럼 선택
     display_columns = st.multiselect(
         "표시할 컬럼 선택",
-        options=filtered_df.columns.tolist(),
+        options=df.columns.tolist(),
         default=['title', 'company', 'location', 'experience', 'employment_type', 'deadline']
     )
     
+    # 검색/정렬/페이지 (현재 페이지의 행만 브라우저로 전송)
+    col1, col2, col3, col4 = st.columns([3, 2, 1, 1])
+    with col1:
+        search_text = st.text_input("제목/회사명 검색")
+    with col2:
+        sort_column = st.selectbox("정렬 기준", ['(기본 순서)'] + df.columns.tolist())
+    with col3:
+        sort_ascending = st.radio("정렬 방향", ['오름차순', '내림차순'], horizontal=True) == '오름차순'
+    with col4:
+        page_size = st.selectbox("페이지당 행 수", [50, 100, 500], index=1)
+    
+    table_positions = filter_positions
+    if search_text.strip():
+        table_positions = build_search_index(data_version, df).search(search_text, table_positions)
+    table_view = build_table_view(data_version, df)
+    table_positions = table_view.sorted_positions(
+        table_positions, None if sort_column == '(기본 순서)' else sort_column, sort_ascending
+    )
+    
+    page_count = max(1, -(-len(table_positions) // page_size))
+    page_number = st.number_input(f"페이지 (전체 {page_count}페이지, {len(table_positions)}건)",
+                                  min_value=1, max_value=page_count, value=1, step=1)
+    
     if display_columns:
         st.dataframe(
-            filtered_df[display_columns],
+            table_view.page(table_positions, int(page_number), page_size, display_columns),
             use_container_width=True,
             height=400
         )
     
-    # 데이터 다운로드
+    # 데이터 다운로드 (버튼을 눌렀을 때만 CSV 생성)
     st.subheader("💾 데이터 다운로드")
-    csv = filtered_df.to_csv(index=False, encoding='utf-8-sig')
-    st.download_button(
-        label="필터링된 데이터 CSV 다운로드",
-        data=csv,
-        file_name=f"filtered_jobs_{selected_location}_{selected_experience}.csv",
-        mime="text/csv"
-    )
+    download_key = (data_version, selected_location, selected_experience, selected_employment)
+    if st.button("필터링된 데이터 CSV 만들기"):
+        st.session_state['download_csv'] = (download_key, build_csv_bytes(filter_index.filter(
+            selected_location, selected_experience, selected_employment
+        )))
+    
+    prepared = st.session_state.get('download_csv')
+    if prepared and prepared[0] == download_key:
+        st.download_button(
+            label="필터링된 데이터 CSV 다운로드",
+            data=prepared[1],
+            file_name=f"filtered_jobs_{selected_location}_{selected_experience}.csv",
+            mime="text/csv"
+        )
     
     # 통계 요약
     st.markdown("---")
@@ -234,16 +412,16 @@ if df is not None:
     
     with col1:
         st.write("**지역별 통계:**")
-        location_stats = filtered_df['location'].value_counts()
+        location_stats = aggregates['location']
         for location, count in location_stats.head(5).items():
-            percentage = (count / len(filtered_df)) * 100
+            percentage = (count / aggregates['total']) * 100
             st.write(f"- {location}: {count}개 ({percentage:.1f}%)")
     
     with col2:
         st.write("**경력별 통계:**")
-        experience_stats = filtered_df['experience'].value_counts()
+        experience_stats = aggregates['experience']
         for experience, count in experience_stats.head(5).items():
-            percentage = (count / len(filtered_df)) * 100
+            percentage = (count / aggregates['total']) * 100
             st.write(f"- {experience}: {count}개 ({percentage:.1f}%)")
 
 else: